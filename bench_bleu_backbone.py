@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the BLEU Backbone Full Report
+
+Run with: python bench_bleu_backbone.py
+"""
+
+import os
+import random
+import tempfile
+import time
+import yaml
+import bleu_backbone
+from bleu_backbone import BleuBackbone, Product
+
+
+def _synthetic_report(products: int, seed: int = 7) -> BleuBackbone:
+    """Build a report with randomly valued products spread over all sectors"""
+    rnd = random.Random(seed)
+    report = BleuBackbone(_skip_init=True)
+    sectors = [report.get_sector_products(sector) for sector in report.sectors]
+    for i in range(products):
+        rnd.choice(sectors).append(
+            Product(f"Product {i}", "Synthetic signal", "Benchmark", rnd.uniform(100, 250), rnd.uniform(100, 1200))
+        )
+    report._update_metrics()
+    return report
+
+
+def _timed(label: str, func) -> float:
+    """Run a callable once and print elapsed milliseconds"""
+    start = time.perf_counter()
+    func()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  {label:<40} {elapsed:>10.1f} ms")
+    return elapsed
+
+
+def _legacy_from_dict(data):
+    """Load products the pre-schema way: one keyword-indexed constructor call per product"""
+    report = BleuBackbone(_skip_init=True)
+    for sector_id, products_data in data["sectors"].items():
+        report.get_sector_products(sector_id).extend(
+            Product(
+                p_data["name"],
+                p_data["signal"],
+                p_data["use_case"],
+                p_data["roi_percent"],
+                p_data["overscale_billions"]
+            )
+            for p_data in products_data
+        )
+    report.report_metadata.update(data["report_metadata"])
+    return report
+
+
+def bench_load(products: int = 300000) -> None:
+    """Compare from_dict throughput: legacy, eager schema-driven and lazy"""
+    data = _synthetic_report(products).to_dict()
+    print(f"LOAD ({products} products from a parsed dict)")
+    legacy = _timed("legacy per-product constructor", lambda: _legacy_from_dict(data))
+    eager = _timed("from_dict(lazy=False)", lambda: BleuBackbone.from_dict(data, lazy=False))
+    lazy = _timed("from_dict() (lazy sectors)", lambda: BleuBackbone.from_dict(data))
+    report = BleuBackbone.from_dict(data)
+    _timed("  then first page of summary table", lambda: list(report.iter_summary_lines(page=1)))
+    print(f"  throughput: legacy {products / legacy:.0f}, eager {products / eager:.0f}, "
+          f"lazy {products / lazy:.0f} products/ms")
+
+
+def bench_load_file(products: int = 20000) -> None:
+    """Compare YAML file loading with the pure Python and libyaml parsers"""
+    print(f"LOAD FILE ({products} products, YAML)")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "report.yaml")
+        _synthetic_report(products).save_to_file(path)
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        _timed("yaml.safe_load + legacy construction", lambda: _legacy_from_dict(yaml.safe_load(content)))
+        _timed(f"load_from_file ({bleu_backbone._YAML_LOADER.__name__})", lambda: BleuBackbone.load_from_file(path))
+
+
+def bench_analytics(products: int = 300000) -> None:
+    """Time the analytics queries on the available backend"""
+    report = _synthetic_report(products)
+    analytics = report.analytics
+    print(f"ANALYTICS ({products} products, backend: {analytics.backend})")
+    _timed("build columns", analytics._refresh)
+    _timed("group_by_sector", analytics.group_by_sector)
+    _timed("filter(roi > 200, overscale > 800)", lambda: analytics.filter(roi_above=200, overscale_above=800))
+    _timed("histogram(roi_percent, 50 bins)", lambda: analytics.histogram(bins=50))
+    _timed("weighted_roi", analytics.weighted_roi)
+
+
+def _word_report(products: int, vocabulary: int = 20000, seed: int = 11) -> BleuBackbone:
+    """Build a report whose product text is drawn from a synthetic vocabulary"""
+    rnd = random.Random(seed)
+    words = [f"w{i:05d}" for i in range(vocabulary)]
+    report = BleuBackbone(_skip_init=True)
+    sectors = [report.get_sector_products(sector) for sector in report.sectors]
+    for _ in range(products):
+        rnd.choice(sectors).append(Product(
+            " ".join(rnd.choices(words, k=3)), " ".join(rnd.choices(words, k=5)),
+            " ".join(rnd.choices(words, k=2)), rnd.uniform(100, 250), rnd.uniform(100, 1200)
+        ))
+    return report
+
+
+def bench_search(products: int = 1000000, queries: int = 1000) -> None:
+    """Time index construction and typical word, prefix and multi-word queries"""
+    print(f"SEARCH ({products} products)")
+    report = _word_report(products)
+    _timed("build index", lambda: report.search("w00000"))
+    
+    rnd = random.Random(5)
+    for label, make_query in [
+        ("single word", lambda: f"w{rnd.randrange(20000):05d}"),
+        ("word prefix (10 terms)", lambda: f"w{rnd.randrange(2000):04d}"),
+        ("two words", lambda: f"w{rnd.randrange(20000):05d} w{rnd.randrange(20000):05d}"),
+        ("word + prefix", lambda: f"w{rnd.randrange(20000):05d} w{rnd.randrange(200):03d}"),
+    ]:
+        batch = [make_query() for _ in range(queries)]
+        start = time.perf_counter()
+        for query in batch:
+            report.search(query, limit=10)
+        per_query = (time.perf_counter() - start) / queries * 1000
+        print(f"  {label:<40} {per_query:>10.3f} ms/query")
+
+
+def bench_portfolio(budgets: int = 1000) -> None:
+    """Time the first portfolio solve and repeated what-if budgets on the cached structures"""
+    for products, cap in [(28, None), (100, 2), (100000, None)]:
+        report = BleuBackbone() if products == 28 else _synthetic_report(products)
+        print(f"PORTFOLIO ({products} products, max per sector: {cap})")
+        result = {}
+        _timed("first solve (budget 3000)",
+               lambda: result.update(report.optimize_portfolio(3000, max_per_sector=cap)))
+        rnd = random.Random(9)
+        start = time.perf_counter()
+        for _ in range(budgets):
+            report.optimize_portfolio(rnd.uniform(0, 10000), max_per_sector=cap)
+        per_query = (time.perf_counter() - start) / budgets * 1000
+        print(f"  {'what-if budgets (' + result['method'] + ')':<40} {per_query:>10.3f} ms/query")
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("🔵 BLEU BACKBONE BENCHMARKS")
+    print("=" * 80)
+    bench_load()
+    print()
+    bench_load_file()
+    print()
+    bench_search()
+    print()
+    bench_analytics()
+    print()
+    bench_portfolio()
+    if bleu_backbone.np is not None:
+        print()
+        bleu_backbone.np = None
+        bench_analytics()
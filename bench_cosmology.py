@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Biblical Cosmology Integration System
+
+Run with: python bench_cosmology.py
+"""
+
+import json
+import os
+import tempfile
+import time
+import timeit
+import tracemalloc
+from cosmology_integration import BiblicalCosmologySystem, InvestorOutreachSystem, IntegratedCodexSystem, _cache_path
+
+
+def _timed(label: str, func) -> float:
+    """Run a callable once and print elapsed milliseconds"""
+    start = time.perf_counter()
+    func()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  {label:<45} {elapsed:>10.1f} ms")
+    return elapsed
+
+
+def _large_codex(path: str, entries: int) -> None:
+    """Write the shipped codex plus a large synthetic archive section"""
+    with open("biblical_cosmology_codex.json", 'r', encoding='utf-8') as f:
+        codex = json.load(f)
+    codex["archive"] = {
+        f"record_{i}": {"name": f"Record {i}", "device_mapping": "ev0l_coremod", "tags": ["a", "b", "c"]}
+        for i in range(entries)
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(codex, f, indent=2, ensure_ascii=False)
+
+
+def bench_load(entries: int = 200000) -> None:
+    """Compare eager loading with lazy loading for a command that reads one section"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "codex.json")
+        _large_codex(path, entries)
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"LOAD ({size_mb:.1f} MB codex, then get_heaven_level)")
+
+        _timed("eager json.load", lambda: BiblicalCosmologySystem(path, lazy=False).get_heaven_level(1))
+        _timed("first load (parses, writes the cache)", lambda: BiblicalCosmologySystem(path).get_heaven_level(1))
+        assert _cache_path(path).exists()
+        _timed("cached, then get_heaven_level", lambda: BiblicalCosmologySystem(path).get_heaven_level(1))
+        _timed("cached, then get_system_status", lambda: BiblicalCosmologySystem(path).get_system_status())
+        _timed("cached, every section", lambda: BiblicalCosmologySystem(path)._codex_dict())
+        os.utime(path)
+        _timed("touched (hash check, re-stamp)", lambda: BiblicalCosmologySystem(path).get_heaven_level(1))
+        _timed("cached after re-stamp", lambda: BiblicalCosmologySystem(path).get_heaven_level(1))
+
+
+def bench_outreach(number: int = 200) -> None:
+    """Compare outreach loading with and without the parse cache"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "outreach.json")
+        InvestorOutreachSystem("investor_outreach_system.json").export_to_json(path)
+        print(f"OUTREACH LOAD ({os.path.getsize(path) / 1e3:.0f} KB)")
+
+        def parse():
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        InvestorOutreachSystem(path)
+        for label, func in [("json.load", parse), ("InvestorOutreachSystem (cached)", lambda: InvestorOutreachSystem(path))]:
+            per_call = min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+            print(f"  {label:<45} {per_call:>10.1f} µs")
+
+
+def bench_deploy(entries: int = 5000) -> None:
+    """Compare per-file exports with the single-pass deploy pipeline"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "codex.json")
+        _large_codex(path, entries)
+        system = IntegratedCodexSystem(path, "investor_outreach_system.json")
+        print(f"DEPLOY (aws + github, {entries} synthetic codex records)")
+        
+        def exports():
+            for name, export in [("aws_cosmology.json", system.cosmology.export_to_json),
+                                 ("aws_outreach.json", system.outreach.export_to_json),
+                                 ("github_cosmology.yaml", system.cosmology.export_to_yaml),
+                                 ("github_cosmology.json", system.cosmology.export_to_json),
+                                 ("github_outreach.yaml", system.outreach.export_to_yaml),
+                                 ("github_outreach.json", system.outreach.export_to_json)]:
+                export(os.path.join(tmpdir, "exports", name))
+        os.mkdir(os.path.join(tmpdir, "exports"))
+        _timed("per-file exports", exports)
+        out = os.path.join(tmpdir, "deploy")
+        _timed("deploy (first run)", lambda: system.deploy(["aws", "github"], out))
+        _timed("deploy (unchanged, manifest)", lambda: system.deploy(["aws", "github"], out))
+        _timed("deploy (unchanged, force)", lambda: system.deploy(["aws", "github"], out, force=True))
+
+
+def bench_bundle(entries: int = 5000) -> None:
+    """Time tar.gz and zip bundles and their peak traced memory next to the data size"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "codex.json")
+        _large_codex(path, entries)
+        system = IntegratedCodexSystem(path, "investor_outreach_system.json")
+        system.cosmology._codex_dict()
+        print(f"BUNDLE (aws + github, {entries} synthetic codex records, {os.path.getsize(path) / 1e6:.1f} MB codex)")
+        for name, level in [("bundle.tar.gz", 1), ("bundle.tar.gz", 6), ("bundle.zip", 6)]:
+            bundle = lambda: system.bundle(os.path.join(tmpdir, name), compression_level=level)
+            # Tracing slows allocation-heavy code, so time and trace in separate runs
+            result = {}
+            _timed(f"{name} (level {level})", lambda: result.update(bundle()))
+            tracemalloc.start()
+            bundle()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  {'':<4}{result['bytes'] / 1e6:.2f} MB archive, peak traced memory {peak / 1e6:.1f} MB")
+
+
+def bench_status(number: int = 2000) -> None:
+    """Compare memoized full status calls with rebuilding the status every call"""
+    system = IntegratedCodexSystem()
+    print("FULL SYSTEM STATUS")
+    
+    def rebuild():
+        system.cosmology.generation += 1
+        return system.get_full_system_status()
+    for label, func in [("rebuilt every call", rebuild), ("memoized", system.get_full_system_status)]:
+        per_call = min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+        print(f"  {label:<45} {per_call:>10.1f} µs")
+    print(f"  {system.status_cache_info()}")
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("🌌 COSMOLOGY BENCHMARKS")
+    print("=" * 80)
+    bench_load()
+    print()
+    bench_outreach()
+    print()
+    bench_deploy()
+    print()
+    bench_bundle()
+    print()
+    bench_status()
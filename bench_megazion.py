@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the MEGAZION Inheritance Ledger
+
+Run with: python bench_megazion.py
+"""
+
+import time
+import timeit
+from megazion_ledger import MegazionLedger, SurpriseLoop
+
+
+def _eager_default_ledger() -> MegazionLedger:
+    """Build the default ledger the pre-template way"""
+    ledger = MegazionLedger(_skip_init=True)
+    ledger._initialize_default_ledger()
+    ledger._update_audit_hash()
+    return ledger
+
+
+def _report(label: str, func, number: int) -> float:
+    """Time a callable and print microseconds per call"""
+    per_call = min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+    print(f"  {label:<40} {per_call:>10.1f} µs")
+    return per_call
+
+
+def bench_startup(number: int = 200) -> None:
+    """Compare default ledger construction against the eager build"""
+    print("DEFAULT LEDGER STARTUP")
+    eager = _report("eager build + full hash", _eager_default_ledger, number)
+    template = _report("MegazionLedger() (template clone)", MegazionLedger, number)
+    _report("MegazionLedger() + first registry access",
+            lambda: MegazionLedger().healing_blessings, number)
+    print(f"  speedup: {eager / template:.0f}x")
+
+
+def bench_simulation(loops: int = 10000, stages: int = 6, iterations: int = 1000) -> None:
+    """Run the yield simulation over many synthetic loops"""
+    print(f"YIELD SIMULATION ({loops} loops x {stages} stages, {iterations} iterations)")
+    ledger = MegazionLedger(_skip_init=True)
+    for i in range(loops):
+        loop = SurpriseLoop(f"bench-loop-{i}", "benchmark")
+        for j in range(stages):
+            loop.add_cycle_stage(f"bench-stage-{i}-{j}")
+        ledger.surprise_loops.append(loop)
+    
+    start = time.perf_counter()
+    result = ledger.simulate_yields(iterations=iterations, tolerance=-1.0)
+    total = time.perf_counter() - start
+    print(f"  backend: {result['backend']}")
+    print(f"  simulation: {result['elapsed_seconds']:.2f} s, total incl. graph build: {total:.2f} s")
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("🔵 MEGAZION LEDGER BENCHMARKS")
+    print("=" * 80)
+    bench_startup()
+    print()
+    bench_simulation()
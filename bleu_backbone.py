@@ -7,17 +7,40 @@ A sovereign system for tracking high-yield ceremonial infrastructure products
 across 8 sectors of civilization-scale engineering and deployment.
 """
 
+import gc
+import heapq
 import json
+import math
+import re
 import yaml
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from hashlib import sha3_256
-from typing import Dict, List, Optional
+from itertools import accumulate, chain, islice, starmap
+from operator import attrgetter, itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
 import secrets
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; analytics fall back to pure Python
+    np = None
+
+
+# libyaml's parser when PyYAML was built with it; same safe schema, ~5x faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Product fields in serialization order
+PRODUCT_FIELDS = ("name", "signal", "use_case", "roi_percent", "overscale_billions")
+_NUMBER_TYPES = frozenset((int, float))
+
 
 class Product:
     """Represents a BLEU Backbone product with signal, use-case, and economic metrics"""
     
+    __slots__ = PRODUCT_FIELDS
+    
     def __init__(self, name: str, signal: str, use_case: str, roi_percent: float, overscale_billions: float):
         self.name = name
         self.signal = signal
@@ -38,6 +61,611 @@ class Product:
         return f"{self.name} | {self.signal} | {self.use_case} | {self.roi_percent}% ROI | ${self.overscale_billions}B"
 
 
+# Default sectors: sector ID → display name (order is the report order)
+DEFAULT_SECTORS: Dict[str, str] = {
+    "healing_medicine_biology": "🧬 Healing, Medicine & Biology",
+    "energy_agriculture_planet": "⚡ Energy, Agriculture & Planet Systems",
+    "defense_military_security": "🛡️ Defense, Military & Security",
+    "memory_legacy_knowledge": "🧠 Memory, Legacy & Knowledge",
+    "travel_expansion_mobility": "🚀 Travel, Expansion & Mobility",
+    "education_justice": "🏛️ Education & Justice",
+    "culture_sports_influence": "🎭 Culture, Sports & Influence",
+    "economy_commerce_finance": "💰 Economy, Commerce & Finance",
+}
+
+
+# Summary table columns: key → (header, width, alignment, cell formatter)
+SUMMARY_COLUMNS = {
+    "name": ("Product", 35, "<", lambda p: f"{p.name:<35}"),
+    "signal": ("Signal", 40, "<", lambda p: f"{p.signal:<40}"),
+    "use_case": ("Use-case", 25, "<", lambda p: f"{p.use_case:<25}"),
+    "roi": ("ROI %", 8, ">", lambda p: f"{p.roi_percent:>7.0f}%"),
+    "overscale": ("Overscale", 10, ">", lambda p: f"${p.overscale_billions:>8.0f}B"),
+}
+
+# Product fields kept in maintained sorted indexes and running statistics
+INDEXED_FIELDS = ("roi_percent", "overscale_billions")
+
+
+def _numeric_key(field: str):
+    """Key function reading a numeric product field, rejecting non-numeric values"""
+    def key(product: Product) -> float:
+        value = getattr(product, field, None)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Field '{field}' is not numeric on product '{product.name}'")
+        return value
+    return key
+
+
+class _SortedIndex:
+    """Products kept in ascending order of one field, ties in insertion order"""
+    
+    __slots__ = ("_key", "_keys", "_products")
+    
+    def __init__(self, field: str, products):
+        self._key = _numeric_key(field)
+        pairs = sorted(((self._key(p), p) for p in products), key=lambda pair: pair[0])
+        self._keys = [key for key, _ in pairs]
+        self._products = [product for _, product in pairs]
+    
+    def __len__(self) -> int:
+        return len(self._products)
+    
+    def insert(self, product: Product) -> None:
+        key = self._key(product)
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._products.insert(position, product)
+    
+    def smallest(self, limit: int) -> List[Product]:
+        return self._products[:limit]
+    
+    def largest(self, limit: int) -> List[Product]:
+        # Walk runs of equal keys from the top so ties keep insertion order
+        result = []
+        end = len(self._keys)
+        while end and len(result) < limit:
+            start = bisect_left(self._keys, self._keys[end - 1], 0, end)
+            result.extend(self._products[start:end])
+            end = start
+        return result[:limit]
+
+
+class _QuantileSketch:
+    """
+    Log-bucketed quantile sketch with bounded relative error.
+    
+    Values are counted in buckets whose bounds grow geometrically, so any
+    quantile is returned within `relative_accuracy` of a true sample value
+    regardless of how many values were added.
+    """
+    
+    __slots__ = ("_gamma", "_log_gamma", "_positive", "_negative", "_zeros")
+    
+    def __init__(self, relative_accuracy: float = 0.01):
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zeros = 0
+    
+    def add(self, value: float) -> None:
+        if value > 0:
+            bucket = math.ceil(math.log(value) / self._log_gamma)
+            self._positive[bucket] = self._positive.get(bucket, 0) + 1
+        elif value < 0:
+            bucket = math.ceil(math.log(-value) / self._log_gamma)
+            self._negative[bucket] = self._negative.get(bucket, 0) + 1
+        else:
+            self._zeros += 1
+    
+    def _bucket_value(self, bucket: int) -> float:
+        return 2 * self._gamma ** bucket / (self._gamma + 1)
+    
+    def quantile(self, q: float, count: int) -> float:
+        """Approximate q-quantile (0 <= q <= 1) of the `count` values added"""
+        rank = q * (count - 1)
+        seen = 0
+        for bucket in sorted(self._negative, reverse=True):
+            seen += self._negative[bucket]
+            if seen > rank:
+                return -self._bucket_value(bucket)
+        seen += self._zeros
+        if seen > rank:
+            return 0.0
+        for bucket in sorted(self._positive):
+            seen += self._positive[bucket]
+            if seen > rank:
+                return self._bucket_value(bucket)
+        return 0.0
+
+
+class _RunningStats:
+    """Count, sum, sum of squares, min, max and a quantile sketch, updated in O(1)"""
+    
+    __slots__ = ("count", "total", "total_sq", "minimum", "maximum", "sketch")
+    
+    def __init__(self, values=()):
+        self.count = 0
+        self.total = 0
+        self.total_sq = 0
+        self.minimum = None
+        self.maximum = None
+        self.sketch = _QuantileSketch()
+        for value in values:
+            self.add(value)
+    
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.total_sq += value * value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        self.sketch.add(value)
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    @property
+    def variance(self) -> float:
+        """Population variance"""
+        if not self.count:
+            return 0.0
+        return max(self.total_sq / self.count - self.mean ** 2, 0.0)
+    
+    def percentile(self, percent: float) -> float:
+        """Approximate percentile, clamped to the exact min and max"""
+        if not self.count:
+            return 0.0
+        value = self.sketch.quantile(percent / 100, self.count)
+        return min(max(value, self.minimum), self.maximum)
+
+
+class ProductAnalytics:
+    """
+    Columnar analytics over a report's products.
+    
+    ROI, overscale and a sector code are held as NumPy arrays when NumPy is
+    installed, or as plain lists otherwise. Columns are built on first use
+    and rebuilt whenever products or sectors have changed.
+    """
+    
+    FIELDS = INDEXED_FIELDS
+    
+    def __init__(self, report: 'BleuBackbone'):
+        self._report = report
+        self._signature = None
+        self._sectors: List[str] = []
+        self._products: List[Product] = []
+        self._columns: Dict[str, object] = {}
+        self._codes = None
+    
+    @property
+    def backend(self) -> str:
+        return "numpy" if np is not None else "python"
+    
+    def _refresh(self) -> None:
+        """Rebuild the columns if the report's products or sectors changed"""
+        report = self._report
+        signature = (np is not None, report._generation, report._product_count())
+        if signature == self._signature:
+            return
+        
+        self._sectors = list(report._sectors)
+        self._products = report.get_all_products()
+        codes = [code for code, products in enumerate(report._sectors.values()) for _ in products]
+        columns = {field: list(map(_numeric_key(field), self._products)) for field in self.FIELDS}
+        if np is not None:
+            codes = np.asarray(codes, dtype=np.intp)
+            columns = {field: np.asarray(values, dtype=float) for field, values in columns.items()}
+        self._codes = codes
+        self._columns = columns
+        self._signature = signature
+    
+    def _column(self, field: str):
+        if field not in self.FIELDS:
+            raise ValueError(f"Invalid field: {field}. Must be one of {list(self.FIELDS)}")
+        return self._columns[field]
+    
+    def _sector_code(self, sector: str) -> int:
+        self._report._sector_list(sector)
+        return self._sectors.index(sector)
+    
+    def _selection(self, sector: Optional[str]):
+        """Boolean mask (NumPy) or row indexes (Python) of the rows in a sector"""
+        if sector is None:
+            return None
+        code = self._sector_code(sector)
+        if np is not None:
+            return self._codes == code
+        return [row for row, row_code in enumerate(self._codes) if row_code == code]
+    
+    def group_by_sector(self) -> Dict[str, Dict]:
+        """Count, ROI mean/min/max, total overscale and weighted ROI per sector"""
+        self._refresh()
+        k = len(self._sectors)
+        roi, overscale = self._columns["roi_percent"], self._columns["overscale_billions"]
+        
+        if np is not None:
+            counts = np.bincount(self._codes, minlength=k)
+            roi_sum = np.bincount(self._codes, weights=roi, minlength=k)
+            overscale_sum = np.bincount(self._codes, weights=overscale, minlength=k)
+            weighted_sum = np.bincount(self._codes, weights=roi * overscale, minlength=k)
+            roi_min = np.full(k, np.inf)
+            roi_max = np.full(k, -np.inf)
+            np.minimum.at(roi_min, self._codes, roi)
+            np.maximum.at(roi_max, self._codes, roi)
+            counts, roi_sum, overscale_sum, weighted_sum, roi_min, roi_max = (
+                column.tolist() for column in (counts, roi_sum, overscale_sum, weighted_sum, roi_min, roi_max)
+            )
+        else:
+            counts, roi_sum, overscale_sum, weighted_sum = [0] * k, [0.0] * k, [0.0] * k, [0.0] * k
+            roi_min, roi_max = [math.inf] * k, [-math.inf] * k
+            for code, r, o in zip(self._codes, roi, overscale):
+                counts[code] += 1
+                roi_sum[code] += r
+                overscale_sum[code] += o
+                weighted_sum[code] += r * o
+                roi_min[code] = min(roi_min[code], r)
+                roi_max[code] = max(roi_max[code], r)
+        
+        groups = {}
+        for code, sector in enumerate(self._sectors):
+            count = counts[code]
+            groups[sector] = {
+                "count": count,
+                "mean_roi": roi_sum[code] / count if count else 0.0,
+                "min_roi": float(roi_min[code]) if count else 0.0,
+                "max_roi": float(roi_max[code]) if count else 0.0,
+                "total_overscale": float(overscale_sum[code]),
+                "weighted_roi": weighted_sum[code] / overscale_sum[code] if overscale_sum[code] else 0.0,
+            }
+        return groups
+    
+    def filter(self, roi_above: Optional[float] = None, overscale_above: Optional[float] = None,
+               sector: Optional[str] = None) -> List[Product]:
+        """Products with ROI > roi_above and overscale > overscale_above, in report order"""
+        self._refresh()
+        roi, overscale = self._columns["roi_percent"], self._columns["overscale_billions"]
+        
+        if np is not None:
+            mask = np.ones(len(self._products), dtype=bool)
+            if roi_above is not None:
+                mask &= roi > roi_above
+            if overscale_above is not None:
+                mask &= overscale > overscale_above
+            if sector is not None:
+                mask &= self._selection(sector)
+            return [self._products[row] for row in np.flatnonzero(mask).tolist()]
+        
+        rows = self._selection(sector) if sector is not None else range(len(self._products))
+        return [
+            self._products[row] for row in rows
+            if (roi_above is None or roi[row] > roi_above)
+            and (overscale_above is None or overscale[row] > overscale_above)
+        ]
+    
+    def histogram(self, field: str = "roi_percent", bins: int = 10, sector: Optional[str] = None) -> Dict:
+        """Equal-width histogram of a field, with the same bin edges as numpy.histogram"""
+        if bins < 1:
+            raise ValueError("bins must be at least 1")
+        self._refresh()
+        values = self._column(field)
+        selection = self._selection(sector)
+        
+        if np is not None:
+            if selection is not None:
+                values = values[selection]
+            counts, edges = np.histogram(values, bins=bins)
+            return {"field": field, "edges": edges.tolist(), "counts": counts.tolist()}
+        
+        if selection is not None:
+            values = [values[row] for row in selection]
+        lo, hi = (min(values), max(values)) if values else (0.0, 1.0)
+        if lo == hi:
+            lo, hi = lo - 0.5, hi + 0.5
+        step = (hi - lo) / bins
+        edges = [lo + i * step for i in range(bins)] + [hi]
+        counts = [0] * bins
+        for value in values:
+            i = min(int((value - lo) * bins / (hi - lo)), bins - 1)
+            # Correct for rounding exactly as numpy.histogram does
+            if value < edges[i]:
+                i -= 1
+            elif i != bins - 1 and value >= edges[i + 1]:
+                i += 1
+            counts[i] += 1
+        return {"field": field, "edges": [float(edge) for edge in edges], "counts": counts}
+    
+    def weighted_roi(self, sector: Optional[str] = None) -> float:
+        """ROI averaged with overscale as the weight"""
+        self._refresh()
+        roi, overscale = self._columns["roi_percent"], self._columns["overscale_billions"]
+        selection = self._selection(sector)
+        
+        if np is not None:
+            if selection is not None:
+                roi, overscale = roi[selection], overscale[selection]
+            total = float(overscale.sum())
+            return float(np.dot(roi, overscale)) / total if total else 0.0
+        
+        rows = selection if selection is not None else range(len(roi))
+        total = sum(overscale[row] for row in rows)
+        return sum(roi[row] * overscale[row] for row in rows) / total if total else 0.0
+
+
+# Searchable product text fields and their relevance weights
+SEARCH_FIELDS = {"name": 3.0, "use_case": 2.0, "signal": 1.0}
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Case-folded word tokens of a piece of text"""
+    return _TOKEN_RE.findall(text.casefold())
+
+
+class _SearchIndex:
+    """
+    Inverted index over product text with prefix matching.
+    
+    Each term maps to {document: weight}. Prefix lookups walk a sorted
+    vocabulary from a bisect position instead of a character trie, which
+    keeps memory at one string per distinct term. Terms new to the
+    vocabulary are collected and merged into it in one sort on the next
+    lookup, rather than inserted into the sorted list one at a time.
+    """
+    
+    __slots__ = ("_docs", "_postings", "_terms", "_new_terms")
+    
+    def __init__(self, sectors: Dict[str, List[Product]]):
+        self._docs: List[tuple] = []
+        self._postings: Dict[str, Dict[int, float]] = {}
+        for sector, products in sectors.items():
+            for product in products:
+                self._add(sector, product)
+        self._terms = sorted(self._postings)
+        self._new_terms: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self._docs)
+    
+    def _add(self, sector: str, product: Product) -> List[str]:
+        """Index a product, returning any terms new to the vocabulary"""
+        doc = len(self._docs)
+        self._docs.append((sector, product))
+        all_postings = self._postings
+        new_terms = []
+        for field, weight in SEARCH_FIELDS.items():
+            for term in _TOKEN_RE.findall(getattr(product, field).casefold()):
+                postings = all_postings.get(term)
+                if postings is None:
+                    postings = all_postings[term] = {doc: weight}
+                    new_terms.append(term)
+                elif doc in postings:
+                    postings[doc] += weight
+                else:
+                    postings[doc] = weight
+        return new_terms
+    
+    def insert(self, sector: str, product: Product) -> None:
+        self._new_terms.extend(self._add(sector, product))
+    
+    def _expand(self, token: str) -> List[str]:
+        """Vocabulary terms starting with a token, the exact term first if present"""
+        if self._new_terms:
+            # Two sorted runs: the sort merges them in linear time
+            self._new_terms.sort()
+            self._terms.extend(self._new_terms)
+            self._terms.sort()
+            self._new_terms = []
+        terms = self._terms
+        i = bisect_left(terms, token)
+        end = i
+        while end < len(terms) and terms[end].startswith(token):
+            end += 1
+        return terms[i:end]
+    
+    @staticmethod
+    def _term_score(token: str, term: str, weight: float) -> float:
+        # Whole-word matches count double a prefix match
+        return weight * 2 if term == token else weight
+    
+    def _token_scores(self, token: str, terms: List[str]) -> Dict[int, float]:
+        """Summed scores of every document matching a token's expanded terms"""
+        scores: Dict[int, float] = {}
+        for term in terms:
+            postings = self._postings[term]
+            if term == token:
+                postings = {doc: weight * 2 for doc, weight in postings.items()}
+            if not scores:
+                scores = dict(postings)
+                continue
+            # Documents rarely hold several expansions of one token, so merge
+            # with dict.update and only sum the shared documents by hand
+            shared = postings.keys() & scores.keys()
+            sums = {doc: scores[doc] + postings[doc] for doc in shared}
+            scores.update(postings)
+            scores.update(sums)
+        return scores
+    
+    def search(self, query: str, sector: Optional[str], limit: Optional[int]) -> List[tuple]:
+        """(score, doc) pairs of documents matching every query token, best first"""
+        tokens = list(dict.fromkeys(_tokenize(query)))
+        if not tokens:
+            return []
+        
+        expansions = {token: self._expand(token) for token in tokens}
+        sizes = {token: sum(len(self._postings[term]) for term in terms) for token, terms in expansions.items()}
+        tokens.sort(key=sizes.get)
+        
+        # Score the most selective token from its postings...
+        first = tokens[0]
+        scores = self._token_scores(first, expansions[first])
+        if sector is not None:
+            scores = {doc: score for doc, score in scores.items() if self._docs[doc][0] == sector}
+        
+        # ...then narrow by each remaining token, re-reading the few candidates'
+        # text when that is cheaper than merging the token's postings (which
+        # costs about 1/32 of re-tokenizing a candidate per posting)
+        for token in tokens[1:]:
+            if not scores:
+                break
+            if len(scores) * 32 < sizes[token]:
+                scores = self._score_candidates(token, scores)
+            else:
+                token_scores = self._token_scores(token, expansions[token])
+                scores = {doc: scores[doc] + token_scores[doc] for doc in token_scores.keys() & scores.keys()}
+        
+        # Only documents scoring at least the limit-th best score can place
+        if limit is not None and len(scores) > limit:
+            cutoff = heapq.nlargest(limit, scores.values())[-1]
+            scores = {doc: score for doc, score in scores.items() if score >= cutoff}
+        ranked = ((score, -doc) for doc, score in scores.items())
+        best = heapq.nlargest(limit, ranked) if limit is not None else sorted(ranked, reverse=True)
+        return [(score, -negative_doc) for score, negative_doc in best]
+    
+    def _score_candidates(self, token: str, scores: Dict[int, float]) -> Dict[int, float]:
+        """Keep candidates whose text contains the token, adding its score"""
+        narrowed = {}
+        for doc, score in scores.items():
+            product = self._docs[doc][1]
+            matched = 0.0
+            for field, weight in SEARCH_FIELDS.items():
+                for term in _tokenize(getattr(product, field)):
+                    if term.startswith(token):
+                        matched += self._term_score(token, term, weight)
+            if matched:
+                narrowed[doc] = score + matched
+        return narrowed
+    
+    def document(self, doc: int) -> tuple:
+        return self._docs[doc]
+
+
+_product_getter = itemgetter(*PRODUCT_FIELDS)
+_product_values_of = attrgetter(*PRODUCT_FIELDS)
+
+MERGE_STRATEGIES = ("theirs", "ours", "error")
+
+PORTFOLIO_METHODS = ("auto", "exact", "greedy")
+
+# Largest number of candidate portfolios an exact solve may compare before
+# "auto" falls back to the greedy solver
+PORTFOLIO_EXACT_LIMIT = 50000
+
+
+def _product_values(sector: str, records: List[Dict]) -> List[tuple]:
+    """Validate product records in one pass, returning their field values as tuples"""
+    try:
+        values = list(map(_product_getter, records))
+    except (KeyError, TypeError):
+        for i, record in enumerate(records):
+            if not isinstance(record, dict) or not all(field in record for field in PRODUCT_FIELDS):
+                raise ValueError(
+                    f"Sector '{sector}' product {i}: expected an object with fields {list(PRODUCT_FIELDS)}"
+                ) from None
+        raise
+    
+    # Check the numeric columns by their set of value types; only walk the
+    # records one by one to convert numeric strings or report the first offender
+    for column in (3, 4):
+        if not set(map(type, map(itemgetter(column), values))) <= _NUMBER_TYPES:
+            return [_coerce_numbers(sector, record) for record in values]
+    return values
+
+
+def _coerce_numbers(sector: str, record: tuple) -> tuple:
+    """Convert numeric-string roi_percent/overscale_billions values, as older report files may hold"""
+    name, signal, use_case, roi, overscale = record
+    numbers = []
+    for value in (roi, overscale):
+        if type(value) not in _NUMBER_TYPES:
+            try:
+                if not isinstance(value, str):
+                    raise ValueError(value)
+                value = float(value)
+            except ValueError:
+                raise ValueError(
+                    f"Sector '{sector}' product '{name}': roi_percent and overscale_billions must be numbers"
+                ) from None
+        numbers.append(value)
+    return (name, signal, use_case, *numbers)
+
+
+@contextmanager
+def _gc_paused():
+    """Suspend cyclic garbage collection while building many acyclic objects"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _pareto(states: List[tuple]) -> List[tuple]:
+    """Keep the (cost, value, picks) states no other state beats on both cost and value"""
+    states.sort(key=lambda state: (state[0], -state[1]))
+    frontier = []
+    for state in states:
+        if not frontier or state[1] > frontier[-1][1]:
+            frontier.append(state)
+    return frontier
+
+
+def _sector_frontier(items: List[tuple], cap: int, limit: int) -> Optional[List[tuple]]:
+    """
+    Pareto frontier of one sector's portfolios of at most `cap` items.
+    
+    Each item is (cost, value, pick); picks are chained as nested pairs so
+    extending a state is O(1). Returns None if the work would exceed `limit`.
+    """
+    layers = [[(0.0, 0.0, None)]] + [[] for _ in range(min(cap, len(items)))]
+    work = 0
+    for cost, value, pick in items:
+        for k in range(len(layers) - 1, 0, -1):
+            if not layers[k - 1]:
+                continue
+            work += len(layers[k - 1])
+            if work > limit:
+                return None
+            extended = [(c + cost, v + value, (picks, pick)) for c, v, picks in layers[k - 1]]
+            layers[k] = _pareto(layers[k] + extended)
+    return _pareto(list(chain.from_iterable(layers)))
+
+
+def _flatten_picks(picks) -> List:
+    """Unwind nested (picks, pick) pairs into a flat list of picks"""
+    flat, stack = [], [picks]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        if isinstance(node, tuple):
+            stack.extend(node)
+        else:
+            flat.append(node)
+    return flat
+
+
+def _sector(sector_id: str) -> property:
+    """Attribute view onto one sector's product list in the sector store"""
+    def getter(self) -> List[Product]:
+        return self._sector_list(sector_id)
+    
+    def setter(self, products: List[Product]) -> None:
+        self._sectors[sector_id] = products
+        self._raw_sectors.pop(sector_id, None)
+        self._invalidate_indexes()
+    
+    return property(getter, setter)
+
+
 class BleuBackbone:
     """
     The BLEU BACKBONE FULL REPORT™
@@ -46,25 +674,53 @@ class BleuBackbone:
     across 8 strategic sectors with high-yield product deployment.
     """
     
+    healing_medicine_biology = _sector("healing_medicine_biology")
+    energy_agriculture_planet = _sector("energy_agriculture_planet")
+    defense_military_security = _sector("defense_military_security")
+    memory_legacy_knowledge = _sector("memory_legacy_knowledge")
+    travel_expansion_mobility = _sector("travel_expansion_mobility")
+    education_justice = _sector("education_justice")
+    culture_sports_influence = _sector("culture_sports_influence")
+    economy_commerce_finance = _sector("economy_commerce_finance")
+    
     def __init__(self, treasurer: str = "Commander Bleu", _skip_init: bool = False):
         self.report_id = "BLEU-BACKBONE-FULL-REPORT"
         self.timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
         self.treasurer = treasurer
         self.version = "1.0.0"
         
-        # Core product registries by sector
-        self.healing_medicine_biology: List[Product] = []
-        self.energy_agriculture_planet: List[Product] = []
-        self.defense_military_security: List[Product] = []
-        self.memory_legacy_knowledge: List[Product] = []
-        self.travel_expansion_mobility: List[Product] = []
-        self.education_justice: List[Product] = []
-        self.culture_sports_influence: List[Product] = []
-        self.economy_commerce_finance: List[Product] = []
+        # Sector store: sector ID → product list, plus display names
+        self._sectors: Dict[str, List[Product]] = {sector_id: [] for sector_id in DEFAULT_SECTORS}
+        self._sector_names: Dict[str, str] = dict(DEFAULT_SECTORS)
+        
+        # Loaded sectors not yet turned into Products: sector ID → validated value tuples
+        self._raw_sectors: Dict[str, List[tuple]] = {}
+        
+        # Sorted ranking indexes and running statistics on INDEXED_FIELDS,
+        # built on first use and then updated by add_product
+        self._rank_indexes: Dict[str, _SortedIndex] = {}
+        self._sector_stats: Dict[str, Dict[str, _RunningStats]] = {}
+        self._total_stats: Dict[str, _RunningStats] = {}
+        self._analytics: Optional[ProductAnalytics] = None
+        self._search_index: Optional[_SearchIndex] = None
+        
+        # Memoized portfolio candidates and frontiers, keyed by sector caps
+        self._portfolio_cache: Dict[tuple, object] = {}
+        self._portfolio_signature: Optional[tuple] = None
+        
+        # Bumped by every write to products or sectors; derived caches are
+        # keyed on it, and the indexes add_product maintains record the
+        # generation they are current for
+        self._generation = 0
+        self._indexes_generation = 0
+        
+        # Nesting depth of batch() and whether metrics are owed at its end
+        self._batch_depth = 0
+        self._batch_dirty = False
         
         # Report metadata
         self.report_metadata = {
-            "total_sectors": 8,
+            "total_sectors": len(self._sectors),
             "total_products": 0,
             "total_roi_average": 0.0,
             "total_overscale_billions": 0.0,
@@ -173,102 +829,602 @@ class BleuBackbone:
             product = Product(name, signal, use_case, roi, overscale)
             self.economy_commerce_finance.append(product)
     
+    @property
+    def sectors(self) -> List[str]:
+        """Registered sector IDs in report order"""
+        return list(self._sectors)
+    
+    def register_sector(self, sector_id: str, display_name: Optional[str] = None) -> None:
+        """Register a new, empty sector at runtime"""
+        self._add_sector(sector_id, display_name)
+        self._update_metrics()
+    
+    def _add_sector(self, sector_id: str, display_name: Optional[str] = None) -> None:
+        """Add a sector to the store without refreshing metrics or the audit hash"""
+        if not isinstance(sector_id, str) or not sector_id.strip():
+            raise ValueError("Sector ID must be a non-empty string")
+        if sector_id in self._sectors:
+            raise ValueError(f"Sector already registered: {sector_id}")
+        
+        self._sectors[sector_id] = []
+        self._sector_names[sector_id] = display_name or sector_id.replace("_", " ").title()
+        if display_name:
+            self.report_metadata.setdefault("sector_names", {})[sector_id] = display_name
+        self.report_metadata["total_sectors"] = len(self._sectors)
+        self._changed(indexes_updated=True)
+    
+    def sector_display_name(self, sector: str) -> str:
+        """Human-readable name of a sector"""
+        self._sector_list(sector)
+        return self._sector_names[sector]
+    
+    def _sector_list(self, sector: str) -> List[Product]:
+        """Look up a sector's product list, rejecting unknown sectors"""
+        try:
+            products = self._sectors[sector]
+        except KeyError:
+            raise ValueError(f"Invalid sector: {sector}. Must be one of {list(self._sectors)}") from None
+        if sector in self._raw_sectors:
+            # Products hold no references to each other, but allocating them in
+            # bulk would trigger repeated full collections that find nothing
+            with _gc_paused():
+                products.extend(starmap(Product, self._raw_sectors.pop(sector)))
+        return products
+    
+    def _sector_length(self, sector: str) -> int:
+        """Number of products in a sector, without hydrating it"""
+        return len(self._sectors[sector]) + len(self._raw_sectors.get(sector, ()))
+    
+    def _hydrate_all(self) -> None:
+        """Turn every loaded sector's records into Products"""
+        for sector in list(self._raw_sectors):
+            self._sector_list(sector)
+    
     def add_product(self, sector: str, product: Product) -> None:
         """Add a product to a specific sector"""
-        sector_map = {
-            "healing_medicine_biology": self.healing_medicine_biology,
-            "energy_agriculture_planet": self.energy_agriculture_planet,
-            "defense_military_security": self.defense_military_security,
-            "memory_legacy_knowledge": self.memory_legacy_knowledge,
-            "travel_expansion_mobility": self.travel_expansion_mobility,
-            "education_justice": self.education_justice,
-            "culture_sports_influence": self.culture_sports_influence,
-            "economy_commerce_finance": self.economy_commerce_finance
-        }
+        products = self._sector_list(sector)
+        values = {field: _numeric_key(field)(product) for field in INDEXED_FIELDS}
+        products.append(product)
+        self._index_product(sector, product, values)
+        self._changed(indexes_updated=True)
+        self._update_metrics()
+    
+    def add_products(self, sector: str, products: Iterable[Product]) -> int:
+        """Add many products to a sector with a single metrics and audit hash update"""
+        self._sector_list(sector)
+        added = 0
+        with self.batch():
+            for product in products:
+                self.add_product(sector, product)
+                added += 1
+        return added
+    
+    @contextmanager
+    def batch(self):
+        """
+        Defer metrics and audit hash updates until the outermost batch exits.
         
-        if sector not in sector_map:
-            raise ValueError(f"Invalid sector: {sector}. Must be one of {list(sector_map.keys())}")
+        Ranking and search indexes are dropped on the first insert and
+        rebuilt on their next use, rather than updated product by product.
+        Metrics are brought up to date even if the block raises.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self._update_metrics()
+    
+    def _index_product(self, sector: str, product: Product, values: Dict[str, float]) -> None:
+        """Fold a newly added product into the built indexes and running statistics"""
+        if self._batch_depth:
+            self._rank_indexes.clear()
+            self._search_index = None
+        for index in self._rank_indexes.values():
+            index.insert(product)
+        if self._search_index is not None:
+            self._search_index.insert(sector, product)
+        for stats in (self._sector_stats.get(sector), self._total_stats):
+            if stats:
+                for field, value in values.items():
+                    stats[field].add(value)
+    
+    @staticmethod
+    def product_from_record(record: Dict) -> Product:
+        """
+        Validate a raw import record and build a Product.
         
-        sector_map[sector].append(product)
-        self._update_metrics()
+        Text fields must be non-empty strings; numeric fields may be numbers
+        or numeric strings (as in CSV input).
+        """
+        if not isinstance(record, dict):
+            raise ValueError(f"Record must be an object, got {type(record).__name__}")
+        
+        values = []
+        for field in ("name", "signal", "use_case"):
+            value = record.get(field)
+            if not isinstance(value, str) or not value.strip():
+                raise ValueError(f"Field '{field}' must be a non-empty string")
+            values.append(value.strip())
+        for field in INDEXED_FIELDS:
+            value = record.get(field)
+            if isinstance(value, bool):
+                raise ValueError(f"Field '{field}' must be a finite number")
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                number = math.nan
+            if not math.isfinite(number):
+                raise ValueError(f"Field '{field}' must be a finite number")
+            values.append(number)
+        return Product(*values)
+    
+    def iter_products(self) -> Iterator[Product]:
+        """Iterate over all products across all sectors without copying"""
+        self._hydrate_all()
+        return chain.from_iterable(self._sectors.values())
     
     def get_all_products(self) -> List[Product]:
         """Get all products across all sectors"""
-        return (
-            self.healing_medicine_biology +
-            self.energy_agriculture_planet +
-            self.defense_military_security +
-            self.memory_legacy_knowledge +
-            self.travel_expansion_mobility +
-            self.education_justice +
-            self.culture_sports_influence +
-            self.economy_commerce_finance
-        )
+        return list(self.iter_products())
     
     def get_sector_products(self, sector: str) -> List[Product]:
         """Get products from a specific sector"""
-        sector_map = {
-            "healing_medicine_biology": self.healing_medicine_biology,
-            "energy_agriculture_planet": self.energy_agriculture_planet,
-            "defense_military_security": self.defense_military_security,
-            "memory_legacy_knowledge": self.memory_legacy_knowledge,
-            "travel_expansion_mobility": self.travel_expansion_mobility,
-            "education_justice": self.education_justice,
-            "culture_sports_influence": self.culture_sports_influence,
-            "economy_commerce_finance": self.economy_commerce_finance
+        return self._sector_list(sector)
+    
+    def _invalidate_indexes(self) -> None:
+        """Drop derived indexes, statistics and analytics columns so they are rebuilt on next use"""
+        self._rank_indexes.clear()
+        self._sector_stats.clear()
+        self._total_stats = {}
+        self._search_index = None
+        self._portfolio_cache.clear()
+        if self._analytics is not None:
+            self._analytics._signature = None
+        self._changed()
+        self._indexes_generation = self._generation
+    
+    def _changed(self, indexes_updated: bool = False) -> None:
+        """Record a write to products or sectors; maintained indexes stay current only if updated with it"""
+        current = self._indexes_generation == self._generation
+        self._generation += 1
+        if indexes_updated and current:
+            self._indexes_generation = self._generation
+    
+    def _drop_stale_indexes(self) -> None:
+        """Drop maintained indexes and statistics that missed a write"""
+        if self._indexes_generation != self._generation:
+            self._rank_indexes.clear()
+            self._sector_stats.clear()
+            self._total_stats = {}
+            self._search_index = None
+            self._indexes_generation = self._generation
+    
+    def _sector_values(self, sector: str) -> List[tuple]:
+        """Field value tuples of a sector's products, read without hydrating loaded records"""
+        if not self._sectors[sector] and sector in self._raw_sectors:
+            return self._raw_sectors[sector]
+        return list(map(_product_values_of, self._sector_list(sector)))
+    
+    @staticmethod
+    def _keyed_values(values: List[tuple]) -> Dict[tuple, tuple]:
+        """Index value tuples by (name, occurrence) so repeated names stay distinct"""
+        seen: Dict[str, int] = {}
+        keyed = {}
+        for product_values in values:
+            name = product_values[0]
+            occurrence = seen.get(name, 0)
+            seen[name] = occurrence + 1
+            keyed[(name, occurrence)] = product_values
+        return keyed
+    
+    def _compare(self, other: 'BleuBackbone') -> Iterator[tuple]:
+        """Yield (sector, ours, theirs, added, removed, changed) keyed comparisons per sector"""
+        for sector in chain(self._sectors, (s for s in other._sectors if s not in self._sectors)):
+            ours = self._keyed_values(self._sector_values(sector)) if sector in self._sectors else {}
+            theirs = self._keyed_values(other._sector_values(sector)) if sector in other._sectors else {}
+            added = [key for key in theirs if key not in ours]
+            removed = [key for key in ours if key not in theirs]
+            changed = [key for key, values in ours.items() if key in theirs and theirs[key] != values]
+            yield sector, ours, theirs, added, removed, changed
+    
+    def diff(self, other: 'BleuBackbone') -> Dict:
+        """
+        Compare products with another report, sector by sector.
+        
+        Products are matched by name within a sector and compared by their
+        field values, so the diff is linear in the number of products.
+        Products of a sector present in only one report count as added or
+        removed.
+        """
+        result = {
+            "sectors_added": [sector for sector in other._sectors if sector not in self._sectors],
+            "sectors_removed": [sector for sector in self._sectors if sector not in other._sectors],
+            "added": {},
+            "removed": {},
+            "changed": {},
+            "summary": {"added": 0, "removed": 0, "changed": 0, "unchanged": 0},
         }
+        summary = result["summary"]
         
-        if sector not in sector_map:
-            raise ValueError(f"Invalid sector: {sector}")
+        for sector, ours, theirs, added, removed, changed in self._compare(other):
+            entries = {
+                "added": [dict(zip(PRODUCT_FIELDS, theirs[key])) for key in added],
+                "removed": [dict(zip(PRODUCT_FIELDS, ours[key])) for key in removed],
+                "changed": [{
+                    "name": key[0],
+                    "fields": {
+                        field: {"from": old, "to": new}
+                        for field, old, new in zip(PRODUCT_FIELDS, ours[key], theirs[key]) if old != new
+                    },
+                } for key in changed],
+            }
+            for kind, sector_entries in entries.items():
+                if sector_entries:
+                    result[kind][sector] = sector_entries
+                    summary[kind] += len(sector_entries)
+            summary["unchanged"] += len(ours) - len(removed) - len(changed)
+        return result
+    
+    def merge(self, other: 'BleuBackbone', strategy: str = "theirs") -> Dict:
+        """
+        Merge another report's products into this one in place.
+        
+        Products only in `other` are added (registering any new sectors) and
+        products only in this report are kept. Products that differ are
+        resolved by `strategy`: "theirs" takes the other report's version,
+        "ours" keeps this one, and "error" raises ValueError without
+        changing anything. Returns counts of products added and replaced.
+        """
+        if strategy not in MERGE_STRATEGIES:
+            raise ValueError(f"Invalid merge strategy: {strategy}. Must be one of {list(MERGE_STRATEGIES)}")
+        
+        comparisons = list(self._compare(other))
+        if strategy == "error":
+            conflicts = [f"{sector}/{key[0]}" for sector, _, _, _, _, changed in comparisons for key in changed]
+            if conflicts:
+                raise ValueError(f"Merge conflicts in {len(conflicts)} product(s): {', '.join(conflicts[:10])}")
         
-        return sector_map[sector]
+        applied = {"added": 0, "changed": 0}
+        sector_names = other.report_metadata.get("sector_names", {})
+        with self.batch():
+            for sector, ours, theirs, added, _, changed in comparisons:
+                if sector not in self._sectors:
+                    self.register_sector(sector, sector_names.get(sector))
+                applied["added"] += self.add_products(sector, (Product(*theirs[key]) for key in added))
+                
+                if strategy == "theirs" and changed:
+                    # Keyed values are in list order, so a key's position is its index
+                    products = self._sector_list(sector)
+                    positions = {key: i for i, key in enumerate(ours)}
+                    for key in changed:
+                        products[positions[key]] = Product(*theirs[key])
+                    applied["changed"] += len(changed)
+            
+            if applied["changed"]:
+                # Products were replaced in place, so derived indexes are stale
+                self._invalidate_indexes()
+                self._update_metrics()
+        return applied
+    
+    def search(self, query: str, sector: Optional[str] = None, limit: Optional[int] = 10) -> List[Dict]:
+        """
+        Search product names, signals and use-cases.
+        
+        Every query word must match a whole word or word prefix in the
+        product's text (case-insensitive). Results are ranked by relevance,
+        with name matches weighted highest, and ties keep report order.
+        """
+        if sector is not None:
+            self._sector_list(sector)
+        if limit is not None and limit <= 0:
+            return []
+        
+        self._drop_stale_indexes()
+        index = self._search_index
+        if index is None or len(index) != self._product_count():
+            self._hydrate_all()
+            index = self._search_index = _SearchIndex(self._sectors)
+        
+        results = []
+        for score, doc in index.search(query, sector, limit):
+            product_sector, product = index.document(doc)
+            results.append({"sector": product_sector, "score": score, "product": product})
+        return results
+    
+    @property
+    def analytics(self) -> ProductAnalytics:
+        """Columnar (NumPy when available) analytics over all products"""
+        if self._analytics is None:
+            self._analytics = ProductAnalytics(self)
+        return self._analytics
+    
+    def _stats(self, sector: Optional[str] = None) -> Dict[str, _RunningStats]:
+        """Running statistics for a sector (or all products), rebuilt if products changed outside add_product"""
+        self._drop_stale_indexes()
+        if sector is None:
+            stats = self._total_stats
+            if not stats or stats[INDEXED_FIELDS[0]].count != self._product_count():
+                products = self.get_all_products()
+                stats = self._total_stats = {
+                    field: _RunningStats(map(_numeric_key(field), products)) for field in INDEXED_FIELDS
+                }
+            return stats
+        
+        products = self._sector_list(sector)
+        stats = self._sector_stats.get(sector)
+        if stats is None or stats[INDEXED_FIELDS[0]].count != len(products):
+            stats = self._sector_stats[sector] = {
+                field: _RunningStats(map(_numeric_key(field), products)) for field in INDEXED_FIELDS
+            }
+        return stats
+    
+    def field_statistics(self, field: str = "roi_percent", sector: Optional[str] = None) -> Dict:
+        """
+        Summary statistics for a numeric field, per sector or across all products.
+        
+        Percentiles come from a sketch and are accurate to within 1% of a
+        true value.
+        """
+        if field not in INDEXED_FIELDS:
+            raise ValueError(f"Invalid field: {field}. Must be one of {list(INDEXED_FIELDS)}")
+        
+        stats = self._stats(sector)[field]
+        return {
+            "field": field,
+            "sector": sector,
+            "count": stats.count,
+            "sum": stats.total,
+            "mean": stats.mean,
+            "min": stats.minimum if stats.count else 0.0,
+            "max": stats.maximum if stats.count else 0.0,
+            "variance": stats.variance,
+            "stddev": math.sqrt(stats.variance),
+            "percentiles": {f"p{p}": stats.percentile(p) for p in (25, 50, 75, 90, 99)},
+        }
     
     def calculate_sector_metrics(self, sector: str) -> Dict:
         """Calculate metrics for a specific sector"""
-        products = self.get_sector_products(sector)
+        stats = self._stats(sector)
+        roi = stats["roi_percent"]
         
-        if not products:
+        if not roi.count:
             return {
                 "sector": sector,
                 "product_count": 0,
                 "average_roi": 0.0,
                 "total_overscale": 0.0,
                 "min_roi": 0.0,
-                "max_roi": 0.0
+                "max_roi": 0.0,
+                "roi_stddev": 0.0
             }
         
-        total_roi = sum(p.roi_percent for p in products)
-        total_overscale = sum(p.overscale_billions for p in products)
-        
         return {
             "sector": sector,
-            "product_count": len(products),
-            "average_roi": total_roi / len(products),
-            "total_overscale": total_overscale,
-            "min_roi": min(p.roi_percent for p in products),
-            "max_roi": max(p.roi_percent for p in products)
+            "product_count": roi.count,
+            "average_roi": roi.mean,
+            "total_overscale": stats["overscale_billions"].total,
+            "min_roi": roi.minimum,
+            "max_roi": roi.maximum,
+            "roi_stddev": math.sqrt(roi.variance)
         }
     
+    def rank(self, field: str = "roi_percent", limit: Optional[int] = 10,
+             descending: bool = True, sector: Optional[str] = None) -> List[Product]:
+        """
+        Rank products by any numeric field, globally or within one sector.
+        
+        Global rankings on INDEXED_FIELDS are read from a maintained sorted
+        index; everything else uses a heap selection. Equal values keep
+        their insertion order. A limit of None returns every product.
+        """
+        products = self._sector_list(sector) if sector is not None else None
+        total = len(products) if products is not None else self._product_count()
+        if limit is None or limit > total:
+            limit = total
+        if limit <= 0:
+            return []
+        
+        if products is None and field in INDEXED_FIELDS:
+            index = self._rank_index(field)
+            return index.largest(limit) if descending else index.smallest(limit)
+        
+        source = products if products is not None else self.iter_products()
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return select(limit, source, key=_numeric_key(field))
+    
+    def _product_count(self) -> int:
+        """Total number of products across all sectors"""
+        return sum(map(self._sector_length, self._sectors))
+    
+    def _rank_index(self, field: str) -> _SortedIndex:
+        """Sorted index for a field, rebuilt if products changed outside add_product"""
+        self._drop_stale_indexes()
+        index = self._rank_indexes.get(field)
+        if index is None or len(index) != self._product_count():
+            index = self._rank_indexes[field] = _SortedIndex(field, self.iter_products())
+        return index
+    
     def get_top_products_by_roi(self, limit: int = 10) -> List[Product]:
         """Get top products by ROI percentage"""
-        all_products = self.get_all_products()
-        return sorted(all_products, key=lambda p: p.roi_percent, reverse=True)[:limit]
+        return self.rank("roi_percent", limit)
     
     def get_top_products_by_overscale(self, limit: int = 10) -> List[Product]:
         """Get top products by overscale value"""
-        all_products = self.get_all_products()
-        return sorted(all_products, key=lambda p: p.overscale_billions, reverse=True)[:limit]
+        return self.rank("overscale_billions", limit)
+    
+    def optimize_portfolio(self, budget: float, max_per_sector: Optional[int] = None,
+                           sector_caps: Optional[Dict[str, int]] = None, method: str = "auto") -> Dict:
+        """
+        Choose products maximizing total ROI-weighted overscale within a budget.
+        
+        Each product costs its overscale (in billions) and returns
+        overscale × ROI / 100; only products with positive ROI and overscale
+        are candidates. At most `max_per_sector` products are taken from a
+        sector, overridden per sector by `sector_caps`.
+        
+        "exact" builds the Pareto frontier of cost against return once per
+        set of caps, so repeated queries with other budgets are a binary
+        search. "greedy" takes products by descending ROI and reports the
+        fractional upper bound. "auto" solves exactly unless that would
+        compare more than PORTFOLIO_EXACT_LIMIT candidate portfolios.
+        """
+        if method not in PORTFOLIO_METHODS:
+            raise ValueError(f"Invalid method: {method}. Must be one of {list(PORTFOLIO_METHODS)}")
+        if not budget >= 0:
+            raise ValueError("budget must be a non-negative number")
+        caps = self._portfolio_caps(max_per_sector, sector_caps)
+        
+        picks = None
+        if method != "greedy":
+            solved = self._portfolio_frontier(caps)
+            if solved is not None:
+                costs, frontier = solved
+                _, value, chained = frontier[bisect_right(costs, budget) - 1]
+                picks, bound = _flatten_picks(chained), value
+            elif method == "exact":
+                raise ValueError(
+                    f"Exact portfolio solve exceeds {PORTFOLIO_EXACT_LIMIT} candidates; use the greedy method"
+                )
+        if picks is None:
+            method = "greedy"
+            picks, bound = self._greedy_portfolio(budget, caps)
+        else:
+            method = "exact"
+        
+        rows = self._portfolio_items()[0]
+        picks.sort()
+        selected = [rows[pick] for pick in picks]
+        spent = math.fsum(product.overscale_billions for _, product in selected)
+        value = math.fsum(product.overscale_billions * product.roi_percent / 100 for _, product in selected)
+        return {
+            "method": method,
+            "budget": budget,
+            "spent": spent,
+            "value": value,
+            "roi_percent": value / spent * 100 if spent else 0.0,
+            "upper_bound": max(bound, value),
+            "products": [{"sector": sector, "product": product} for sector, product in selected],
+        }
+    
+    def _portfolio_caps(self, max_per_sector: Optional[int], sector_caps: Optional[Dict[str, int]]) -> tuple:
+        """Per-sector product caps in sector order, None meaning unlimited"""
+        caps = dict.fromkeys(self._sectors, max_per_sector)
+        for sector, cap in (sector_caps or {}).items():
+            self._sector_list(sector)
+            caps[sector] = cap
+        for sector, cap in caps.items():
+            if cap is not None and (not isinstance(cap, int) or cap < 0):
+                raise ValueError(f"Sector cap for '{sector}' must be a non-negative integer")
+        return tuple(caps.values())
+    
+    def _portfolio_cached(self, key: tuple, build):
+        """Memoized portfolio structure, dropped whenever the products change"""
+        # The count also catches products appended to a sector list directly
+        signature = (self._generation, self._product_count())
+        if signature != self._portfolio_signature:
+            self._portfolio_cache.clear()
+            self._portfolio_signature = signature
+        if key not in self._portfolio_cache:
+            self._portfolio_cache[key] = build()
+        return self._portfolio_cache[key]
+    
+    def _portfolio_items(self) -> tuple:
+        """Candidate rows as (sector, product) and per-sector (cost, value, row) items"""
+        def build():
+            rows, items = [], {}
+            for sector in self._sectors:
+                items[sector] = []
+                for product in self._sector_list(sector):
+                    if product.roi_percent > 0 and product.overscale_billions > 0:
+                        value = product.overscale_billions * product.roi_percent / 100
+                        items[sector].append((product.overscale_billions, value, len(rows)))
+                        rows.append((sector, product))
+            return rows, items
+        return self._portfolio_cached(("items",), build)
+    
+    def _portfolio_frontier(self, caps: tuple) -> Optional[tuple]:
+        """Costs and Pareto frontier of all capped portfolios, or None if too large to solve exactly"""
+        def build():
+            items = self._portfolio_items()[1]
+            frontier = [(0.0, 0.0, None)]
+            for sector, cap in zip(self._sectors, caps):
+                cap = len(items[sector]) if cap is None else cap
+                sector_frontier = self._portfolio_cached(
+                    ("sector", sector, cap),
+                    lambda: _sector_frontier(items[sector], cap, PORTFOLIO_EXACT_LIMIT)
+                )
+                if sector_frontier is None or len(frontier) * len(sector_frontier) > PORTFOLIO_EXACT_LIMIT:
+                    return None
+                if len(sector_frontier) > 1:
+                    frontier = _pareto([
+                        (c1 + c2, v1 + v2, (p1, p2))
+                        for c1, v1, p1 in frontier for c2, v2, p2 in sector_frontier
+                    ])
+            return [cost for cost, _, _ in frontier], frontier
+        return self._portfolio_cached(("frontier", caps), build)
+    
+    def _greedy_portfolio(self, budget: float, caps: tuple) -> tuple:
+        """Greedy picks by descending ROI, and the fractional upper bound on any capped portfolio"""
+        def build():
+            items = self._portfolio_items()[1]
+            ranked = sorted(
+                ((cost, value, row, sector) for sector, sector_items in items.items()
+                 for cost, value, row in sector_items),
+                key=lambda item: (-item[1] / item[0], item[2])
+            )
+            # Cheapest cost from each position on, to stop once nothing else fits
+            cheapest = list(accumulate(reversed([item[0] for item in ranked]), min))[::-1]
+            by_value = sorted(ranked, key=lambda item: (-item[1], item[2]))
+            return ranked, cheapest, by_value
+        ranked, cheapest, by_value = self._portfolio_cached(("greedy",), build)
+        caps = dict(zip(self._sectors, caps))
+        
+        picks, counts = [], dict.fromkeys(caps, 0)
+        remaining = bound_remaining = budget
+        value = bound = 0.0
+        for i, (cost, item_value, row, sector) in enumerate(ranked):
+            if bound_remaining <= 0 and remaining < cheapest[i]:
+                break
+            cap = caps[sector]
+            if cap == 0:
+                continue
+            if bound_remaining > 0:
+                take = min(1.0, bound_remaining / cost)
+                bound += item_value * take
+                bound_remaining -= cost * take
+            if cost <= remaining and (cap is None or counts[sector] < cap):
+                picks.append(row)
+                counts[sector] += 1
+                remaining -= cost
+                value += item_value
+        
+        # Greedy alone can be arbitrarily poor; the best affordable single product bounds it
+        for cost, item_value, row, sector in by_value:
+            if item_value <= value:
+                break
+            if cost <= budget and caps[sector] != 0:
+                picks = [row]
+                break
+        return picks, bound
     
     def _update_metrics(self) -> None:
         """Update report metadata metrics"""
-        all_products = self.get_all_products()
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        
+        stats = self._stats()
+        count = stats["roi_percent"].count
         
-        self.report_metadata["total_products"] = len(all_products)
+        self.report_metadata["total_sectors"] = len(self._sectors)
+        self.report_metadata["total_products"] = count
         
-        if all_products:
-            total_roi = sum(p.roi_percent for p in all_products)
-            self.report_metadata["total_roi_average"] = total_roi / len(all_products)
-            self.report_metadata["total_overscale_billions"] = sum(p.overscale_billions for p in all_products)
+        if count:
+            self.report_metadata["total_roi_average"] = stats["roi_percent"].mean
+            self.report_metadata["total_overscale_billions"] = stats["overscale_billions"].total
         else:
             self.report_metadata["total_roi_average"] = 0.0
             self.report_metadata["total_overscale_billions"] = 0.0
@@ -278,7 +1434,7 @@ class BleuBackbone:
     def _compute_report_hash(self) -> str:
         """Compute SHA3-256 hash of the full report"""
         report_dict = self.to_dict()
-        report_dict["report_metadata"]["audit_hash"] = ""
+        report_dict["report_metadata"] = dict(self.report_metadata, audit_hash="")
         report_data = json.dumps(report_dict, sort_keys=True)
         return sha3_256(report_data.encode()).hexdigest()
     
@@ -293,19 +1449,16 @@ class BleuBackbone:
             "timestamp": self.timestamp,
             "treasurer": self.treasurer,
             "version": self.version,
-            "sectors": {
-                "healing_medicine_biology": [p.to_dict() for p in self.healing_medicine_biology],
-                "energy_agriculture_planet": [p.to_dict() for p in self.energy_agriculture_planet],
-                "defense_military_security": [p.to_dict() for p in self.defense_military_security],
-                "memory_legacy_knowledge": [p.to_dict() for p in self.memory_legacy_knowledge],
-                "travel_expansion_mobility": [p.to_dict() for p in self.travel_expansion_mobility],
-                "education_justice": [p.to_dict() for p in self.education_justice],
-                "culture_sports_influence": [p.to_dict() for p in self.culture_sports_influence],
-                "economy_commerce_finance": [p.to_dict() for p in self.economy_commerce_finance]
-            },
+            "sectors": {sector_id: self._sector_dicts(sector_id) for sector_id in self._sectors},
             "report_metadata": self.report_metadata
         }
     
+    def _sector_dicts(self, sector: str) -> List[Dict]:
+        """Serialized products of a sector; loaded records are written without hydrating"""
+        products = [p.to_dict() for p in self._sectors[sector]]
+        products.extend(dict(zip(PRODUCT_FIELDS, values)) for values in self._raw_sectors.get(sector, ()))
+        return products
+    
     def to_yaml(self) -> str:
         """Export report to YAML format"""
         return yaml.dump(self.to_dict(), default_flow_style=False, sort_keys=False, allow_unicode=True)
@@ -330,7 +1483,7 @@ class BleuBackbone:
         with open(filename, 'r', encoding='utf-8') as f:
             content = f.read()
             if filename.endswith('.yaml') or filename.endswith('.yml'):
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=_YAML_LOADER)
             elif filename.endswith('.json'):
                 data = json.loads(content)
             else:
@@ -339,95 +1492,31 @@ class BleuBackbone:
             return cls.from_dict(data)
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'BleuBackbone':
-        """Create report from dictionary"""
+    def from_dict(cls, data: Dict, lazy: bool = True) -> 'BleuBackbone':
+        """
+        Create report from dictionary.
+        
+        Product records are validated in one pass per sector. With `lazy`,
+        each sector keeps its records as value tuples and builds Products
+        only when first accessed, so saving or summarizing an untouched
+        sector never constructs them.
+        """
         report = cls(treasurer=data.get("treasurer", "Commander Bleu"), _skip_init=True)
         report.report_id = data.get("report_id", report.report_id)
         report.timestamp = data.get("timestamp", report.timestamp)
         report.version = data.get("version", report.version)
         
-        # Load products from each sector
-        sectors_data = data.get("sectors", {})
-        
-        for p_data in sectors_data.get("healing_medicine_biology", []):
-            product = Product(
-                p_data["name"],
-                p_data["signal"],
-                p_data["use_case"],
-                p_data["roi_percent"],
-                p_data["overscale_billions"]
-            )
-            report.healing_medicine_biology.append(product)
-        
-        for p_data in sectors_data.get("energy_agriculture_planet", []):
-            product = Product(
-                p_data["name"],
-                p_data["signal"],
-                p_data["use_case"],
-                p_data["roi_percent"],
-                p_data["overscale_billions"]
-            )
-            report.energy_agriculture_planet.append(product)
-        
-        for p_data in sectors_data.get("defense_military_security", []):
-            product = Product(
-                p_data["name"],
-                p_data["signal"],
-                p_data["use_case"],
-                p_data["roi_percent"],
-                p_data["overscale_billions"]
-            )
-            report.defense_military_security.append(product)
-        
-        for p_data in sectors_data.get("memory_legacy_knowledge", []):
-            product = Product(
-                p_data["name"],
-                p_data["signal"],
-                p_data["use_case"],
-                p_data["roi_percent"],
-                p_data["overscale_billions"]
-            )
-            report.memory_legacy_knowledge.append(product)
-        
-        for p_data in sectors_data.get("travel_expansion_mobility", []):
-            product = Product(
-                p_data["name"],
-                p_data["signal"],
-                p_data["use_case"],
-                p_data["roi_percent"],
-                p_data["overscale_billions"]
-            )
-            report.travel_expansion_mobility.append(product)
-        
-        for p_data in sectors_data.get("education_justice", []):
-            product = Product(
-                p_data["name"],
-                p_data["signal"],
-                p_data["use_case"],
-                p_data["roi_percent"],
-                p_data["overscale_billions"]
-            )
-            report.education_justice.append(product)
-        
-        for p_data in sectors_data.get("culture_sports_influence", []):
-            product = Product(
-                p_data["name"],
-                p_data["signal"],
-                p_data["use_case"],
-                p_data["roi_percent"],
-                p_data["overscale_billions"]
-            )
-            report.culture_sports_influence.append(product)
-        
-        for p_data in sectors_data.get("economy_commerce_finance", []):
-            product = Product(
-                p_data["name"],
-                p_data["signal"],
-                p_data["use_case"],
-                p_data["roi_percent"],
-                p_data["overscale_billions"]
-            )
-            report.economy_commerce_finance.append(product)
+        # Load products from each sector, registering any non-default ones
+        sector_names = data.get("report_metadata", {}).get("sector_names", {})
+        for sector_id, products_data in data.get("sectors", {}).items():
+            if sector_id not in report._sectors:
+                report._add_sector(sector_id, sector_names.get(sector_id))
+            records = _product_values(sector_id, products_data or [])
+            if records:
+                report._raw_sectors[sector_id] = records
+                report._changed()
+        if not lazy:
+            report._hydrate_all()
         
         # Load metadata (preserving audit hash from file)
         if "report_metadata" in data:
@@ -439,49 +1528,84 @@ class BleuBackbone:
     
     def generate_summary_table(self) -> str:
         """Generate a formatted summary table of all products"""
-        lines = []
-        lines.append("=" * 100)
-        lines.append("🔵 BLEU BACKBONE FULL REPORT™")
-        lines.append("Ceremonial Economic and Strategic Product Registry")
-        lines.append("=" * 100)
-        lines.append("")
-        
-        sectors = [
-            ("🧬 Healing, Medicine & Biology", self.healing_medicine_biology),
-            ("⚡ Energy, Agriculture & Planet Systems", self.energy_agriculture_planet),
-            ("🛡️ Defense, Military & Security", self.defense_military_security),
-            ("🧠 Memory, Legacy & Knowledge", self.memory_legacy_knowledge),
-            ("🚀 Travel, Expansion & Mobility", self.travel_expansion_mobility),
-            ("🏛️ Education & Justice", self.education_justice),
-            ("🎭 Culture, Sports & Influence", self.culture_sports_influence),
-            ("💰 Economy, Commerce & Finance", self.economy_commerce_finance)
-        ]
+        return "\n".join(self.iter_summary_lines())
+    
+    def write_summary_table(self, stream: TextIO, columns: Optional[List[str]] = None,
+                            page: Optional[int] = None, page_size: int = 50) -> int:
+        """Stream the summary table to a text stream, returning the number of lines written"""
+        written = 0
+        for line in self.iter_summary_lines(columns, page, page_size):
+            stream.write(line)
+            stream.write("\n")
+            written += 1
+        return written
+    
+    def iter_summary_lines(self, columns: Optional[List[str]] = None,
+                           page: Optional[int] = None, page_size: int = 50) -> Iterator[str]:
+        """
+        Yield the summary table line by line.
         
-        for sector_name, products in sectors:
-            if products:
-                lines.append(f"{sector_name}")
-                lines.append("-" * 100)
-                lines.append(f"{'Product':<35} {'Signal':<40} {'Use-case':<25} {'ROI %':>8} {'Overscale':>10}")
-                lines.append("-" * 100)
-                
-                for product in products:
-                    lines.append(
-                        f"{product.name:<35} {product.signal:<40} {product.use_case:<25} "
-                        f"{product.roi_percent:>7.0f}% ${product.overscale_billions:>8.0f}B"
-                    )
-                
-                lines.append("")
-        
-        lines.append("=" * 100)
-        lines.append("REPORT SUMMARY")
-        lines.append("=" * 100)
-        lines.append(f"Total Products: {self.report_metadata['total_products']}")
-        lines.append(f"Average ROI: {self.report_metadata['total_roi_average']:.1f}%")
-        lines.append(f"Total Overscale: ${self.report_metadata['total_overscale_billions']:.0f}B")
-        lines.append(f"Audit Hash: {self.report_metadata['audit_hash'][:16]}...")
-        lines.append("=" * 100)
-        
-        return "\n".join(lines)
+        `columns` selects and orders SUMMARY_COLUMNS keys. With `page`
+        (1-based), only that page of `page_size` products is rendered; whole
+        sectors before the page are skipped by their length, so the first
+        line is produced without walking earlier products.
+        """
+        columns = list(columns) if columns else list(SUMMARY_COLUMNS)
+        unknown = [column for column in columns if column not in SUMMARY_COLUMNS]
+        if unknown:
+            raise ValueError(f"Invalid column(s): {', '.join(unknown)}. Must be among {list(SUMMARY_COLUMNS)}")
+        
+        total = self._product_count()
+        if page is None:
+            start, stop = 0, total
+        else:
+            if page_size < 1:
+                raise ValueError("Page size must be at least 1")
+            pages = max(1, -(-total // page_size))
+            if not 1 <= page <= pages:
+                raise ValueError(f"Page {page} out of range (1-{pages})")
+            start, stop = (page - 1) * page_size, min(page * page_size, total)
+        
+        specs = [SUMMARY_COLUMNS[column] for column in columns]
+        header = " ".join(f"{title:{align}{width}}" for title, width, align, _ in specs)
+        cells = [cell for _, _, _, cell in specs]
+        
+        yield "=" * 100
+        yield "🔵 BLEU BACKBONE FULL REPORT™"
+        yield "Ceremonial Economic and Strategic Product Registry"
+        yield "=" * 100
+        yield ""
+        
+        offset = 0
+        for sector_id in self._sectors:
+            if offset >= stop:
+                break
+            length = self._sector_length(sector_id)
+            first, last = max(start - offset, 0), min(stop - offset, length)
+            offset += length
+            if first >= last:
+                continue
+            
+            yield self._sector_names[sector_id]
+            yield "-" * 100
+            yield header
+            yield "-" * 100
+            for product in islice(self._sector_list(sector_id), first, last):
+                yield " ".join(cell(product) for cell in cells)
+            yield ""
+        
+        yield "=" * 100
+        yield "REPORT SUMMARY"
+        yield "=" * 100
+        if page is not None and total:
+            yield f"Page {page} of {pages} (products {start + 1}-{stop} of {total})"
+        elif page is not None:
+            yield "Page 1 of 1 (no products)"
+        yield f"Total Products: {self.report_metadata['total_products']}"
+        yield f"Average ROI: {self.report_metadata['total_roi_average']:.1f}%"
+        yield f"Total Overscale: ${self.report_metadata['total_overscale_billions']:.0f}B"
+        yield f"Audit Hash: {self.report_metadata['audit_hash'][:16]}..."
+        yield "=" * 100
     
     def __str__(self) -> str:
         """String representation of report"""
@@ -5,8 +5,11 @@ Command-line interface for managing BLEU Backbone Full Reports
 """
 
 import argparse
+import csv
+import json
 import sys
-from bleu_backbone import BleuBackbone, Product
+from itertools import chain
+from bleu_backbone import BleuBackbone, Product, DEFAULT_SECTORS, PORTFOLIO_METHODS, SUMMARY_COLUMNS
 
 
 def create_report(args):
@@ -23,8 +26,13 @@ def show_report(args):
     """Show report details"""
     report = BleuBackbone.load_from_file(args.report)
     
-    if args.verbose:
-        print(report.generate_summary_table())
+    if args.verbose or args.page is not None or args.columns:
+        columns = [column.strip() for column in args.columns.split(",")] if args.columns else None
+        try:
+            report.write_summary_table(sys.stdout, columns=columns, page=args.page, page_size=args.page_size)
+        except ValueError as e:
+            print(f"✗ Error: {e}")
+            return 1
     else:
         print(report)
         print()
@@ -44,12 +52,13 @@ def show_sector(args):
         metrics = report.calculate_sector_metrics(args.sector)
         
         print(f"=" * 80)
-        print(f"SECTOR: {args.sector.replace('_', ' ').title()}")
+        print(f"SECTOR: {report.sector_display_name(args.sector)}")
         print(f"=" * 80)
         print(f"Product Count: {metrics['product_count']}")
         print(f"Average ROI: {metrics['average_roi']:.1f}%")
         print(f"Total Overscale: ${metrics['total_overscale']:.0f}B")
         print(f"ROI Range: {metrics['min_roi']:.0f}% - {metrics['max_roi']:.0f}%")
+        print(f"ROI Std Dev: {metrics['roi_stddev']:.1f}%")
         print()
         
         if products:
@@ -81,6 +90,8 @@ def add_product(args):
     )
     
     try:
+        if args.new_sector:
+            report.register_sector(args.sector, args.sector_name)
         report.add_product(args.sector, product)
         report.save_to_file(args.report, format=args.format)
         print(f"✓ Added product '{args.name}' to sector '{args.sector}'")
@@ -94,12 +105,16 @@ def top_products(args):
     """Show top products by metric"""
     report = BleuBackbone.load_from_file(args.report)
     
-    if args.metric == "roi":
-        products = report.get_top_products_by_roi(args.limit)
-        title = f"TOP {args.limit} PRODUCTS BY ROI"
-    else:
-        products = report.get_top_products_by_overscale(args.limit)
-        title = f"TOP {args.limit} PRODUCTS BY OVERSCALE"
+    field = "roi_percent" if args.metric == "roi" else "overscale_billions"
+    try:
+        products = report.rank(field, args.limit, descending=not args.ascending, sector=args.sector)
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        return 1
+    
+    title = f"{'BOTTOM' if args.ascending else 'TOP'} {args.limit} PRODUCTS BY {args.metric.upper()}"
+    if args.sector:
+        title += f" IN {report.sector_display_name(args.sector)}"
     
     print("=" * 120)
     print(title)
@@ -114,6 +129,198 @@ def top_products(args):
         )
 
 
+def search_products(args):
+    """Search products by name, signal and use-case"""
+    report = BleuBackbone.load_from_file(args.report)
+    
+    try:
+        results = report.search(args.query, sector=args.sector, limit=args.limit)
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        return 1
+    
+    if not results:
+        print(f"No products match '{args.query}'")
+        return 1
+    
+    print("=" * 120)
+    print(f"SEARCH RESULTS FOR '{args.query}' ({len(results)} shown)")
+    print("=" * 120)
+    print(f"{'#':<4} {'Product':<35} {'Signal':<40} {'Sector':<28} {'Score':>6}")
+    print("-" * 120)
+    
+    for i, result in enumerate(results, 1):
+        product = result["product"]
+        print(f"{i:<4} {product.name:<35} {product.signal:<40} {result['sector']:<28} {result['score']:>6.1f}")
+
+
+def _iter_records(path, fmt):
+    """Stream (line number, record or error) pairs from a CSV or JSONL file"""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        if fmt == 'csv':
+            reader = csv.DictReader(f)
+            try:
+                reader.fieldnames
+            except csv.Error as e:
+                raise ValueError(f"Malformed CSV header in {path}: {e}")
+            
+            # A csv.Error only spoils the record being parsed; the reader resumes
+            # at the next line, so keep going unless it stops consuming input
+            failed_at = None
+            while True:
+                try:
+                    record = next(reader)
+                except StopIteration:
+                    return
+                except csv.Error as e:
+                    line_number = reader.reader.line_num
+                    if line_number == failed_at:
+                        raise ValueError(f"CSV reader cannot recover at {path}:{line_number}: {e}")
+                    failed_at = line_number
+                    yield line_number, ValueError(f"Malformed CSV row: {e}")
+                    continue
+                yield reader.line_num, record
+        
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as e:
+                yield line_number, ValueError(f"Malformed JSONL row: {e}")
+
+
+def import_products(args):
+    """Bulk import products from a CSV or JSONL file"""
+    report = BleuBackbone.load_from_file(args.report)
+    fmt = args.input_format or ('csv' if args.input.lower().endswith('.csv') else 'jsonl')
+    
+    if args.sector:
+        try:
+            report.get_sector_products(args.sector)
+        except ValueError as e:
+            print(f"✗ Error: {e}")
+            return 1
+    
+    imported = 0
+    errors = []
+    with report.batch():
+        for line_number, record in _iter_records(args.input, fmt):
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                sector = args.sector or (record.get("sector") if isinstance(record, dict) else None)
+                if not sector:
+                    raise ValueError("No sector given (use --sector or a 'sector' field)")
+                report.add_product(sector, BleuBackbone.product_from_record(record))
+                imported += 1
+            except ValueError as e:
+                if args.strict:
+                    print(f"✗ Error: {args.input}:{line_number}: {e}")
+                    print("  Nothing was saved")
+                    return 1
+                errors.append(f"{args.input}:{line_number}: {e}")
+    
+    output_format = 'json' if args.report.lower().endswith('.json') else 'yaml'
+    report.save_to_file(args.report, format=output_format)
+    print(f"✓ Imported {imported} products into {args.report}")
+    print(f"  Total products: {report.report_metadata['total_products']}")
+    if errors:
+        print(f"⚠ Skipped {len(errors)} invalid rows:")
+        for error in errors[:10]:
+            print(f"  {error}")
+        if len(errors) > 10:
+            print(f"  ... and {len(errors) - 10} more")
+
+
+def diff_reports(args):
+    """Show product differences between two reports"""
+    try:
+        base = BleuBackbone.load_from_file(args.base)
+        other = BleuBackbone.load_from_file(args.other)
+    except FileNotFoundError as e:
+        print(f"✗ Error: {e}")
+        return 2
+    
+    changes = base.diff(other)
+    summary = changes["summary"]
+    identical = not (summary["added"] or summary["removed"] or summary["changed"])
+    
+    if args.json:
+        print(json.dumps(changes, indent=2, ensure_ascii=False))
+        return 0 if identical else 1
+    
+    print("=" * 80)
+    print(f"DIFF {args.base} → {args.other}")
+    print("=" * 80)
+    for sector in changes["sectors_added"]:
+        print(f"+ sector {sector}")
+    for sector in changes["sectors_removed"]:
+        print(f"- sector {sector}")
+    
+    for sector in chain(base.sectors, changes["sectors_added"]):
+        if not any(sector in changes[kind] for kind in ("added", "removed", "changed")):
+            continue
+        print(f"\n{sector}:")
+        for product in changes["added"].get(sector, []):
+            print(f"  + {product['name']}")
+        for product in changes["removed"].get(sector, []):
+            print(f"  - {product['name']}")
+        for entry in changes["changed"].get(sector, []):
+            fields = ", ".join(f"{field}: {change['from']} → {change['to']}" for field, change in entry["fields"].items())
+            print(f"  ~ {entry['name']} ({fields})")
+    
+    print()
+    print(f"Added: {summary['added']}  Removed: {summary['removed']}  "
+          f"Changed: {summary['changed']}  Unchanged: {summary['unchanged']}")
+    return 0 if identical else 1
+
+
+def optimize_portfolio(args):
+    """Choose the products maximizing ROI-weighted overscale within a budget"""
+    report = BleuBackbone.load_from_file(args.report)
+    
+    try:
+        sector_caps = {}
+        for cap in args.cap:
+            sector, _, count = cap.partition("=")
+            if not count.isdigit():
+                raise ValueError(f"Invalid sector cap '{cap}': expected SECTOR=COUNT")
+            sector_caps[sector] = int(count)
+        portfolio = report.optimize_portfolio(
+            args.budget, max_per_sector=args.max_per_sector, sector_caps=sector_caps, method=args.method
+        )
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        return 1
+    
+    if args.json:
+        portfolio["products"] = [
+            {"sector": entry["sector"], **entry["product"].to_dict()} for entry in portfolio["products"]
+        ]
+        print(json.dumps(portfolio, indent=2, ensure_ascii=False))
+        return
+    
+    print("=" * 120)
+    print(f"PORTFOLIO FOR ${args.budget:.0f}B ({portfolio['method']} solve)")
+    print("=" * 120)
+    print(f"{'#':<4} {'Product':<35} {'Sector':<28} {'ROI %':>8} {'Overscale':>10} {'Return':>10}")
+    print("-" * 120)
+    
+    for i, entry in enumerate(portfolio["products"], 1):
+        product = entry["product"]
+        print(
+            f"{i:<4} {product.name:<35} {entry['sector']:<28} {product.roi_percent:>7.0f}% "
+            f"${product.overscale_billions:>8.0f}B ${product.overscale_billions * product.roi_percent / 100:>8.0f}B"
+        )
+    
+    print()
+    print(f"Spent: ${portfolio['spent']:.0f}B of ${portfolio['budget']:.0f}B")
+    print(f"ROI-weighted overscale: ${portfolio['value']:.1f}B (portfolio ROI {portfolio['roi_percent']:.1f}%)")
+    if portfolio["method"] == "greedy":
+        print(f"Upper bound: ${portfolio['upper_bound']:.1f}B")
+
+
 def export_report(args):
     """Export report to a different format"""
     report = BleuBackbone.load_from_file(args.report)
@@ -140,46 +347,32 @@ def main():
     show_parser = subparsers.add_parser('show', help='Show report details')
     show_parser.add_argument('report', help='Report file path')
     show_parser.add_argument('-v', '--verbose', action='store_true', help='Show full report details')
+    show_parser.add_argument('-p', '--page', type=int, help='Show only this page of the product table (1-based)')
+    show_parser.add_argument('--page-size', type=int, default=50, help='Products per page (default: 50)')
+    show_parser.add_argument('-c', '--columns',
+                             help=f"Comma-separated table columns ({', '.join(SUMMARY_COLUMNS)})")
     show_parser.set_defaults(func=show_report)
     
     # Show sector command
     sector_parser = subparsers.add_parser('show-sector', help='Show products in a specific sector')
     sector_parser.add_argument('report', help='Report file path')
-    sector_parser.add_argument('-s', '--sector', required=True, 
-                               choices=[
-                                   'healing_medicine_biology',
-                                   'energy_agriculture_planet',
-                                   'defense_military_security',
-                                   'memory_legacy_knowledge',
-                                   'travel_expansion_mobility',
-                                   'education_justice',
-                                   'culture_sports_influence',
-                                   'economy_commerce_finance'
-                               ],
-                               help='Sector name')
+    sector_parser.add_argument('-s', '--sector', required=True,
+                               help=f"Sector ID (defaults: {', '.join(DEFAULT_SECTORS)})")
     sector_parser.set_defaults(func=show_sector)
     
     # Add product command
     add_parser = subparsers.add_parser('add-product', help='Add a product to a sector')
     add_parser.add_argument('report', help='Report file path')
     add_parser.add_argument('-s', '--sector', required=True,
-                            choices=[
-                                'healing_medicine_biology',
-                                'energy_agriculture_planet',
-                                'defense_military_security',
-                                'memory_legacy_knowledge',
-                                'travel_expansion_mobility',
-                                'education_justice',
-                                'culture_sports_influence',
-                                'economy_commerce_finance'
-                            ],
-                            help='Sector name')
+                            help=f"Sector ID (defaults: {', '.join(DEFAULT_SECTORS)})")
     add_parser.add_argument('-n', '--name', required=True, help='Product name')
     add_parser.add_argument('-g', '--signal', required=True, help='Product signal/tagline')
     add_parser.add_argument('-u', '--use-case', required=True, help='Product use case')
     add_parser.add_argument('-r', '--roi', type=float, required=True, help='ROI percentage')
     add_parser.add_argument('-o', '--overscale', type=float, required=True, help='Overscale value in billions')
     add_parser.add_argument('-f', '--format', choices=['yaml', 'json'], default='yaml', help='Output format')
+    add_parser.add_argument('--new-sector', action='store_true', help='Register the sector before adding the product')
+    add_parser.add_argument('--sector-name', help='Display name for a new sector')
     add_parser.set_defaults(func=add_product)
     
     # Top products command
@@ -188,8 +381,47 @@ def main():
     top_parser.add_argument('-m', '--metric', choices=['roi', 'overscale'], default='roi', 
                            help='Metric to sort by')
     top_parser.add_argument('-l', '--limit', type=int, default=10, help='Number of products to show')
+    top_parser.add_argument('-s', '--sector', help='Only rank products in this sector')
+    top_parser.add_argument('-a', '--ascending', action='store_true', help='Show the lowest values first')
     top_parser.set_defaults(func=top_products)
     
+    # Search command
+    search_parser = subparsers.add_parser('search', help='Search products by name, signal and use-case')
+    search_parser.add_argument('report', help='Report file path')
+    search_parser.add_argument('query', help='Words or word prefixes to match (all must match)')
+    search_parser.add_argument('-s', '--sector', help='Only search this sector')
+    search_parser.add_argument('-l', '--limit', type=int, default=10, help='Maximum number of results')
+    search_parser.set_defaults(func=search_products)
+    
+    # Import command
+    import_parser = subparsers.add_parser('import', help='Bulk import products from CSV or JSONL')
+    import_parser.add_argument('report', help='Report file path')
+    import_parser.add_argument('input', help='CSV (with header) or JSONL file of products')
+    import_parser.add_argument('-s', '--sector', help="Sector for every row (otherwise each row's 'sector' field)")
+    import_parser.add_argument('-i', '--input-format', choices=['csv', 'jsonl'],
+                               help='Input format (default: from the file extension)')
+    import_parser.add_argument('--strict', action='store_true', help='Abort on the first invalid row')
+    import_parser.set_defaults(func=import_products)
+    
+    # Diff command
+    diff_parser = subparsers.add_parser('diff', help='Show product differences between two reports')
+    diff_parser.add_argument('base', help='Base report file path')
+    diff_parser.add_argument('other', help='Report file path to compare against the base')
+    diff_parser.add_argument('--json', action='store_true', help='Print the diff as JSON')
+    diff_parser.set_defaults(func=diff_reports)
+    
+    # Portfolio command
+    portfolio_parser = subparsers.add_parser('portfolio', help='Choose products maximizing ROI-weighted overscale')
+    portfolio_parser.add_argument('report', help='Report file path')
+    portfolio_parser.add_argument('-b', '--budget', type=float, required=True, help='Budget in billions')
+    portfolio_parser.add_argument('-m', '--max-per-sector', type=int, help='Maximum products from any one sector')
+    portfolio_parser.add_argument('--cap', action='append', default=[], metavar='SECTOR=COUNT',
+                                  help='Maximum products from one sector (repeatable)')
+    portfolio_parser.add_argument('--method', choices=PORTFOLIO_METHODS, default='auto',
+                                  help='Solver: exact frontier, greedy by ROI, or auto (default)')
+    portfolio_parser.add_argument('--json', action='store_true', help='Print the portfolio as JSON')
+    portfolio_parser.set_defaults(func=optimize_portfolio)
+    
     # Export command
     export_parser = subparsers.add_parser('export', help='Export report to a different format')
     export_parser.add_argument('report', help='Report file path')
@@ -6,16 +6,34 @@ CLI tool for managing Biblical Cosmology and Investor Outreach systems.
 import argparse
 import json
 import sys
+from pathlib import Path
 from cosmology_integration import (
+    BUNDLE_MANIFEST,
+    DEPLOYMENT_MANIFEST,
     BiblicalCosmologySystem,
     InvestorOutreachSystem,
-    IntegratedCodexSystem
+    IntegratedCodexSystem,
+    _bundle_format
 )
 
 
+def _load_cosmology(codex_file: str) -> BiblicalCosmologySystem:
+    """Load the codex for one cosmology subcommand; each CLI run loads it, and builds its index, once."""
+    return BiblicalCosmologySystem(codex_file)
+
+
+def _bundle_path(path: str) -> str:
+    """argparse type for --bundle: a path whose suffix names a supported archive format."""
+    try:
+        _bundle_format(path)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+    return path
+
+
 def cmd_cosmology_status(args):
     """Show cosmology system status."""
-    system = BiblicalCosmologySystem(args.cosmology_file)
+    system = _load_cosmology(args.cosmology_file)
     status = system.get_system_status()
     
     print("🌌 BIBLICAL COSMOLOGY SYSTEM STATUS")
@@ -24,13 +42,14 @@ def cmd_cosmology_status(args):
     print(f"Timestamp: {status['timestamp']}")
     print(f"Deployment Status: {status['deployment_status']}")
     print(f"Devices Updated: {status['devices_count']}")
+    print(f"Device Mappings: {status['mapped_entities']} entities → {status['mapped_devices']} devices")
     print(f"Health Stacks: {', '.join(status['health_stacks'])}")
     print("=" * 60)
 
 
 def cmd_cosmology_realms(args):
     """Show three realms information."""
-    system = BiblicalCosmologySystem(args.cosmology_file)
+    system = _load_cosmology(args.cosmology_file)
     
     print("🌌 THREE REALMS")
     print("=" * 60)
@@ -48,7 +67,7 @@ def cmd_cosmology_realms(args):
 
 def cmd_cosmology_heavens(args):
     """Show seven heavens information."""
-    system = BiblicalCosmologySystem(args.cosmology_file)
+    system = _load_cosmology(args.cosmology_file)
     
     print("🌌 SEVEN HEAVENS")
     print("=" * 60)
@@ -66,7 +85,7 @@ def cmd_cosmology_heavens(args):
 
 def cmd_cosmology_worlds(args):
     """Show four Kabbalistic worlds."""
-    system = BiblicalCosmologySystem(args.cosmology_file)
+    system = _load_cosmology(args.cosmology_file)
     
     print("🌌 FOUR KABBALISTIC WORLDS")
     print("=" * 60)
@@ -84,14 +103,37 @@ def cmd_cosmology_worlds(args):
     print("=" * 60)
 
 
+def cmd_cosmology_sefirot(args):
+    """Show the ten sefirot, or the one matching a name."""
+    system = _load_cosmology(args.cosmology_file)
+    names = [args.name] if args.name else [
+        "keter", "chokhmah", "binah", "chesed", "gevurah", "tiferet", "netzach", "hod", "yesod", "malkhut"
+    ]
+    
+    print("🌌 TEN SEFIROT")
+    print("=" * 60)
+    
+    for sefirah_name in names:
+        sefirah = system.get_sefirah(sefirah_name)
+        if sefirah:
+            print(f"\n{sefirah['name']} ({sefirah.get('hebrew', '')})")
+            print(f"  Attribute: {sefirah.get('attribute', '')}")
+            print(f"  Device Function: {sefirah.get('device_function', '')}")
+        elif args.name:
+            print(f"\nNo sefirah matches '{args.name}'")
+    
+    print("=" * 60)
+
+
 def cmd_cosmology_souls(args):
-    """Show five soul levels."""
-    system = BiblicalCosmologySystem(args.cosmology_file)
+    """Show five soul levels, or the one matching a name."""
+    system = _load_cosmology(args.cosmology_file)
+    names = [args.name] if args.name else ["nefesh", "ruach", "neshamah", "chayah", "yechidah"]
     
     print("🌌 FIVE SOUL LEVELS")
     print("=" * 60)
     
-    for level_name in ["nefesh", "ruach", "neshamah", "chayah", "yechidah"]:
+    for level_name in names:
         level = system.get_soul_level(level_name)
         if level:
             print(f"\n{level['name']} ({level.get('hebrew', '')})")
@@ -101,6 +143,8 @@ def cmd_cosmology_souls(args):
             print(f"  Functions:")
             for func in level.get('functions', []):
                 print(f"    • {func}")
+        elif args.name:
+            print(f"\nNo soul level matches '{args.name}'")
     
     print("=" * 60)
 
@@ -213,24 +257,38 @@ def cmd_integrated_status(args):
 def cmd_integrated_deploy(args):
     """Generate deployment packages."""
     system = IntegratedCodexSystem(args.cosmology_file, args.outreach_file)
+    targets = ["aws", "github"] if args.target == "all" else [args.target]
     
     print("🚀 GENERATING DEPLOYMENT PACKAGES")
     print("=" * 60)
     
-    if args.target in ["aws", "all"]:
-        print("\n📦 AWS Deployment Package:")
-        aws_files = system.generate_aws_deployment_package(args.output_dir)
-        for file_type, filepath in aws_files.items():
-            print(f"  ✓ {file_type}: {filepath}")
-    
-    if args.target in ["github", "all"]:
-        print("\n📦 GitHub Deployment Package:")
-        github_files = system.generate_github_deployment_package(args.output_dir)
-        for file_type, filepath in github_files.items():
-            print(f"  ✓ {file_type}: {filepath}")
-    
+    if args.bundle:
+        bundle = system.bundle(args.bundle, targets, compression_level=args.compression_level)
+        print(f"\n📦 Bundle ({bundle['format']}): {bundle['path']}")
+        for report in bundle["artifacts"]:
+            print(f"  ✓ {report['target']}/{report['artifact']}: {report['name']} "
+                  f"({report['bytes']} bytes, sha256 {report['sha256'][:12]}, serialize {report['serialize_ms']:.1f} ms)")
+        print("\n" + "=" * 60)
+        print(f"✅ Bundle written ({bundle['bytes']} bytes, manifest {BUNDLE_MANIFEST})")
+        return
+    
+    manifest = None if args.no_manifest else args.manifest
+    reports = system.deploy(targets, args.output_dir, max_workers=args.workers, force=args.force, manifest=manifest)
+    for target, label in [("aws", "AWS"), ("github", "GitHub")]:
+        if target not in targets:
+            continue
+        print(f"\n📦 {label} Deployment Package:")
+        for report in reports:
+            if report["target"] == target:
+                state = "written" if report["written"] else "unchanged"
+                print(f"  ✓ {report['artifact']}: {report['path']} "
+                      f"({state}, serialize {report['serialize_ms']:.1f} ms, write {report['write_ms']:.1f} ms)")
+    
+    written = sum(report["written"] for report in reports)
     print("\n" + "=" * 60)
-    print("✅ Deployment packages generated successfully")
+    print(f"✅ Deployment packages generated successfully ({written} written, {len(reports) - written} unchanged)")
+    if manifest is not None:
+        print(f"   Manifest: {Path(args.output_dir) / manifest}")
 
 
 def main():
@@ -260,7 +318,14 @@ def main():
     cosmology_sub.add_parser('realms', help='Show three realms').set_defaults(func=cmd_cosmology_realms)
     cosmology_sub.add_parser('heavens', help='Show seven heavens').set_defaults(func=cmd_cosmology_heavens)
     cosmology_sub.add_parser('worlds', help='Show four Kabbalistic worlds').set_defaults(func=cmd_cosmology_worlds)
-    cosmology_sub.add_parser('souls', help='Show five soul levels').set_defaults(func=cmd_cosmology_souls)
+    
+    sefirot_cmd = cosmology_sub.add_parser('sefirot', help='Show ten sefirot')
+    sefirot_cmd.add_argument('name', nargs='?', help='Key, name or Hebrew name of one sefirah')
+    sefirot_cmd.set_defaults(func=cmd_cosmology_sefirot)
+    
+    souls_cmd = cosmology_sub.add_parser('souls', help='Show five soul levels')
+    souls_cmd.add_argument('name', nargs='?', help='Key, name or Hebrew name of one soul level')
+    souls_cmd.set_defaults(func=cmd_cosmology_souls)
     
     # Outreach commands
     outreach = subparsers.add_parser('outreach', help='Investor outreach commands')
@@ -286,6 +351,18 @@ def main():
     deploy_cmd.add_argument('--target', choices=['aws', 'github', 'all'], default='all',
                            help='Deployment target')
     deploy_cmd.add_argument('--output-dir', default='.', help='Output directory')
+    deploy_cmd.add_argument('--workers', type=int, default=None, help='Threads writing artifacts')
+    deploy_cmd.add_argument('--force', action='store_true', help='Re-render every artifact, ignoring the manifest')
+    deploy_cmd.add_argument('--manifest', default=DEPLOYMENT_MANIFEST,
+                            help='Manifest of the last deploy, used to skip unchanged artifacts; relative to '
+                                 f'--output-dir unless absolute (default: {DEPLOYMENT_MANIFEST}). '
+                                 'Never included in --bundle archives, which carry their own manifest')
+    deploy_cmd.add_argument('--no-manifest', action='store_true',
+                            help='Do not read or write a deploy manifest; unchanged files are still not rewritten')
+    deploy_cmd.add_argument('--bundle', metavar='PATH', type=_bundle_path,
+                            help='Write a single .tar.gz/.tgz/.zip archive instead of loose files')
+    deploy_cmd.add_argument('--compression-level', type=int, default=6, choices=range(10), metavar='0-9',
+                            help='Bundle compression level (default: 6)')
     deploy_cmd.set_defaults(func=cmd_integrated_deploy)
     
     # Parse arguments
@@ -5,29 +5,398 @@ Manages the comprehensive mapping between spiritual cosmology and device systems
 plus investor outreach tracking and management.
 """
 
+import hashlib
+import io
 import json
+import marshal
+import mmap
+import os
+import re
+import shutil
+import struct
+import tarfile
+import tempfile
+import time
 import yaml
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import zipfile
+from bisect import bisect_left, bisect_right
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
 
 
+# Parse cache file layout: magic, header length, marshalled header, then
+# one marshalled blob per top-level section
+_CACHE_MAGIC = b"BLEUPARSE"
+_CACHE_VERSION = 1
+_HEADER_LENGTH = struct.Struct(">I")
+
+
+class _LazyCodex(MutableMapping):
+    """
+    Codex mapping whose top-level sections are decoded on first access.
+    
+    Sections not yet read are held by `load_section`, which decodes one
+    section by name; assigned sections replace the stored ones.
+    """
+    
+    def __init__(self, order: List[str], load_section: Callable[[str], Any],
+                 sections: Optional[Dict[str, Any]] = None):
+        self._order = list(order)
+        self._load_section = load_section
+        self._sections: Dict[str, Any] = dict(sections or {})
+        self._pending = set(self._order) - set(self._sections)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._pending:
+            self._sections[key] = self._load_section(key)
+            self._settle(key)
+        return self._sections[key]
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self:
+            self._order.append(key)
+        self._settle(key)
+        self._sections[key] = value
+    
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._settle(key)
+        self._sections.pop(key, None)
+        self._order.remove(key)
+    
+    def _settle(self, key: str) -> None:
+        """Mark a section as no longer pending, dropping the loader after the last one."""
+        self._pending.discard(key)
+        if not self._pending:
+            # Frees whatever the loader holds, such as a mapped cache file
+            self._load_section = None
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._sections or key in self._pending
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._order)
+    
+    def __len__(self) -> int:
+        return len(self._order)
+    
+    @property
+    def parsed_sections(self) -> List[str]:
+        """Names of the sections decoded or assigned so far"""
+        return [key for key in self._order if key not in self._pending]
+    
+    def to_dict(self) -> Dict:
+        """Plain dict of every section, decoding any not yet read"""
+        return {key: self[key] for key in self._order}
+
+
+def _cache_path(source: str) -> Path:
+    """Parse cache file stored next to a JSON source file"""
+    path = Path(source)
+    return path.with_name(f".{path.name}.cache")
+
+
+def _file_digest(path: str) -> str:
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_parse_cache(source: str, data: Dict, digest: Optional[str] = None,
+                       blobs: Optional[Dict[str, bytes]] = None) -> None:
+    """
+    Store the sections of a parsed JSON object next to its source file.
+    
+    Written to a temporary file and renamed into place, so readers never see
+    a partial cache. Skipped silently if the directory is not writable.
+    """
+    try:
+        stat = os.stat(source)
+        if blobs is None:
+            blobs = {key: marshal.dumps(value) for key, value in data.items()}
+        spans, offset = {}, 0
+        for key, blob in blobs.items():
+            spans[key] = (offset, len(blob))
+            offset += len(blob)
+        header = marshal.dumps({
+            "version": _CACHE_VERSION,
+            "marshal_version": marshal.version,
+            "path": os.path.abspath(source),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest or _file_digest(source),
+            "sections": spans,
+        })
+        
+        cache_path = _cache_path(source)
+        fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_CACHE_MAGIC + _HEADER_LENGTH.pack(len(header)) + header)
+                for blob in blobs.values():
+                    f.write(blob)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except (OSError, ValueError):
+        pass
+
+
+def _read_parse_cache(source: str) -> Optional[Tuple[List[str], Callable[[str], Any]]]:
+    """
+    Section names of a JSON source and a function decoding one section from
+    its parse cache, or None if the cache is missing, unreadable or stale.
+    
+    A cache matching the source's path, size and mtime is used as is. One
+    that differs only in those is checked against the content hash and, if
+    the content is unchanged, re-stamped instead of rebuilt.
+    
+    The cache is memory-mapped while sections remain to be decoded; the
+    mapping is closed once each section has been decoded, and before a
+    re-stamp replaces the file. Decode each section at most once.
+    """
+    mapping = None
+    
+    def close() -> None:
+        buffer.release()
+        mapping.close()
+    
+    try:
+        with open(_cache_path(source), 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(mapping)
+        prefix = len(_CACHE_MAGIC) + _HEADER_LENGTH.size
+        if bytes(buffer[:len(_CACHE_MAGIC)]) != _CACHE_MAGIC:
+            close()
+            return None
+        (header_length,) = _HEADER_LENGTH.unpack(buffer[len(_CACHE_MAGIC):prefix])
+        header = marshal.loads(buffer[prefix:prefix + header_length])
+        if (header["version"], header["marshal_version"]) != (_CACHE_VERSION, marshal.version):
+            close()
+            return None
+        
+        stat = os.stat(source)
+        spans = header["sections"]
+        base = prefix + header_length
+        blobs = None
+        if (header["path"], header["size"], header["mtime_ns"]) != (
+                os.path.abspath(source), stat.st_size, stat.st_mtime_ns):
+            if header["sha256"] != _file_digest(source):
+                close()
+                return None
+            # Copy the sections out so the file is not mapped while it is replaced
+            blobs = {key: bytes(buffer[base + offset:base + offset + length])
+                     for key, (offset, length) in spans.items()}
+            close()
+            _write_parse_cache(source, None, header["sha256"], blobs)
+    except (OSError, ValueError, EOFError, TypeError, KeyError, struct.error):
+        if mapping is not None and not mapping.closed:
+            close()
+        return None
+    
+    if blobs is not None:
+        return list(blobs), lambda key: marshal.loads(blobs[key])
+    
+    remaining = set(spans)
+    
+    def load_section(key: str) -> Any:
+        offset, length = spans[key]
+        value = marshal.loads(buffer[base + offset:base + offset + length])
+        remaining.discard(key)
+        if not remaining:
+            close()
+        return value
+    
+    return list(spans), load_section
+
+
+def _load_json_cached(source: str, lazy: bool = True) -> Any:
+    """
+    Load a JSON file through its parse cache.
+    
+    With lazy=True, JSON objects come back as a _LazyCodex whose sections
+    are decoded from the cache on first access; otherwise as a plain dict.
+    On a cache miss the file is parsed in full and the cache rebuilt. Other
+    JSON values are returned as parsed.
+    """
+    cached = _read_parse_cache(source)
+    if cached is not None:
+        order, load_section = cached
+        return _LazyCodex(order, load_section) if lazy else {key: load_section(key) for key in order}
+    
+    with open(source, 'rb') as f:
+        content = f.read()
+    data = json.loads(content.decode('utf-8'))
+    if not isinstance(data, dict):
+        return data
+    _write_parse_cache(source, data, hashlib.sha256(content).hexdigest())
+    return _LazyCodex(list(data), data.__getitem__, data) if lazy else data
+
+
+def _normalize_name(text: str) -> str:
+    """Lowercase words of a name joined by single spaces, ignoring punctuation"""
+    return " ".join(re.findall(r"\w+", text.lower()))
+
+
+class _LookupIndex:
+    """
+    Name lookups over (key, entry) pairs, built once per load.
+    
+    Exact matches on the entry key (with or without its number prefix), the
+    lowercase name with or without punctuation, each word of the name and
+    the Hebrew name resolve through a dict. Anything else is a substring
+    search over a sorted suffix list of the key, name and Hebrew name.
+    Ties resolve to the earliest entry.
+    """
+    
+    def __init__(self, entries: Iterable[Tuple[str, Dict]]):
+        self._entries: List[Dict] = []
+        self._exact: Dict[str, int] = {}
+        self._resolved: Dict[str, Optional[int]] = {}
+        suffixes = []
+        for ordinal, (key, value) in enumerate(entries):
+            self._entries.append(value)
+            key = key.lower()
+            name = str(value.get("name", "")).lower()
+            hebrew = str(value.get("hebrew", ""))
+            words = re.findall(r"\w+", name)
+            for term in [key, key.partition("_")[2], name, " ".join(words), *words, hebrew]:
+                if term:
+                    self._exact.setdefault(term, ordinal)
+            for term in (key, name, hebrew):
+                suffixes.extend((term[i:], ordinal) for i in range(len(term)))
+        suffixes.sort()
+        self._suffixes = [suffix for suffix, _ in suffixes]
+        self._ordinals = [ordinal for _, ordinal in suffixes]
+    
+    def find(self, query: str) -> Optional[Dict]:
+        """Entry matching the query exactly, else the first entry containing it"""
+        query = query.lower()
+        ordinal = self._exact.get(query, self._exact.get(_normalize_name(query)))
+        if ordinal is None:
+            if query not in self._resolved:
+                start = bisect_left(self._suffixes, query)
+                end = bisect_left(self._suffixes, query + "\U0010ffff", start)
+                self._resolved[query] = min(self._ordinals[start:end], default=None)
+            ordinal = self._resolved[query]
+        return None if ordinal is None else self._entries[ordinal]
+
+
+class _DeviceIndex:
+    """Entity ⇄ device mappings with case-insensitive lookups in both directions."""
+    
+    def __init__(self, pairs: Iterable[Tuple[str, str]]):
+        self.mappings: Dict[str, List[str]] = {}
+        self._devices: Dict[str, List[str]] = {}
+        self._entities: Dict[str, List[str]] = {}
+        for entity, device in pairs:
+            self.mappings.setdefault(entity, []).append(device)
+            self._devices.setdefault(entity.casefold(), []).append(device)
+            self._entities.setdefault(device.casefold(), []).append(entity)
+    
+    @property
+    def device_count(self) -> int:
+        return len(self._entities)
+    
+    def devices_for(self, entity: str) -> List[str]:
+        return list(self._devices.get(entity.casefold(), ()))
+    
+    def entities_for(self, device: str) -> List[str]:
+        """Entities mapped to a device, else to every device whose name contains it"""
+        query = device.casefold()
+        if query in self._entities:
+            return list(self._entities[query])
+        return [entity for name, entities in self._entities.items() if query in name for entity in entities]
+
+
 class BiblicalCosmologySystem:
     """Manages Biblical Cosmology integration with device systems."""
     
-    def __init__(self, codex_file: str = "biblical_cosmology_codex.json"):
-        """Initialize the cosmology system."""
+    # Sections whose entries map to devices: (section, entries key). Entries
+    # directly under the section are named by their key, nested ones by "name".
+    DEVICE_MAPPING_SECTIONS = (("three_realms", None), ("seven_heavens", "levels"), ("five_soul_levels", "levels"))
+    
+    def __init__(self, codex_file: str = "biblical_cosmology_codex.json", lazy: bool = True):
+        """
+        Initialize the cosmology system.
+        
+        With lazy=True, the codex is loaded through a parse cache stored
+        next to it, and each top-level section is decoded only when it is
+        first accessed. lazy=False parses the JSON file in full.
+        """
         self.codex_file = codex_file
+        self.lazy = lazy
         self.codex_data = self._load_codex()
+        # Bumped on every change made through this class, for caches kept by callers
+        self.generation = 0
+        self._reset_indexes()
+    
+    def _reset_indexes(self) -> None:
+        """Drop the derived indexes so they are rebuilt on next use; call after editing sections in place."""
+        self._indexes: Dict[str, Tuple[tuple, Any]] = {}
+        self.generation += 1
+    
+    def _index(self, name: str, sections: Tuple[str, ...], build: Callable[[], Any]) -> Any:
+        """Derived index over codex sections, built on first use and rebuilt when a section is replaced."""
+        sources = tuple(map(self.codex_data.get, sections))
+        cached = self._indexes.get(name)
+        if cached is None or any(old is not new for old, new in zip(cached[0], sources)):
+            cached = self._indexes[name] = (sources, build())
+        return cached[1]
+    
+    def update_section(self, section: str, value: Any) -> None:
+        """Replace a top-level codex section; indexes over it are rebuilt on next use."""
+        self.codex_data[section] = value
+        self.generation += 1
+    
+    def _lookup(self, section: str, entries: str, query: str) -> Optional[Dict]:
+        """Find an entry of a codex section through its lookup index."""
+        index = self._index(
+            f"lookup:{section}", (section,),
+            lambda: _LookupIndex(self.codex_data.get(section, {}).get(entries, {}).items())
+        )
+        return index.find(query)
+    
+    def _device_index(self) -> _DeviceIndex:
+        """Bidirectional entity ⇄ device index over DEVICE_MAPPING_SECTIONS."""
+        def pairs() -> Iterator[Tuple[str, str]]:
+            for section, entries_key in self.DEVICE_MAPPING_SECTIONS:
+                entries = self.codex_data.get(section, {})
+                if entries_key is not None:
+                    entries = entries.get(entries_key, {})
+                for key, entry in entries.items():
+                    device = entry.get("device_mapping", "")
+                    if device:
+                        yield (key if entries_key is None else entry.get("name", "")), device
+        
+        sections = tuple(section for section, _ in self.DEVICE_MAPPING_SECTIONS)
+        return self._index("devices", sections, lambda: _DeviceIndex(pairs()))
     
     def _load_codex(self) -> Dict:
         """Load the cosmology codex from JSON file."""
         try:
+            if self.lazy:
+                return _load_json_cached(self.codex_file)
             with open(self.codex_file, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except FileNotFoundError:
             return self._create_default_codex()
     
+    def _codex_dict(self) -> Dict:
+        """The whole codex as a plain dict, parsing any sections not yet read."""
+        if isinstance(self.codex_data, _LazyCodex):
+            return self.codex_data.to_dict()
+        return self.codex_data
+    
     def _create_default_codex(self) -> Dict:
         """Create default codex structure."""
         return {
@@ -63,46 +432,24 @@ class BiblicalCosmologySystem:
         return self.codex_data.get("four_kabbalistic_worlds", {}).get("worlds", {}).get(world_name.lower())
     
     def get_sefirah(self, sefirah_name: str) -> Optional[Dict]:
-        """Get information about a specific sefirah."""
-        emanations = self.codex_data.get("sefirot_dimensions", {}).get("emanations", {})
-        for key, value in emanations.items():
-            if sefirah_name.lower() in key or sefirah_name.lower() in value.get("name", "").lower():
-                return value
-        return None
+        """Get information about a specific sefirah by key, name or Hebrew name."""
+        return self._lookup("sefirot_dimensions", "emanations", sefirah_name)
     
     def get_soul_level(self, level_name: str) -> Optional[Dict]:
-        """Get information about a specific soul level."""
-        levels = self.codex_data.get("five_soul_levels", {}).get("levels", {})
-        for key, value in levels.items():
-            if level_name.lower() in key or level_name.lower() in value.get("name", "").lower():
-                return value
-        return None
+        """Get information about a specific soul level by key, name or Hebrew name."""
+        return self._lookup("five_soul_levels", "levels", level_name)
     
     def get_device_mappings(self) -> Dict[str, List[str]]:
-        """Get all device mappings across the cosmology."""
-        mappings = {}
-        
-        # Three Realms
-        for realm_name, realm_data in self.codex_data.get("three_realms", {}).items():
-            device = realm_data.get("device_mapping", "")
-            if device:
-                mappings[realm_name] = [device]
-        
-        # Seven Heavens
-        for level_data in self.codex_data.get("seven_heavens", {}).get("levels", {}).values():
-            name = level_data.get("name", "")
-            device = level_data.get("device_mapping", "")
-            if device:
-                mappings[name] = [device]
-        
-        # Soul Levels
-        for level_data in self.codex_data.get("five_soul_levels", {}).get("levels", {}).values():
-            name = level_data.get("name", "")
-            device = level_data.get("device_mapping", "")
-            if device:
-                mappings[name] = [device]
-        
-        return mappings
+        """Get all device mappings across the cosmology, keeping every device of a repeated name."""
+        return {entity: list(devices) for entity, devices in self._device_index().mappings.items()}
+    
+    def devices_for(self, entity: str) -> List[str]:
+        """Devices mapped to a realm key, heaven name or soul level name (case-insensitive)."""
+        return self._device_index().devices_for(entity)
+    
+    def entities_for(self, device: str) -> List[str]:
+        """Cosmology entities mapped to a device, or to any device whose name contains it."""
+        return self._device_index().entities_for(device)
     
     def get_health_stacks(self) -> Dict:
         """Get all health stack protocols."""
@@ -110,38 +457,216 @@ class BiblicalCosmologySystem:
     
     def get_system_status(self) -> Dict:
         """Get overall system integration status."""
+        devices = self._device_index()
         return {
             "status": self.codex_data.get("status", "UNKNOWN"),
             "timestamp": self.codex_data.get("timestamp"),
             "deployment_status": self.codex_data.get("system_integration", {}).get("deployment_status"),
             "devices_count": len(self.codex_data.get("system_integration", {}).get("devices_updated", [])),
-            "health_stacks": list(self.codex_data.get("health_stacks", {}).keys())
+            "health_stacks": list(self.codex_data.get("health_stacks", {}).keys()),
+            "mapped_entities": len(devices.mappings),
+            "mapped_devices": devices.device_count
         }
     
     def export_to_yaml(self, output_file: str) -> None:
         """Export codex to YAML format."""
         with open(output_file, 'w', encoding='utf-8') as f:
-            yaml.dump(self.codex_data, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(self._codex_dict(), f, default_flow_style=False, allow_unicode=True)
     
     def export_to_json(self, output_file: str, indent: int = 2) -> None:
         """Export codex to JSON format."""
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.codex_data, f, indent=indent, ensure_ascii=False)
+            json.dump(self._codex_dict(), f, indent=indent, ensure_ascii=False)
+
+
+@contextmanager
+def _atomic_file(path: Any) -> Iterator[BinaryIO]:
+    """Binary file that replaces `path` on success, keeping the existing file mode; removed on error."""
+    path = Path(path)
+    mode = os.stat(path).st_mode & 0o777 if path.exists() else 0o644
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _write_atomic(path: Any, data: bytes) -> None:
+    """Write a file via a temporary file renamed into place, keeping the existing file mode."""
+    with _atomic_file(path) as f:
+        f.write(data)
+
+
+def _naive_utc(moment: datetime) -> datetime:
+    """Naive UTC form of a datetime; naive ones are taken to be UTC already"""
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Naive UTC datetime from an ISO timestamp with an optional trailing Z or offset"""
+    return _naive_utc(datetime.fromisoformat(timestamp[:-1] if timestamp.endswith("Z") else timestamp))
+
+
+class InvestorEventLog:
+    """
+    Append-only JSON-lines log of investor stage changes.
+    
+    Each line records the investor, old stage, new stage and UTC timestamp.
+    A time index (per stage and overall) is built from the log on first
+    query and kept current as events are appended.
+    """
+    
+    def __init__(self, log_file: str):
+        self.log_file = log_file
+        self._times: Optional[Dict[Optional[str], List[datetime]]] = None
+        self._events: Dict[Optional[str], List[Dict]] = {}
+    
+    @property
+    def size(self) -> int:
+        """Current length of the log in bytes"""
+        try:
+            return os.path.getsize(self.log_file)
+        except FileNotFoundError:
+            return 0
+    
+    def read(self, offset: int = 0) -> Iterator[Dict]:
+        """Events from a byte offset on, skipping lines torn by an interrupted write"""
+        try:
+            with open(self.log_file, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue
+                    if line.endswith(b"\n"):
+                        yield event
+        except FileNotFoundError:
+            return
+    
+    def append(self, events: List[Dict]) -> None:
+        """Append events in one write, after any partial line left by an interrupted write"""
+        if not events:
+            return
+        data = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events).encode('utf-8')
+        with open(self.log_file, 'ab+') as f:
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            f.write(data)
+        if self._times is not None:
+            for event in events:
+                self._index_event(event)
+    
+    def _index_event(self, event: Dict) -> None:
+        at = _parse_timestamp(event["timestamp"])
+        for key in (None, event["new_stage"]):
+            times = self._times.setdefault(key, [])
+            position = bisect_right(times, at)
+            times.insert(position, at)
+            self._events.setdefault(key, []).insert(position, event)
+    
+    def changes(self, stage: Optional[str] = None, since: Optional[datetime] = None,
+                until: Optional[datetime] = None) -> List[Dict]:
+        """
+        Copies of the events (optionally only those moving to `stage`) with
+        since <= timestamp <= until, oldest first. Aware bounds are compared
+        in UTC.
+        """
+        if self._times is None:
+            self._times, self._events = {}, {}
+            for event in self.read():
+                self._index_event(event)
+        times = self._times.get(stage, [])
+        start = bisect_left(times, _naive_utc(since)) if since is not None else 0
+        end = bisect_right(times, _naive_utc(until)) if until is not None else len(times)
+        return [dict(event) for event in self._events.get(stage, [])[start:end]]
 
 
 class InvestorOutreachSystem:
     """Manages investor outreach tracking and coordination."""
     
+    # Stage changes logged between snapshot rewrites of the outreach file
+    COMPACT_EVERY = 100
+    
     def __init__(self, outreach_file: str = "investor_outreach_system.json"):
-        """Initialize the outreach system."""
+        """
+        Initialize the outreach system.
+        
+        Stage changes are appended to an event log next to the outreach file
+        (<name>.events.jsonl). The outreach file is a snapshot of the log up
+        to the offset in <name>.events.checkpoint; later events are replayed
+        on load. The checkpoint is kept out of the outreach data, so exports
+        and deployments never carry it.
+        """
         self.outreach_file = outreach_file
         self.outreach_data = self._load_outreach()
+        # (target_investors object, investors per tier) the name index was built from
+        self._investor_index_key: Optional[Tuple[Any, tuple]] = None
+        # Bumped on every change made through this class, for caches kept by callers
+        self.generation = 0
+        self.events = InvestorEventLog(str(Path(outreach_file).with_suffix(".events.jsonl")))
+        self._checkpoint_file = Path(outreach_file).with_suffix(".events.checkpoint")
+        self._pending_events = 0
+        self._replay_events()
+    
+    def _replay_events(self) -> None:
+        """Apply events logged after the snapshot was written."""
+        try:
+            with open(self._checkpoint_file, 'r', encoding='utf-8') as f:
+                offset = json.load(f)["offset"]
+        except (OSError, ValueError, KeyError, TypeError):
+            offset = 0
+        for event in self.events.read(offset):
+            investor = self._investor_index().find(event["investor"])
+            if investor is not None:
+                investor["stage"] = event["new_stage"]
+                investor["last_updated"] = event["timestamp"]
+            self._pending_events += 1
+    
+    def _investor_index(self) -> _LookupIndex:
+        """
+        Name index over investors in every tier, in tier order.
+        
+        Rebuilt when target_investors is replaced or a tier gains or loses
+        investors; call _reset_investor_index after renaming one in place.
+        """
+        tiers = self.outreach_data.get("target_investors", {})
+        counts = tuple((tier, len(investors)) for tier, investors in tiers.items()
+                       if isinstance(investors, list))
+        cached = self._investor_index_key
+        if cached is None or cached[0] is not tiers or cached[1] != counts:
+            self._investors_by_name = _LookupIndex(
+                (investor.get("name", ""), investor)
+                for investors in tiers.values() if isinstance(investors, list)
+                for investor in investors
+            )
+            self._investor_index_key = (tiers, counts)
+        return self._investors_by_name
+    
+    def _reset_investor_index(self) -> None:
+        """Force the investor name index to be rebuilt on next use."""
+        self._investor_index_key = None
+        self.generation += 1
+    
+    def update_section(self, section: str, value: Any) -> None:
+        """Replace a top-level section of the outreach data in memory."""
+        self.outreach_data[section] = value
+        if section == "target_investors":
+            self._investor_index_key = None
+        self.generation += 1
     
     def _load_outreach(self) -> Dict:
-        """Load the outreach data from JSON file."""
+        """Load the outreach data from JSON file, through its parse cache."""
         try:
-            with open(self.outreach_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _load_json_cached(self.outreach_file, lazy=False)
         except FileNotFoundError:
             return self._create_default_outreach()
     
@@ -170,25 +695,70 @@ class InvestorOutreachSystem:
         return investors
     
     def get_investor_by_name(self, name: str) -> Optional[Dict]:
-        """Find an investor by name."""
-        for tier_data in self.outreach_data.get("target_investors", {}).values():
-            if isinstance(tier_data, list):
-                for investor in tier_data:
-                    if name.lower() in investor.get("name", "").lower():
-                        return investor
-        return None
+        """Find an investor by exact name, name word (e.g. 'a16z') or name substring."""
+        return self._investor_index().find(name)
     
     def update_investor_stage(self, investor_name: str, new_stage: str) -> bool:
         """Update the stage of an investor."""
-        for tier_data in self.outreach_data.get("target_investors", {}).values():
-            if isinstance(tier_data, list):
-                for investor in tier_data:
-                    if investor_name.lower() in investor.get("name", "").lower():
-                        investor["stage"] = new_stage
-                        investor["last_updated"] = datetime.utcnow().isoformat() + "Z"
-                        self._save_outreach()
-                        return True
-        return False
+        return self.bulk_update_stages({investor_name: new_stage})[investor_name]
+    
+    def bulk_update_stages(self, updates: Dict[str, str]) -> Dict[str, bool]:
+        """
+        Update the stages of several investors.
+        
+        Every update is applied in memory and appended to the event log in a
+        single write; the outreach file itself is only rewritten (atomically)
+        every COMPACT_EVERY changes. Returns whether each name matched an
+        investor.
+        """
+        timestamp = datetime.utcnow().isoformat(timespec="microseconds") + "Z"
+        index = self._investor_index()
+        results, events = {}, []
+        for name, stage in updates.items():
+            investor = index.find(name)
+            results[name] = investor is not None
+            if investor is not None:
+                events.append({
+                    "investor": investor.get("name", ""),
+                    "old_stage": investor.get("stage"),
+                    "new_stage": stage,
+                    "timestamp": timestamp,
+                })
+                investor["stage"] = stage
+                investor["last_updated"] = timestamp
+        
+        self.events.append(events)
+        self._pending_events += len(events)
+        self.generation += bool(events)
+        if self._pending_events >= self.COMPACT_EVERY:
+            self.compact()
+        return results
+    
+    def compact(self) -> None:
+        """Rewrite the outreach snapshot with every logged change folded in."""
+        offset = self.events.size
+        self._save_outreach()
+        # Written after the snapshot: a crash in between leaves an older
+        # checkpoint, and replaying events the snapshot already holds is harmless
+        _write_atomic(self._checkpoint_file, json.dumps({"offset": offset}).encode('utf-8'))
+        self._pending_events = 0
+    
+    def stage_changes(self, stage: Optional[str] = None, since: Optional[Any] = None,
+                      until: Optional[datetime] = None) -> List[Dict]:
+        """
+        Logged stage changes, oldest first, via the event log's time index.
+        
+        `stage` keeps only moves to that stage; `since` is a datetime or a
+        timedelta back from now. Naive datetimes are taken as UTC, aware
+        ones are converted to it.
+        """
+        if isinstance(since, timedelta):
+            since = datetime.utcnow() - since
+        return self.events.changes(stage, since, until)
+    
+    def investors_moved_to(self, stage: str, since: Optional[Any] = None) -> List[str]:
+        """Names of investors that moved to a stage (e.g. in the last timedelta(days=7)), in order."""
+        return list(dict.fromkeys(event["investor"] for event in self.stage_changes(stage, since)))
     
     def get_pitch_deck_status(self) -> Dict:
         """Get pitch deck preparation status."""
@@ -227,12 +797,13 @@ class InvestorOutreachSystem:
         return self.outreach_data.get("integration_with_systems", {})
     
     def _save_outreach(self) -> None:
-        """Save outreach data to file."""
+        """Save outreach data to file via a temporary file renamed into place, so it is never half-written."""
         try:
-            with open(self.outreach_file, 'w', encoding='utf-8') as f:
-                json.dump(self.outreach_data, f, indent=2, ensure_ascii=False)
+            _write_atomic(self.outreach_file, json.dumps(self.outreach_data, indent=2, ensure_ascii=False).encode('utf-8'))
         except (IOError, PermissionError) as e:
             raise IOError(f"Failed to save outreach data to {self.outreach_file}: {e}") from e
+        # The data is already in memory, so the next load need not parse what was just written
+        _write_parse_cache(self.outreach_file, self.outreach_data)
     
     def export_to_yaml(self, output_file: str) -> None:
         """Export outreach data to YAML format."""
@@ -251,6 +822,131 @@ class InvestorOutreachSystem:
             raise IOError(f"Failed to export to JSON file {output_file}: {e}") from e
 
 
+# Deployment artifacts per target: (artifact, dataset, file name); the
+# format follows the file suffix
+DEPLOYMENT_ARTIFACTS = {
+    "aws": [
+        ("cosmology", "cosmology", "aws_cosmology.json"),
+        ("outreach", "outreach", "aws_outreach.json"),
+        ("status", "status", "aws_system_status.json"),
+    ],
+    "github": [
+        ("cosmology_yaml", "cosmology", "github_cosmology.yaml"),
+        ("cosmology_json", "cosmology", "github_cosmology.json"),
+        ("outreach_yaml", "outreach", "github_outreach.yaml"),
+        ("outreach_json", "outreach", "github_outreach.json"),
+    ],
+}
+
+
+# Default manifest of the last deployment, a hidden file resolved against
+# the output directory; bundles carry their own BUNDLE_MANIFEST instead
+DEPLOYMENT_MANIFEST = ".deployment_manifest.json"
+BUNDLE_MANIFEST = "MANIFEST.json"
+_MANIFEST_VERSION = 1
+
+
+def _deployment_targets(targets: Iterable[str]) -> List[str]:
+    """Distinct deployment targets in order; ValueError for unknown ones."""
+    targets = list(dict.fromkeys(targets))
+    unknown = [target for target in targets if target not in DEPLOYMENT_ARTIFACTS]
+    if unknown:
+        raise ValueError(f"Unknown deployment target(s): {', '.join(unknown)}")
+    return targets
+
+
+def _input_digest(data: Any) -> str:
+    """Digest of a dataset's content, independent of the output formats."""
+    return hashlib.sha256(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode('utf-8')).hexdigest()
+
+
+def _read_manifest(path: Path) -> Dict[str, Dict]:
+    """Artifact entries of a deployment manifest, or {} if it is missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get("version") == _MANIFEST_VERSION:
+            return manifest["artifacts"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return {}
+
+
+def _file_matches(path: Path, entry: Dict) -> bool:
+    """Whether a file still has the size and mtime recorded in its manifest entry."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return False
+    return stat.st_size == entry.get("bytes") and stat.st_mtime_ns == entry.get("mtime_ns")
+
+
+def _render(data: Any, fmt: str) -> bytes:
+    """Serialize data exactly as the export_to_json/export_to_yaml methods do."""
+    if fmt == "yaml":
+        return yaml.dump(data, default_flow_style=False, allow_unicode=True).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Bundle archive formats, and the serialized size above which an
+# artifact being bundled spills from memory to an anonymous temporary file
+BUNDLE_FORMATS = ("tar.gz", "zip")
+BUNDLE_SPOOL_BYTES = 8 * 1024 * 1024
+
+
+class _DigestWriter(io.RawIOBase):
+    """Raw binary sink that hashes and counts bytes on their way to another file."""
+    
+    def __init__(self, target: BinaryIO):
+        self.target = target
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        self.size += len(data)
+        self.target.write(data)
+        return len(data)
+
+
+def _render_to(data: Any, fmt: str, target: BinaryIO) -> Tuple[str, int]:
+    """Stream the same bytes as _render into a binary file; returns their sha256 and size."""
+    sink = _DigestWriter(target)
+    stream = io.TextIOWrapper(io.BufferedWriter(sink, 1 << 16), encoding='utf-8', newline='')
+    if fmt == "yaml":
+        yaml.dump(data, stream, default_flow_style=False, allow_unicode=True)
+    else:
+        json.dump(data, stream, indent=2, ensure_ascii=False)
+    stream.flush()
+    stream.detach()
+    return sink.sha256.hexdigest(), sink.size
+
+
+def _bundle_format(path: str) -> str:
+    """Archive format named by a bundle path's suffix."""
+    if path.endswith((".tar.gz", ".tgz")):
+        return "tar.gz"
+    if path.endswith(".zip"):
+        return "zip"
+    raise ValueError(f"Bundle path must end in .tar.gz, .tgz or .zip: {path}")
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Atomically write data unless the file already holds exactly that content."""
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
+    _write_atomic(path, data)
+    return True
+
+
 class IntegratedCodexSystem:
     """Unified system combining cosmology and investor outreach."""
     
@@ -260,78 +956,217 @@ class IntegratedCodexSystem:
         """Initialize the integrated system."""
         self.cosmology = BiblicalCosmologySystem(cosmology_file)
         self.outreach = InvestorOutreachSystem(outreach_file)
+        self._status_cache: Optional[Tuple[Tuple[int, int], Dict]] = None
+        self._status_hits = self._status_misses = 0
     
     def get_full_system_status(self) -> Dict:
-        """Get comprehensive status of all systems."""
+        """
+        Get comprehensive status of all systems.
+        
+        The status is memoized against the generation counters of the
+        cosmology and outreach systems and only rebuilt after a change made
+        through them; each call gets a fresh timestamp and its own copy.
+        """
+        key = (self.cosmology.generation, self.outreach.generation)
+        if self._status_cache is not None and self._status_cache[0] == key:
+            self._status_hits += 1
+        else:
+            self._status_misses += 1
+            integration = self.outreach.get_integration_status()
+            self._status_cache = (key, {
+                "cosmology_system": self.cosmology.get_system_status(),
+                "outreach_system": {
+                    "status": self.outreach.outreach_data.get("status"),
+                    "checklist_status": self.outreach.outreach_data.get("checklist_status"),
+                    "current_phase": self.outreach.get_current_phase(),
+                    "investors_count": len(self.outreach.get_investors())
+                },
+                "integration": {
+                    "health_stacks": integration.get("health_stacks_backing"),
+                    "cosmology_integration": integration.get("cosmology_integration"),
+                    "partnerships": integration.get("upper_echelon_partnerships")
+                }
+            })
+        status = {"timestamp": datetime.utcnow().isoformat() + "Z"}
+        status.update((name, dict(section)) for name, section in self._status_cache[1].items())
+        return status
+    
+    def status_cache_info(self) -> Dict:
+        """Hit/miss counts of the status cache and the generations it was last built for."""
         return {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "cosmology_system": self.cosmology.get_system_status(),
-            "outreach_system": {
-                "status": self.outreach.outreach_data.get("status"),
-                "checklist_status": self.outreach.outreach_data.get("checklist_status"),
-                "current_phase": self.outreach.get_current_phase(),
-                "investors_count": len(self.outreach.get_investors())
-            },
-            "integration": {
-                "health_stacks": self.outreach.get_integration_status().get("health_stacks_backing"),
-                "cosmology_integration": self.outreach.get_integration_status().get("cosmology_integration"),
-                "partnerships": self.outreach.get_integration_status().get("upper_echelon_partnerships")
-            }
+            "hits": self._status_hits,
+            "misses": self._status_misses,
+            "generations": {"cosmology": self.cosmology.generation, "outreach": self.outreach.generation},
         }
     
-    def generate_aws_deployment_package(self, output_dir: str = ".") -> Dict[str, str]:
-        """Generate AWS deployment package with all schemas."""
+    def _deployment_input(self, dataset: str) -> Tuple[Any, str]:
+        """A dataset to deploy and the digest of its content."""
+        if dataset == "cosmology":
+            data = self.cosmology._codex_dict()
+        elif dataset == "outreach":
+            data = self.outreach.outreach_data
+        else:
+            data = self.get_full_system_status()
+            # The generation time alone does not make the status a new input
+            return data, _input_digest({key: value for key, value in data.items() if key != "timestamp"})
+        return data, _input_digest(data)
+    
+    def deploy(self, targets: Iterable[str] = ("aws", "github"), output_dir: str = ".",
+               max_workers: Optional[int] = None, force: bool = False,
+               manifest: Optional[str] = DEPLOYMENT_MANIFEST) -> List[Dict]:
+        """
+        Generate the deployment packages for several targets in one pass.
+        
+        The `manifest` file (relative paths are resolved against the output
+        directory; None disables it) records each artifact's input digest,
+        content digest, size and mtime. Artifacts whose input and file are
+        unchanged since then are skipped without being serialized, unless
+        `force` is set. The rest are serialized once per dataset and format
+        and written over a thread pool, skipping any whose content is
+        unchanged. The manifest is only rewritten when it changes, so a
+        no-op deploy writes nothing.
+        
+        Returns one report per artifact with its path, digests, size,
+        whether it was written and serialize/write timings in milliseconds.
+        """
+        targets = _deployment_targets(targets)
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
+        manifest_path = output_path / manifest if manifest is not None else None
+        previous = _read_manifest(manifest_path) if manifest_path is not None else {}
         
-        files = {}
-        
-        # Export cosmology
-        cosmology_json = output_path / "aws_cosmology.json"
-        self.cosmology.export_to_json(str(cosmology_json))
-        files["cosmology"] = str(cosmology_json)
+        reports, jobs, inputs, rendered = [], [], {}, {}
+        for target in targets:
+            for artifact, dataset, filename in DEPLOYMENT_ARTIFACTS[target]:
+                if dataset not in inputs:
+                    inputs[dataset] = self._deployment_input(dataset)
+                data, digest = inputs[dataset]
+                path = output_path / filename
+                report = {"target": target, "artifact": artifact, "path": str(path), "input_sha256": digest}
+                reports.append(report)
+                
+                entry = previous.get(filename)
+                if not force and entry and entry.get("input_sha256") == digest and _file_matches(path, entry):
+                    report.update(sha256=entry["sha256"], bytes=entry["bytes"], serialize_ms=0.0,
+                                  written=False, write_ms=0.0)
+                    continue
+                fmt = "yaml" if filename.endswith(".yaml") else "json"
+                serialize_ms = 0.0
+                if (dataset, fmt) not in rendered:
+                    start = time.perf_counter()
+                    rendered[dataset, fmt] = _render(data, fmt)
+                    serialize_ms = (time.perf_counter() - start) * 1000
+                content = rendered[dataset, fmt]
+                report.update(sha256=hashlib.sha256(content).hexdigest(), bytes=len(content), serialize_ms=serialize_ms)
+                jobs.append((report, content))
         
-        # Export outreach
-        outreach_json = output_path / "aws_outreach.json"
-        self.outreach.export_to_json(str(outreach_json))
-        files["outreach"] = str(outreach_json)
+        def write(job: Tuple[Dict, bytes]) -> None:
+            report, content = job
+            start = time.perf_counter()
+            report["written"] = _write_if_changed(Path(report["path"]), content)
+            report["write_ms"] = (time.perf_counter() - start) * 1000
         
-        # Export combined status
-        status_json = output_path / "aws_system_status.json"
-        with open(status_json, 'w', encoding='utf-8') as f:
-            json.dump(self.get_full_system_status(), f, indent=2, ensure_ascii=False)
-        files["status"] = str(status_json)
+        if jobs:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                list(pool.map(write, jobs))
         
-        return files
+        if manifest_path is None:
+            return reports
+        artifacts = dict(previous)
+        for report in reports:
+            filename = Path(report["path"]).name
+            artifacts[filename] = {
+                "target": report["target"],
+                "artifact": report["artifact"],
+                "input_sha256": report["input_sha256"],
+                "sha256": report["sha256"],
+                "bytes": report["bytes"],
+                "mtime_ns": os.stat(report["path"]).st_mtime_ns,
+            }
+        content = {"version": _MANIFEST_VERSION, "artifacts": dict(sorted(artifacts.items()))}
+        _write_if_changed(manifest_path, json.dumps(content, indent=2, ensure_ascii=False).encode('utf-8'))
+        return reports
     
-    def generate_github_deployment_package(self, output_dir: str = ".") -> Dict[str, str]:
-        """Generate GitHub deployment package with YAML and JSON."""
-        output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True)
-        
-        files = {}
-        
-        # Export cosmology as YAML
-        cosmology_yaml = output_path / "github_cosmology.yaml"
-        self.cosmology.export_to_yaml(str(cosmology_yaml))
-        files["cosmology_yaml"] = str(cosmology_yaml)
+    def bundle(self, bundle_path: str, targets: Iterable[str] = ("aws", "github"),
+               compression_level: int = 6) -> Dict:
+        """
+        Write the deployment packages as a single tar.gz or zip archive.
         
-        # Export cosmology as JSON
-        cosmology_json = output_path / "github_cosmology.json"
-        self.cosmology.export_to_json(str(cosmology_json))
-        files["cosmology_json"] = str(cosmology_json)
+        Each dataset is serialized once per format straight into a bounded
+        spool (memory up to BUNDLE_SPOOL_BYTES, then an anonymous temporary
+        file) while being hashed, and copied in chunks into every archive
+        member that uses it; no loose artifact files are written. The
+        archive ends with a BUNDLE_MANIFEST member listing each artifact's
+        sha256 and size, and replaces `bundle_path` atomically. The archive
+        is built from the data, not an output directory, so no deployment
+        manifest is ever included.
+        """
+        fmt = _bundle_format(bundle_path)
+        if not 0 <= compression_level <= 9:
+            raise ValueError(f"Compression level must be between 0 and 9: {compression_level}")
+        targets = _deployment_targets(targets)
         
-        # Export outreach as YAML
-        outreach_yaml = output_path / "github_outreach.yaml"
-        self.outreach.export_to_yaml(str(outreach_yaml))
-        files["outreach_yaml"] = str(outreach_yaml)
+        groups: Dict[Tuple[str, str], List[Tuple[str, str, str]]] = {}
+        for target in targets:
+            for artifact, dataset, filename in DEPLOYMENT_ARTIFACTS[target]:
+                data_format = "yaml" if filename.endswith(".yaml") else "json"
+                groups.setdefault((dataset, data_format), []).append((target, artifact, filename))
         
-        # Export outreach as JSON
-        outreach_json = output_path / "github_outreach.json"
-        self.outreach.export_to_json(str(outreach_json))
-        files["outreach_json"] = str(outreach_json)
+        reports = []
+        now = time.time()
+        with _atomic_file(bundle_path) as f:
+            if fmt == "zip":
+                archive = zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compression_level)
+            else:
+                archive = tarfile.open(fileobj=f, mode="w:gz", compresslevel=compression_level)
+            
+            def add(name: str, source: BinaryIO, size: int) -> None:
+                source.seek(0)
+                if fmt == "zip":
+                    # The size is known up front, so members past 2 GiB get zip64 headers
+                    with archive.open(name, "w", force_zip64=size > zipfile.ZIP64_LIMIT) as member:
+                        shutil.copyfileobj(source, member, 1 << 16)
+                else:
+                    info = tarfile.TarInfo(name)
+                    info.size, info.mtime, info.mode = size, now, 0o644
+                    archive.addfile(info, source)
+            
+            with archive:
+                inputs = {}
+                for (dataset, data_format), members in groups.items():
+                    if dataset not in inputs:
+                        inputs[dataset] = self._deployment_input(dataset)
+                    data, digest = inputs[dataset]
+                    with tempfile.SpooledTemporaryFile(BUNDLE_SPOOL_BYTES) as spool:
+                        start = time.perf_counter()
+                        sha256, size = _render_to(data, data_format, spool)
+                        serialize_ms = (time.perf_counter() - start) * 1000
+                        for target, artifact, filename in members:
+                            start = time.perf_counter()
+                            add(filename, spool, size)
+                            reports.append({
+                                "target": target, "artifact": artifact, "name": filename,
+                                "input_sha256": digest, "sha256": sha256, "bytes": size,
+                                "serialize_ms": serialize_ms, "write_ms": (time.perf_counter() - start) * 1000,
+                            })
+                            serialize_ms = 0.0
+                
+                manifest = {"version": _MANIFEST_VERSION, "artifacts": {
+                    report["name"]: {key: report[key] for key in ("target", "artifact", "input_sha256", "sha256", "bytes")}
+                    for report in sorted(reports, key=lambda report: report["name"])
+                }}
+                content = json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8')
+                add(BUNDLE_MANIFEST, io.BytesIO(content), len(content))
         
-        return files
+        return {"path": bundle_path, "format": fmt, "bytes": os.path.getsize(bundle_path), "artifacts": reports}
+    
+    def generate_aws_deployment_package(self, output_dir: str = ".") -> Dict[str, str]:
+        """Generate AWS deployment package with all schemas."""
+        return {report["artifact"]: report["path"] for report in self.deploy(["aws"], output_dir)}
+    
+    def generate_github_deployment_package(self, output_dir: str = ".") -> Dict[str, str]:
+        """Generate GitHub deployment package with YAML and JSON."""
+        return {report["artifact"]: report["path"] for report in self.deploy(["github"], output_dir)}
     
     def print_summary(self) -> None:
         """Print a comprehensive summary of all systems."""
@@ -11,13 +11,18 @@ Commands:
 - add-ingredient: Add an ingredient root
 - add-job: Add a job/career
 - add-loop: Add a surprise loop
-- verify: Verify loop integrity
+- verify: Verify loop integrity and audit hash (--json for a machine-readable report)
 - export: Export ledger to file
 - yields: Show blessing yields
+- import: Bulk import entities from CSV/JSONL
 """
 
 import argparse
+import csv
+import json
+import os
 import sys
+import time
 from megazion_ledger import (
     MegazionLedger, HealingBlessing, GemElement, 
     SupernaturalSurprise, IngredientRoot, JobCareer, SurpriseLoop
@@ -291,42 +296,41 @@ def verify_ledger(args):
         print(f"✗ Error: Ledger file not found: {args.ledger}")
         sys.exit(1)
     
+    report = ledger.verify()
+    
+    if args.json:
+        print(json.dumps(report, indent=2))
+        sys.exit(0 if report["valid"] else 1)
+    
     print("=" * 80)
     print("🔍 MEGAZION LEDGER VERIFICATION")
     print("=" * 80)
     print()
     
-    # Check loop integrity
-    loop_integrity = ledger.verify_loop_integrity()
-    print(f"Loop Integrity: {'✓ VERIFIED' if loop_integrity else '✗ FAILED'}")
+    print(f"Loop Integrity: {'✓ VERIFIED' if report['loop_integrity'] else '✗ FAILED'}")
     
-    # Check individual loops
     print("\nIndividual Loop Status:")
-    for i, loop in enumerate(ledger.surprise_loops, 1):
-        status = "✓" if loop.verify_loop_integrity() else "✗"
-        print(f"  {status} {loop.blessing_id} ({loop.recursion_depth} stages)")
+    for loop in report["loops"]:
+        status = "✓" if loop["integrity"] else "✗"
+        print(f"  {status} {loop['blessing_id']} ({loop['recursion_depth']} stages)")
     
-    # Check audit hash
-    current_hash = ledger.exchange_logic['audit_hash']
-    computed_hash = ledger._compute_ledger_hash()
-    # DEBUG
-    import sys
-    print(f"DEBUG: current={current_hash}", file=sys.stderr)
-    print(f"DEBUG: computed={computed_hash}", file=sys.stderr)
-    print(f"DEBUG: equal={current_hash == computed_hash}", file=sys.stderr)
-    hash_valid = (current_hash == computed_hash) if current_hash and computed_hash else False
+    audit = report["audit_hash"]
     if args.verbose:
-        print(f"\n  Current:  {current_hash[:32]}...")
-        print(f"  Computed: {computed_hash[:32]}...")
-        print(f"  Match: {hash_valid}")
-    print(f"\nAudit Hash: {'✓ VALID' if hash_valid else '✗ INVALID'}")
-    
-    # Check vault sync
-    vault_sync = ledger.exchange_logic.get('vault_sync', False)
-    print(f"Vault Sync: {'✓ ENABLED' if vault_sync else '✗ DISABLED'}")
+        print(f"\n  Current:  {audit['stored'][:32]}...")
+        print(f"  Computed: {audit['computed'][:32]}...")
+        print(f"  Match: {audit['valid']}")
+        print("\n  Registry Hashes:")
+        for registry, info in report["registry_hashes"].items():
+            print(f"    {registry:<24} {info['count']:>8}  {info['hash'][:32]}...")
+        timings = report["timings_ms"]
+        print(f"\n  Timings: loops {timings['loops']:.2f} ms, serialize {timings['serialize']:.2f} ms, "
+              f"hash {timings['hash']:.2f} ms, total {timings['total']:.2f} ms")
+    print(f"\nAudit Hash: {'✓ VALID' if audit['valid'] else '✗ INVALID'}")
+    
+    print(f"Vault Sync: {'✓ ENABLED' if report['vault_sync'] else '✗ DISABLED'}")
     
     print()
-    if loop_integrity and hash_valid:
+    if report["valid"]:
         print("✓ MEGAZION Ledger is VALID and fully operational")
         print("  The self-reciprocating loops are active and theft-proof")
         sys.exit(0)
@@ -376,8 +380,21 @@ def show_yields(args):
     print(f"  Active Loops: {yields['total_surprise_loops']}")
     print()
     
-    print("INFINITE YIELDS:")
-    print(f"  Loop Multiplication Factor: {yields['loop_multiplication_factor']}")
+    simulation = ledger.simulate_yields(
+        iterations=args.iterations,
+        retention=args.retention,
+        time_budget=args.time_budget
+    )
+    
+    print("SIMULATED YIELDS:")
+    for registry, result in simulation['registries'].items():
+        print(f"  {registry.replace('_', ' ').title()}: {result['output']:.2f} "
+              f"(×{result['multiplication_factor']:.2f})")
+    print(f"  Loop Multiplication Factor: {simulation['loop_multiplication_factor']:.4f}")
+    status = "converged" if simulation['converged'] else (
+        "time budget exhausted" if simulation['budget_exhausted'] else "iteration limit reached")
+    print(f"  Iterations: {simulation['iterations']} ({status}, "
+          f"{simulation['elapsed_seconds'] * 1000:.1f} ms, {simulation['backend']} backend)")
     print()
     
     print("=" * 80)
@@ -385,6 +402,237 @@ def show_yields(args):
     print("=" * 80)
 
 
+# Import kinds (as in show --section) -> ledger registry
+IMPORT_KINDS = {
+    'healing': 'healing_blessings',
+    'gems': 'gems_elements',
+    'supernatural': 'supernatural_surprises',
+    'ingredients': 'ingredient_roots',
+    'jobs': 'job_careers',
+    'loops': 'surprise_loops'
+}
+
+
+def _iter_import_rows(path, fmt, offset):
+    """
+    Stream (record, end_offset) pairs from a CSV/JSONL file, starting at a byte offset.
+    
+    Offsets always fall on line boundaries so an import can resume from them.
+    A CSV record whose quoted field continues onto the next line is reported
+    as malformed; the reader's line count shows how many lines it consumed.
+    """
+    with open(path, 'rb') as f:
+        if fmt == 'csv':
+            header = next(csv.reader([f.readline().decode('utf-8-sig')]), [])
+            offset = max(offset, f.tell())
+        f.seek(offset)
+        
+        if fmt != 'csv':
+            for raw in f:
+                offset += len(raw)
+                try:
+                    line = raw.decode('utf-8').strip()
+                    if not line:
+                        continue
+                    record = json.loads(line)
+                except ValueError as e:
+                    record = ValueError(f"Malformed JSONL row: {e}")
+                yield record, offset
+            return
+        
+        position = [offset]
+        undecodable = set()
+        
+        def lines():
+            for line_number, raw in enumerate(f, 1):
+                position[0] += len(raw)
+                try:
+                    yield raw.decode('utf-8')
+                except UnicodeDecodeError:
+                    undecodable.add(line_number)
+                    yield "\n"
+        
+        reader = csv.reader(lines())
+        previous_line = 0
+        while True:
+            try:
+                row = next(reader)
+                first_line = previous_line + 1
+                if reader.line_num > first_line:
+                    raise ValueError(f"record spans lines {first_line}-{reader.line_num} "
+                                     "(multi-line CSV fields are not supported)")
+                if first_line in undecodable:
+                    raise ValueError("line is not valid UTF-8")
+                if not any(field.strip() for field in row):
+                    previous_line = reader.line_num
+                    continue
+                record = dict(zip(header, row))
+            except StopIteration:
+                return
+            except (ValueError, csv.Error) as e:
+                record = ValueError(f"Malformed CSV row: {e}")
+            previous_line = reader.line_num
+            yield record, position[0]
+
+
+def _save_atomic(path, write):
+    """Write a file via a temp file and rename so readers never see partial output"""
+    tmp_path = f"{path}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _write_import_checkpoint(checkpoint_file, checkpoint):
+    """Atomically record import progress"""
+    
+    def write_checkpoint(path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f, indent=2)
+    
+    _save_atomic(checkpoint_file, write_checkpoint)
+
+
+def _append_import_journal(journal_file, entities):
+    """Append imported entities to the journal; returns its new size in bytes"""
+    with open(journal_file, 'ab') as f:
+        for entity in entities:
+            f.write(json.dumps(entity.to_dict(), ensure_ascii=False).encode('utf-8') + b"\n")
+        return f.tell()
+
+
+def _resume_import_state(ledger, args, checkpoint_file, journal_file, registry):
+    """
+    Load checkpointed progress and replay the journaled entities into the ledger.
+    
+    Returns None if the import already finished and only cleanup is left.
+    """
+    try:
+        with open(checkpoint_file, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except FileNotFoundError:
+        print(f"✗ Error: No import checkpoint found: {checkpoint_file}")
+        sys.exit(1)
+    
+    if checkpoint.get("input") != os.path.abspath(args.input) or checkpoint.get("kind") != args.kind:
+        print(f"✗ Error: Checkpoint belongs to a different import "
+              f"({checkpoint.get('kind')} from {checkpoint.get('input')})")
+        sys.exit(1)
+    if checkpoint.get("input_size") != os.path.getsize(args.input):
+        print(f"✗ Error: Input file changed since the checkpoint was written: {args.input}")
+        sys.exit(1)
+    
+    current_hash = ledger.exchange_logic['audit_hash']
+    if checkpoint.get("completed_hash") == current_hash:
+        return None
+    if checkpoint.get("audit_hash") != current_hash:
+        print("✗ Error: Ledger was modified since the checkpoint was written; cannot resume safely")
+        sys.exit(1)
+    
+    # Entities appended after the last checkpoint belong to an unfinished write
+    journal_size = checkpoint["journal_size"]
+    entities = []
+    if journal_size:
+        with open(journal_file, 'r+b') as f:
+            f.truncate(journal_size)
+            for line in f:
+                entities.append(MegazionLedger.entity_from_record(registry, json.loads(line)))
+    ledger.add_entities(registry, entities, update_hash=False)
+    return checkpoint
+
+
+def import_records(args):
+    """Bulk import entities from a CSV or JSONL file"""
+    try:
+        ledger = MegazionLedger.load_from_file(args.ledger)
+    except FileNotFoundError:
+        print(f"✗ Error: Ledger file not found: {args.ledger}")
+        sys.exit(1)
+    if not os.path.exists(args.input):
+        print(f"✗ Error: Input file not found: {args.input}")
+        sys.exit(1)
+    
+    registry = IMPORT_KINDS[args.kind]
+    fmt = args.format or ('csv' if args.input.lower().endswith('.csv') else 'jsonl')
+    ledger_format = 'json' if args.ledger.lower().endswith('.json') else 'yaml'
+    checkpoint_file = f"{args.ledger}.import-checkpoint.json"
+    journal_file = f"{args.ledger}.import-journal.jsonl"
+    
+    if args.resume:
+        checkpoint = _resume_import_state(ledger, args, checkpoint_file, journal_file, registry)
+        if checkpoint is None:
+            for path in (checkpoint_file, journal_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            print(f"✓ Import into {args.ledger} had already finished; removed its checkpoint")
+            return
+        print(f"↻ Resuming import after row {checkpoint['rows_read']} ({checkpoint['imported']} already imported)")
+    elif os.path.exists(checkpoint_file):
+        print(f"✗ Error: An unfinished import checkpoint exists: {checkpoint_file}")
+        print("  Use --resume to continue it, or delete it to start over")
+        sys.exit(1)
+    else:
+        if os.path.exists(journal_file):
+            os.remove(journal_file)
+        checkpoint = {
+            "input": os.path.abspath(args.input),
+            "input_size": os.path.getsize(args.input),
+            "kind": args.kind,
+            "audit_hash": ledger.exchange_logic['audit_hash'],
+            "offset": 0, "rows_read": 0, "imported": 0, "skipped": 0, "journal_size": 0
+        }
+    
+    rows_read, imported, skipped = checkpoint["rows_read"], checkpoint["imported"], checkpoint["skipped"]
+    pending = []
+    start = time.perf_counter()
+    rows_this_run = 0
+    
+    for record, end_offset in _iter_import_rows(args.input, fmt, checkpoint["offset"]):
+        rows_read += 1
+        rows_this_run += 1
+        try:
+            if isinstance(record, ValueError):
+                raise record
+            pending.append(MegazionLedger.entity_from_record(registry, record))
+        except ValueError as e:
+            skipped += 1
+            if args.strict:
+                print(f"✗ Error: Row {rows_read}: {e}")
+                print("  Import aborted (--strict); the ledger file is unchanged")
+                sys.exit(1)
+            if skipped <= 10:
+                print(f"  ⚠ Skipped row {rows_read}: {e}")
+        
+        # A checkpoint only journals the entities parsed since the last one, so
+        # its cost does not grow with the ledger; the ledger file is written once
+        if args.checkpoint_every and rows_this_run % args.checkpoint_every == 0:
+            journal_size = _append_import_journal(journal_file, pending)
+            imported += ledger.add_entities(registry, pending, update_hash=False)
+            pending = []
+            checkpoint = dict(checkpoint, offset=end_offset, rows_read=rows_read, imported=imported,
+                              skipped=skipped, journal_size=journal_size)
+            _write_import_checkpoint(checkpoint_file, checkpoint)
+            elapsed = time.perf_counter() - start
+            print(f"  … checkpoint at row {rows_read}: {imported} imported "
+                  f"({rows_this_run / elapsed:,.0f} rows/sec)")
+    
+    imported += ledger.add_entities(registry, pending)
+    elapsed = time.perf_counter() - start
+    if os.path.exists(checkpoint_file):
+        # Lets a resume recognise a final save that landed before cleanup
+        checkpoint["completed_hash"] = ledger.exchange_logic['audit_hash']
+        _write_import_checkpoint(checkpoint_file, checkpoint)
+    _save_atomic(args.ledger, lambda path: ledger.save_to_file(path, format=ledger_format))
+    for path in (checkpoint_file, journal_file):
+        if os.path.exists(path):
+            os.remove(path)
+    write_time = time.perf_counter() - start - elapsed
+    
+    rate = rows_this_run / elapsed if elapsed > 0 else float(rows_this_run)
+    print(f"✓ Imported {imported} {args.kind} into {args.ledger} ({skipped} skipped)")
+    print(f"  Rows processed: {rows_this_run} in {elapsed:.2f}s ({rate:,.0f} rows/sec), write: {write_time:.2f}s")
+    print(f"  Audit Hash: {ledger.exchange_logic['audit_hash'][:32]}...")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="MEGAZION INHERITANCE LEDGER™ - CLI Interface",
@@ -406,8 +654,14 @@ Examples:
   # Verify ledger integrity
   %(prog)s verify megazion.yaml
   
+  # Machine-readable verification report for monitoring
+  %(prog)s verify megazion.yaml --json
+  
   # Show yields
   %(prog)s yields megazion.yaml
+  
+  # Bulk import gems from JSONL, checkpointing every 100k rows
+  %(prog)s import megazion.yaml data.jsonl --kind gems -c 100000
         """
     )
     
@@ -481,6 +735,7 @@ Examples:
     verify_parser = subparsers.add_parser('verify', help='Verify ledger integrity')
     verify_parser.add_argument('ledger', help='Ledger file path')
     verify_parser.add_argument('-v', '--verbose', action='store_true', help='Show detailed verification info')
+    verify_parser.add_argument('--json', action='store_true', help='Print the verification report as JSON')
     
     # Export command
     export_parser = subparsers.add_parser('export', help='Export ledger to file')
@@ -491,6 +746,24 @@ Examples:
     # Yields command
     yields_parser = subparsers.add_parser('yields', help='Show blessing yields')
     yields_parser.add_argument('ledger', help='Ledger file path')
+    yields_parser.add_argument('-n', '--iterations', type=int, default=1000, help='Maximum simulation iterations')
+    yields_parser.add_argument('-r', '--retention', type=float, default=0.9,
+                               help='Fraction of yield each stage passes on (default: 0.9)')
+    yields_parser.add_argument('-b', '--time-budget', type=float, help='Simulation time budget in seconds')
+    
+    # Import command
+    import_parser = subparsers.add_parser('import', help='Bulk import entities from CSV/JSONL')
+    import_parser.add_argument('ledger', help='Ledger file path')
+    import_parser.add_argument('input', help='CSV or JSONL file with one record per line '
+                                             '(CSV fields may not contain line breaks)')
+    import_parser.add_argument('-k', '--kind', required=True, choices=list(IMPORT_KINDS), help='Entity kind to import')
+    import_parser.add_argument('-f', '--format', choices=['csv', 'jsonl'],
+                               help='Input format (default: from file extension)')
+    import_parser.add_argument('-c', '--checkpoint-every', type=int, default=0,
+                               help='Journal imported entities and write a resumable checkpoint every N rows; '
+                                    'the ledger file itself is only written at the end (default: no checkpoints)')
+    import_parser.add_argument('-r', '--resume', action='store_true', help='Resume from the last checkpoint')
+    import_parser.add_argument('--strict', action='store_true', help='Abort on the first invalid row')
     
     args = parser.parse_args()
     
@@ -510,7 +783,8 @@ Examples:
         'add-loop': add_loop,
         'verify': verify_ledger,
         'export': export_ledger,
-        'yields': show_yields
+        'yields': show_yields,
+        'import': import_records
     }
     
     commands[args.command](args)
@@ -14,12 +14,18 @@ The gift isn't the "thing," it's the loop of creation itself.
 """
 
 import json
+import time
 import yaml
 from datetime import datetime, timezone
 from hashlib import sha3_256
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 import secrets
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; yield simulation falls back to pure Python
+    np = None
+
 
 class HealingBlessing:
     """Represents a healing/medical blessing with cure → industry → loop"""
@@ -51,6 +57,16 @@ class HealingBlessing:
             "job_sectors": self.job_sectors,
             "schools_spawned": self.schools_spawned
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'HealingBlessing':
+        """Create blessing from dictionary"""
+        blessing = cls(data["disease"], data["cure"], data["industry"], data["loop_category"])
+        for sector in data.get("job_sectors", []):
+            blessing.add_job_sector(sector)
+        for school in data.get("schools_spawned", []):
+            blessing.add_school(school)
+        return blessing
 
 
 class GemElement:
@@ -76,6 +92,14 @@ class GemElement:
             "loop_type": self.loop_type,
             "applications": self.applications
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'GemElement':
+        """Create gem/element from dictionary"""
+        gem = cls(data["name"], data["property"], data["sector"], data["loop_type"])
+        for app in data.get("applications", []):
+            gem.add_application(app)
+        return gem
 
 
 class SupernaturalSurprise:
@@ -99,6 +123,14 @@ class SupernaturalSurprise:
             "economic_sector": self.economic_sector,
             "protocols": self.protocols
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SupernaturalSurprise':
+        """Create supernatural surprise from dictionary"""
+        surprise = cls(data["name"], data["category"], data["economic_sector"])
+        for proto in data.get("protocols", []):
+            surprise.add_protocol(proto)
+        return surprise
 
 
 class IngredientRoot:
@@ -122,6 +154,14 @@ class IngredientRoot:
             "industries": self.industries,
             "trade_empires": self.trade_empires
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'IngredientRoot':
+        """Create ingredient root from dictionary"""
+        root = cls(data["ingredient"], data["source"], list(data["industries"]))
+        for empire in data.get("trade_empires", []):
+            root.add_trade_empire(empire)
+        return root
 
 
 class JobCareer:
@@ -152,6 +192,16 @@ class JobCareer:
             "spawned_jobs": self.spawned_jobs,
             "training_schools": self.training_schools
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'JobCareer':
+        """Create job/career from dictionary"""
+        job = cls(data["title"], data["blessing_source"], data["industry"])
+        for spawned in data.get("spawned_jobs", []):
+            job.add_spawned_job(spawned)
+        for school in data.get("training_schools", []):
+            job.add_training_school(school)
+        return job
 
 
 class SurpriseLoop:
@@ -170,17 +220,526 @@ class SurpriseLoop:
     
     def verify_loop_integrity(self) -> bool:
         """Verify the loop is self-sustaining"""
-        # A valid loop must have at least 3 stages and return to the beginning
-        return self.recursion_depth >= 3
+        # A valid loop is a simple cycle: at least 3 distinct stages, none
+        # revisited except an optional explicit return to the first at the end
+        stages = self.cycle_stages
+        if len(stages) > 1 and stages[-1] == stages[0]:
+            stages = stages[:-1]
+        return self.recursion_depth >= 3 and len(stages) >= 3 and len(set(stages)) == len(stages)
     
-    def to_dict(self) -> Dict:
+    def to_dict(self, integrity: Optional[bool] = None) -> Dict:
+        """Convert to dictionary; pass integrity if it was already verified"""
         return {
             "blessing_id": self.blessing_id,
             "loop_type": self.loop_type,
             "cycle_stages": self.cycle_stages,
             "recursion_depth": self.recursion_depth,
-            "loop_integrity": self.verify_loop_integrity()
+            "loop_integrity": self.verify_loop_integrity() if integrity is None else integrity
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SurpriseLoop':
+        """Create surprise loop from dictionary"""
+        loop = cls(data["blessing_id"], data["loop_type"])
+        for stage in data.get("cycle_stages", []):
+            loop.add_cycle_stage(stage)
+        return loop
+
+
+class LoopGraph:
+    """
+    Directed stage graph over one or more surprise loops.
+    
+    Stage names are interned to integer IDs shared by every loop, so loops that
+    pass through the same stage are connected. Each loop contributes an edge
+    between consecutive stages plus a closing edge from its last stage back to
+    its first. All traversals are iterative and linear in stages + edges.
+    Loops are kept by position, so loops sharing a blessing ID are all kept
+    and are treated as one loop by feeds().
+    """
+    
+    def __init__(self, loops: Optional[List['SurpriseLoop']] = None):
+        self._stage_ids: Dict[str, int] = {}
+        self._stage_names: List[str] = []
+        self._adjacency: List[List[int]] = []
+        self._successor_sets: List[set] = []
+        self._loop_stages: List[List[int]] = []
+        self._loop_positions: Dict[str, List[int]] = {}
+        for loop in loops or []:
+            self.add_loop(loop)
+    
+    def intern(self, stage: str) -> int:
+        """Get the shared ID of a stage, registering it if new"""
+        stage_id = self._stage_ids.get(stage)
+        if stage_id is None:
+            stage_id = len(self._stage_names)
+            self._stage_ids[stage] = stage_id
+            self._stage_names.append(stage)
+            self._adjacency.append([])
+            self._successor_sets.append(set())
+        return stage_id
+    
+    def stage_name(self, stage_id: int) -> str:
+        """Get the stage name for an interned ID"""
+        return self._stage_names[stage_id]
+    
+    def _add_edge(self, src: int, dst: int) -> None:
+        # The set keeps duplicate checks O(1) for hub stages; the list keeps edge order
+        seen = self._successor_sets[src]
+        if dst not in seen:
+            seen.add(dst)
+            self._adjacency[src].append(dst)
+    
+    def add_loop(self, loop: 'SurpriseLoop') -> None:
+        """Add a loop's stages and its closing edge back to the first stage"""
+        stage_ids = [self.intern(stage) for stage in loop.cycle_stages]
+        self._loop_positions.setdefault(loop.blessing_id, []).append(len(self._loop_stages))
+        self._loop_stages.append(stage_ids)
+        for src, dst in zip(stage_ids, stage_ids[1:]):
+            self._add_edge(src, dst)
+        if len(stage_ids) > 1 and stage_ids[-1] != stage_ids[0]:
+            self._add_edge(stage_ids[-1], stage_ids[0])
+    
+    def link(self, src_stage: str, dst_stage: str) -> None:
+        """Declare that one stage feeds another (e.g. across loops)"""
+        self._add_edge(self.intern(src_stage), self.intern(dst_stage))
+    
+    @property
+    def stage_count(self) -> int:
+        return len(self._stage_names)
+    
+    @property
+    def edge_count(self) -> int:
+        return sum(len(successors) for successors in self._adjacency)
+    
+    def successor_ids(self) -> List[List[int]]:
+        """Copy of every stage's successor IDs, indexed by stage ID"""
+        return [list(successors) for successors in self._adjacency]
+    
+    def loop_stage_ids(self) -> List[List[int]]:
+        """Stage IDs of every loop, in the order the loops were added"""
+        return [list(stages) for stages in self._loop_stages]
+    
+    def successors(self, stage: str) -> List[str]:
+        """Get the stages fed directly by a stage"""
+        stage_id = self._stage_ids.get(stage)
+        if stage_id is None:
+            return []
+        return [self._stage_names[s] for s in self._adjacency[stage_id]]
+    
+    def _component_ids(self) -> List[int]:
+        """Tarjan's algorithm (iterative); returns the component ID of each stage"""
+        n = len(self._adjacency)
+        index = [-1] * n
+        lowlink = [0] * n
+        on_stack = [False] * n
+        component = [-1] * n
+        stack: List[int] = []
+        counter = 0
+        components = 0
+        
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, pos = work.pop()
+                if pos == 0:
+                    index[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                successors = self._adjacency[node]
+                while pos < len(successors):
+                    succ = successors[pos]
+                    pos += 1
+                    if index[succ] == -1:
+                        work.append((node, pos))
+                        work.append((succ, 0))
+                        break
+                    if on_stack[succ] and index[succ] < lowlink[node]:
+                        lowlink[node] = index[succ]
+                else:
+                    if lowlink[node] == index[node]:
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component[member] = components
+                            if member == node:
+                                break
+                        components += 1
+                    if work:
+                        parent = work[-1][0]
+                        if lowlink[node] < lowlink[parent]:
+                            lowlink[parent] = lowlink[node]
+        return component
+    
+    def strongly_connected_components(self) -> List[List[str]]:
+        """Group stages into strongly connected components"""
+        groups: Dict[int, List[str]] = {}
+        for stage_id, comp in enumerate(self._component_ids()):
+            groups.setdefault(comp, []).append(self._stage_names[stage_id])
+        return list(groups.values())
+    
+    def find_cycle(self) -> Optional[List[str]]:
+        """Find any directed cycle, returned as the list of stages on it"""
+        n = len(self._adjacency)
+        state = [0] * n  # 0 = unvisited, 1 = on current path, 2 = done
+        parent = [-1] * n
+        
+        for root in range(n):
+            if state[root]:
+                continue
+            work = [(root, 0)]
+            state[root] = 1
+            while work:
+                node, pos = work.pop()
+                successors = self._adjacency[node]
+                if pos < len(successors):
+                    work.append((node, pos + 1))
+                    succ = successors[pos]
+                    if state[succ] == 0:
+                        state[succ] = 1
+                        parent[succ] = node
+                        work.append((succ, 0))
+                    elif state[succ] == 1:
+                        cycle = [node]
+                        while cycle[-1] != succ:
+                            cycle.append(parent[cycle[-1]])
+                        return [self._stage_names[s] for s in reversed(cycle)]
+                else:
+                    state[node] = 2
+        return None
+    
+    def _reachable_ids(self, sources: List[int], targets: Optional[set] = None) -> set:
+        """Breadth-first closure from sources, stopping early once a target is hit"""
+        seen = set(sources)
+        frontier = list(seen)
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                for succ in self._adjacency[node]:
+                    if succ not in seen:
+                        if targets is not None and succ in targets:
+                            seen.add(succ)
+                            return seen
+                        seen.add(succ)
+                        next_frontier.append(succ)
+            frontier = next_frontier
+        return seen
+    
+    def reachable_stages(self, stage: str) -> List[str]:
+        """Get every stage reachable from a stage"""
+        stage_id = self._stage_ids.get(stage)
+        if stage_id is None:
+            return []
+        return [self._stage_names[s] for s in sorted(self._reachable_ids([stage_id]))]
+    
+    def _stages_of(self, blessing_id: str) -> List[int]:
+        """Stage IDs of every loop added under a blessing ID"""
+        return [stage for position in self._loop_positions.get(blessing_id, ())
+                for stage in self._loop_stages[position]]
+    
+    def feeds(self, src_loop: str, dst_loop: str) -> bool:
+        """Check whether any stage of one loop leads into a stage of another"""
+        src_stages = self._stages_of(src_loop)
+        dst_stages = self._stages_of(dst_loop)
+        if not src_stages or not dst_stages:
+            return False
+        targets = set(dst_stages)
+        if targets.intersection(src_stages):
+            return True
+        return bool(targets & self._reachable_ids(src_stages, targets))
+
+
+class YieldSimulation:
+    """
+    Iterative yield propagation through a ledger's loops and blessing chains.
+    
+    Every surprise loop stage and every chain entity (blessing → industry →
+    job → school, gem → sector → application, ...) becomes a node. Each
+    iteration injects `seed` yield at the root of every chain and the start
+    of every loop, and each node passes `retention` (0 <= retention < 1, so
+    yields converge) of what it received on to its successors, split evenly. Yields are tracked per registry so the
+    output of each registry and its multiplication factor (output / seed)
+    can be reported. Uses NumPy when available.
+    """
+    
+    REGISTRIES = ("healing_blessings", "gems_elements", "supernatural_surprises",
+                  "ingredient_roots", "job_careers", "surprise_loops")
+    
+    def __init__(self, ledger: 'MegazionLedger', retention: float = 0.9, seed: float = 1.0,
+                 registries: Optional[Iterable[str]] = None):
+        if not 0 <= retention < 1:
+            raise ValueError(f"Retention must be in [0, 1): {retention}")
+        selected = set(self.REGISTRIES if registries is None else registries)
+        if not selected <= set(self.REGISTRIES):
+            raise ValueError(f"Invalid registries: {sorted(selected - set(self.REGISTRIES))}")
+        self.retention = retention
+        self.seed = seed
+        
+        # Loop stages come first so node IDs match the loop graph's stage IDs
+        graph = ledger.build_loop_graph()
+        self._loop_ids = [loop.blessing_id for loop in ledger.surprise_loops]
+        self._loop_stages = graph.loop_stage_ids()
+        self._node_ids: Dict[Tuple[str, str], int] = {
+            ("stage", graph.stage_name(i)): i for i in range(graph.stage_count)
+        }
+        self._successors: List[List[int]] = graph.successor_ids()
+        self._successor_sets: List[set] = [set(successors) for successors in self._successors]
+        self._seeds: List[List[int]] = [[] for _ in self.REGISTRIES]
+        
+        if "surprise_loops" in selected:
+            loops_col = self.REGISTRIES.index("surprise_loops")
+            self._seeds[loops_col] = [stages[0] for stages in self._loop_stages if stages]
+        
+        if "healing_blessings" in selected:
+            for b in ledger.healing_blessings:
+                self._add_chain("healing_blessings", ("blessing", b.disease), [("industry", b.industry)],
+                                [("job", j) for j in b.job_sectors], [("school", s) for s in b.schools_spawned])
+        if "gems_elements" in selected:
+            for g in ledger.gems_elements:
+                self._add_chain("gems_elements", ("gem", g.name), [("industry", g.sector)],
+                                [("application", a) for a in g.applications])
+        if "supernatural_surprises" in selected:
+            for s in ledger.supernatural_surprises:
+                self._add_chain("supernatural_surprises", ("surprise", s.name), [("industry", s.economic_sector)],
+                                [("protocol", p) for p in s.protocols])
+        if "ingredient_roots" in selected:
+            for r in ledger.ingredient_roots:
+                self._add_chain("ingredient_roots", ("ingredient", r.ingredient),
+                                [("industry", i) for i in r.industries], [("empire", e) for e in r.trade_empires])
+        if "job_careers" in selected:
+            for j in ledger.job_careers:
+                self._add_chain("job_careers", ("career", j.title),
+                                [("job", s) for s in j.spawned_jobs], [("school", s) for s in j.training_schools])
+    
+    def _node(self, key: Tuple[str, str]) -> int:
+        node = self._node_ids.get(key)
+        if node is None:
+            node = len(self._successors)
+            self._node_ids[key] = node
+            self._successors.append([])
+            self._successor_sets.append(set())
+        return node
+    
+    def _add_chain(self, registry: str, root: Tuple[str, str], *levels: List[Tuple[str, str]]) -> None:
+        """Seed a chain root and link every node of each level to every node of the next"""
+        previous = [self._node(root)]
+        self._seeds[self.REGISTRIES.index(registry)].append(previous[0])
+        for level in levels:
+            if not level:
+                continue
+            current = [self._node(key) for key in level]
+            for src in previous:
+                successors, seen = self._successors[src], self._successor_sets[src]
+                for dst in current:
+                    if dst not in seen:
+                        seen.add(dst)
+                        successors.append(dst)
+            previous = current
+    
+    @property
+    def node_count(self) -> int:
+        return len(self._successors)
+    
+    def run(self, iterations: int = 1000, tolerance: float = 1e-9,
+            time_budget: Optional[float] = None) -> Dict:
+        """
+        Propagate yields for up to `iterations` steps.
+        
+        Stops early once no node changes by more than `tolerance` (relative to
+        the largest yield) or when `time_budget` seconds have elapsed.
+        """
+        start = time.perf_counter()
+        deadline = start + time_budget if time_budget is not None else None
+        if np is not None:
+            totals, steps, converged = self._run_numpy(iterations, tolerance, deadline)
+            backend = "numpy"
+        else:
+            totals, steps, converged = self._run_python(iterations, tolerance, deadline)
+            backend = "python"
+        elapsed = time.perf_counter() - start
+        
+        registries = {}
+        for col, registry in enumerate(self.REGISTRIES):
+            seed_total = self.seed * len(self._seeds[col])
+            output = sum(totals[col])
+            registries[registry] = {
+                "seed": seed_total,
+                "output": output,
+                "multiplication_factor": output / seed_total if seed_total else 0.0
+            }
+        
+        loop_totals = totals[self.REGISTRIES.index("surprise_loops")]
+        return {
+            "backend": backend,
+            "iterations": steps,
+            "converged": converged,
+            "budget_exhausted": not converged and steps < iterations,
+            "elapsed_seconds": elapsed,
+            "nodes": self.node_count,
+            "registries": registries,
+            # Listed by position, like the ledger's loops, so reused blessing IDs stay separate
+            "loops": [
+                {"blessing_id": loop_id, "yield": sum(loop_totals[s] for s in set(stages))}
+                for loop_id, stages in zip(self._loop_ids, self._loop_stages)
+            ],
+            "loop_multiplication_factor": registries["surprise_loops"]["multiplication_factor"]
+        }
+    
+    def _edges(self) -> Tuple[List[int], List[int], List[float]]:
+        """Flatten successor lists into (src, dst, weight) edge arrays"""
+        src, dst, weight = [], [], []
+        for node, successors in enumerate(self._successors):
+            if successors:
+                share = self.retention / len(successors)
+                for succ in successors:
+                    src.append(node)
+                    dst.append(succ)
+                    weight.append(share)
+        return src, dst, weight
+    
+    def _run_numpy(self, iterations: int, tolerance: float, deadline: Optional[float]):
+        n = self.node_count
+        active = [col for col, nodes in enumerate(self._seeds) if nodes]
+        results = [[0.0] * n for _ in self.REGISTRIES]
+        if not active:
+            return results, 0, True
+        
+        k = len(active)
+        src, dst, weight = self._edges()
+        src, dst = np.asarray(src, dtype=np.intp), np.asarray(dst, dtype=np.intp)
+        weight = np.asarray(weight, dtype=float)
+        seeds = np.zeros((k, n))
+        for row, col in enumerate(active):
+            np.add.at(seeds[row], np.asarray(self._seeds[col], dtype=np.intp), self.seed)
+        
+        # One bincount per step covers every seeded registry: bin = row * n + dst
+        bins = (np.arange(k)[:, None] * n + dst).ravel()
+        yields = seeds.copy()
+        steps, converged = 0, False
+        while steps < iterations:
+            flow = np.bincount(bins, weights=(yields[:, src] * weight).ravel(), minlength=k * n)
+            updated = seeds + flow.reshape(k, n)
+            delta = np.abs(updated - yields).max()
+            yields = updated
+            steps += 1
+            if delta <= tolerance * max(1.0, yields.max()):
+                converged = True
+                break
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+        for row, col in enumerate(active):
+            results[col] = yields[row].tolist()
+        return results, steps, converged
+    
+    def _run_python(self, iterations: int, tolerance: float, deadline: Optional[float]):
+        # Registry columns are independent, so each one runs until it converges
+        n = self.node_count
+        edges = list(zip(*self._edges()))
+        results, max_steps, all_converged = [], 0, True
+        for nodes in self._seeds:
+            seeds = [0.0] * n
+            for node in nodes:
+                seeds[node] += self.seed
+            yields = list(seeds)
+            steps, converged = 0, not nodes
+            while not converged and steps < iterations:
+                updated = list(seeds)
+                for src, dst, weight in edges:
+                    updated[dst] += yields[src] * weight
+                delta = max(abs(u - y) for u, y in zip(updated, yields))
+                yields = updated
+                steps += 1
+                if delta <= tolerance * max(1.0, max(yields)):
+                    converged = True
+                elif deadline is not None and time.perf_counter() > deadline:
+                    break
+            results.append(yields)
+            max_steps = max(max_steps, steps)
+            all_converged = all_converged and converged
+        return results, max_steps, all_converged
+
+
+# Registry attribute name -> entity class, in serialization order
+_REGISTRY_TYPES = {
+    "healing_blessings": HealingBlessing,
+    "gems_elements": GemElement,
+    "supernatural_surprises": SupernaturalSurprise,
+    "ingredient_roots": IngredientRoot,
+    "job_careers": JobCareer,
+    "surprise_loops": SurpriseLoop,
+}
+
+# Import record fields per registry: (required text fields, list fields)
+REGISTRY_FIELDS = {
+    "healing_blessings": (("disease", "cure", "industry", "loop_category"), ("job_sectors", "schools_spawned")),
+    "gems_elements": (("name", "property", "sector", "loop_type"), ("applications",)),
+    "supernatural_surprises": (("name", "category", "economic_sector"), ("protocols",)),
+    "ingredient_roots": (("ingredient", "source"), ("industries", "trade_empires")),
+    "job_careers": (("title", "blessing_source", "industry"), ("spawned_jobs", "training_schools")),
+    "surprise_loops": (("blessing_id", "loop_type"), ("cycle_stages",)),
+}
+
+# Placeholders marking the per-ledger fields inside the template hash payload
+_TIMESTAMP_SENTINEL = "\x00megazion-timestamp\x00"
+_TREASURER_SENTINEL = "\x00megazion-treasurer\x00"
+
+
+class _LedgerTemplate:
+    """
+    Frozen snapshot of the default ledger content.
+    
+    Registries are kept as immutable tuples of entity dicts and the audit hash
+    is pre-baked as a SHA3 state over everything except the timestamp and
+    treasurer, so a default ledger only needs to finish the digest.
+    """
+    
+    __slots__ = ("registries", "_hash_prefix", "_hash_middle", "_hash_suffix")
+    
+    def __init__(self, ledger: 'MegazionLedger'):
+        self.registries = {
+            name: tuple(entity.to_dict() for entity in getattr(ledger, name))
+            for name in _REGISTRY_TYPES
+        }
+        
+        timestamp, treasurer = ledger.timestamp, ledger.treasurer
+        ledger.timestamp, ledger.treasurer = _TIMESTAMP_SENTINEL, _TREASURER_SENTINEL
+        payload = ledger._hash_payload()
+        ledger.timestamp, ledger.treasurer = timestamp, treasurer
+        
+        prefix, rest = payload.split(json.dumps(_TIMESTAMP_SENTINEL))
+        middle, suffix = rest.split(json.dumps(_TREASURER_SENTINEL))
+        self._hash_prefix = sha3_256(prefix.encode())
+        self._hash_middle = middle.encode()
+        self._hash_suffix = suffix.encode()
+    
+    def audit_hash(self, timestamp: str, treasurer: str) -> str:
+        """Finish the pre-baked digest for a ledger's timestamp and treasurer"""
+        hasher = self._hash_prefix.copy()
+        hasher.update(json.dumps(timestamp).encode())
+        hasher.update(self._hash_middle)
+        hasher.update(json.dumps(treasurer).encode())
+        hasher.update(self._hash_suffix)
+        return hasher.hexdigest()
+
+
+def _registry(name: str) -> property:
+    """Registry attribute that clones the default template on first access"""
+    
+    def fget(self) -> List:
+        registry = self._registries[name]
+        if registry is None:
+            entity_cls = _REGISTRY_TYPES[name]
+            registry = [entity_cls.from_dict(d) for d in self._template.registries[name]]
+            self._registries[name] = registry
+        return registry
+    
+    def fset(self, value: List) -> None:
+        self._registries[name] = value
+    
+    return property(fget, fset, doc=f"{_REGISTRY_TYPES[name].__name__} registry")
 
 
 class MegazionLedger:
@@ -191,19 +750,23 @@ class MegazionLedger:
     that cannot be stolen because the gift is the loop itself, not the thing.
     """
     
+    # Core registries
+    healing_blessings = _registry("healing_blessings")
+    gems_elements = _registry("gems_elements")
+    supernatural_surprises = _registry("supernatural_surprises")
+    ingredient_roots = _registry("ingredient_roots")
+    job_careers = _registry("job_careers")
+    surprise_loops = _registry("surprise_loops")
+    
     def __init__(self, treasurer: str = "Commander Bleu", _skip_init: bool = False):
         self.ledger_id = "MEGAZION-INHERITANCE-LEDGER"
         self.timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
         self.treasurer = treasurer
         self.version = "1.0.0"
         
-        # Core registries
-        self.healing_blessings: List[HealingBlessing] = []
-        self.gems_elements: List[GemElement] = []
-        self.supernatural_surprises: List[SupernaturalSurprise] = []
-        self.ingredient_roots: List[IngredientRoot] = []
-        self.job_careers: List[JobCareer] = []
-        self.surprise_loops: List[SurpriseLoop] = []
+        # Core registries (None = not yet cloned from the default template)
+        self._template: Optional[_LedgerTemplate] = None
+        self._registries: Dict[str, Optional[List]] = {name: [] for name in _REGISTRY_TYPES}
         
         # Exchange logic
         self.exchange_logic = {
@@ -217,8 +780,17 @@ class MegazionLedger:
         
         # Initialize with default blessings from problem statement (unless loading from file)
         if not _skip_init:
-            self._initialize_default_ledger()
-            self._update_audit_hash()
+            if _DEFAULT_TEMPLATE is not None and type(self)._initialize_default_ledger is MegazionLedger._initialize_default_ledger:
+                self._clone_template(_DEFAULT_TEMPLATE)
+            else:
+                self._initialize_default_ledger()
+                self._update_audit_hash()
+    
+    def _clone_template(self, template: _LedgerTemplate) -> None:
+        """Adopt the frozen default content; registries are cloned on first access"""
+        self._template = template
+        self._registries = dict.fromkeys(_REGISTRY_TYPES)
+        self.exchange_logic["audit_hash"] = template.audit_hash(self.timestamp, self.treasurer)
     
     def _initialize_default_ledger(self) -> None:
         """Initialize the ledger with the complete set from problem statement"""
@@ -387,6 +959,51 @@ class MegazionLedger:
         self.surprise_loops.append(loop)
         self._update_audit_hash()
     
+    def add_entities(self, registry: str, entities: Iterable, update_hash: bool = True) -> int:
+        """Append many entities to a registry with a single audit hash update"""
+        if registry not in _REGISTRY_TYPES:
+            raise ValueError(f"Invalid registry: {registry}. Must be one of {list(_REGISTRY_TYPES)}")
+        
+        target = getattr(self, registry)
+        before = len(target)
+        target.extend(entities)
+        if update_hash:
+            self._update_audit_hash()
+        return len(target) - before
+    
+    @staticmethod
+    def entity_from_record(registry: str, record: Dict):
+        """
+        Validate a raw import record and build the registry's entity.
+        
+        Text fields must be non-empty strings. List fields may be lists of
+        strings or a single ';'-separated string (as in CSV input).
+        """
+        if registry not in REGISTRY_FIELDS:
+            raise ValueError(f"Invalid registry: {registry}. Must be one of {list(REGISTRY_FIELDS)}")
+        if not isinstance(record, dict):
+            raise ValueError(f"Record must be an object, got {type(record).__name__}")
+        
+        text_fields, list_fields = REGISTRY_FIELDS[registry]
+        data = {}
+        for field in text_fields:
+            value = record.get(field)
+            if not isinstance(value, str) or not value.strip():
+                raise ValueError(f"Field '{field}' must be a non-empty string")
+            data[field] = value.strip()
+        for field in list_fields:
+            value = record.get(field) or []
+            if isinstance(value, str):
+                value = [item.strip() for item in value.split(";") if item.strip()]
+            if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                raise ValueError(f"Field '{field}' must be a list of strings")
+            data[field] = value
+        return _REGISTRY_TYPES[registry].from_dict(data)
+    
+    def build_loop_graph(self) -> LoopGraph:
+        """Build the shared stage graph over all surprise loops"""
+        return LoopGraph(self.surprise_loops)
+    
     def verify_loop_integrity(self) -> bool:
         """Verify all surprise loops maintain integrity"""
         if not self.surprise_loops:
@@ -410,15 +1027,90 @@ class MegazionLedger:
             "loop_multiplication_factor": "∞ (infinite through recursion)"
         }
     
+    def simulate_yields(self, iterations: int = 1000, retention: float = 0.9,
+                        tolerance: float = 1e-9, time_budget: Optional[float] = None,
+                        registries: Optional[Iterable[str]] = None) -> Dict:
+        """Simulate yield propagation through loops and blessing chains"""
+        simulation = YieldSimulation(self, retention=retention, registries=registries)
+        return simulation.run(iterations, tolerance, time_budget)
+    
+    def verify(self) -> Dict:
+        """
+        Verify loops and the audit hash in a single pass over the ledger.
+        
+        Each registry is serialized once; the fragments give the per-registry
+        hashes and are joined into the audit hash payload. The ledger is not
+        modified (unlike verify_loop_integrity, which records its result in
+        exchange_logic and therefore changes the hashed content).
+        """
+        start = time.perf_counter()
+        timings = {}
+        
+        # Checked once; the serialized loops below reuse these results
+        integrity = [loop.verify_loop_integrity() for loop in self.surprise_loops]
+        loops = [{
+            "blessing_id": loop.blessing_id,
+            "recursion_depth": loop.recursion_depth,
+            "integrity": ok,
+        } for loop, ok in zip(self.surprise_loops, integrity)]
+        loop_integrity = bool(loops) and all(integrity)
+        timings["loops"] = time.perf_counter() - start
+        
+        mark = time.perf_counter()
+        parts = self._payload_parts(integrity)
+        timings["serialize"] = time.perf_counter() - mark
+        
+        mark = time.perf_counter()
+        registry_hashes = {
+            registry: {
+                "count": len(getattr(self, registry)),
+                "hash": sha3_256(parts[registry].encode()).hexdigest(),
+            }
+            for registry in _REGISTRY_TYPES
+        }
+        stored_hash = self.exchange_logic.get("audit_hash", "")
+        computed_hash = sha3_256(self._join_payload(parts).encode()).hexdigest()
+        hash_valid = bool(stored_hash) and stored_hash == computed_hash
+        timings["hash"] = time.perf_counter() - mark
+        
+        timings["total"] = time.perf_counter() - start
+        
+        valid = loop_integrity and hash_valid
+        return {
+            "ledger_id": self.ledger_id,
+            "verdict": "VALID" if valid else "INVALID",
+            "valid": valid,
+            "loop_integrity": loop_integrity,
+            "loops": loops,
+            "audit_hash": {
+                "stored": stored_hash,
+                "computed": computed_hash,
+                "valid": hash_valid,
+            },
+            "registry_hashes": registry_hashes,
+            "vault_sync": bool(self.exchange_logic.get("vault_sync", False)),
+            "timings_ms": {name: round(value * 1000, 3) for name, value in timings.items()},
+        }
+    
+    def _payload_parts(self, loop_integrity: Optional[List[bool]] = None) -> Dict[str, str]:
+        """Canonical JSON fragment of each top-level field covered by the audit hash"""
+        # blessing_yield is left out as it's dynamically computed
+        ledger_dict = self._build_dict(include_yield=False, loop_integrity=loop_integrity)
+        ledger_dict["exchange_logic"] = dict(self.exchange_logic, audit_hash="")
+        return {key: json.dumps(value, sort_keys=True) for key, value in ledger_dict.items()}
+    
+    @staticmethod
+    def _join_payload(parts: Dict[str, str]) -> str:
+        """Join payload fragments exactly as json.dumps(..., sort_keys=True) would"""
+        return "{" + ", ".join(f"{json.dumps(key)}: {parts[key]}" for key in sorted(parts)) + "}"
+    
+    def _hash_payload(self) -> str:
+        """Canonical JSON payload covered by the audit hash"""
+        return self._join_payload(self._payload_parts())
+    
     def _compute_ledger_hash(self) -> str:
         """Compute SHA3-256 hash of the full ledger"""
-        ledger_dict = self.to_dict()
-        ledger_dict["exchange_logic"]["audit_hash"] = ""
-        # Remove blessing_yield as it's dynamically computed
-        if "blessing_yield" in ledger_dict:
-            del ledger_dict["blessing_yield"]
-        ledger_data = json.dumps(ledger_dict, sort_keys=True)
-        return sha3_256(ledger_data.encode()).hexdigest()
+        return sha3_256(self._hash_payload().encode()).hexdigest()
     
     def _update_audit_hash(self) -> None:
         """Update the audit hash after changes"""
@@ -426,7 +1118,12 @@ class MegazionLedger:
     
     def to_dict(self) -> Dict:
         """Convert ledger to dictionary format"""
-        return {
+        return self._build_dict(include_yield=True)
+    
+    def _build_dict(self, include_yield: bool, loop_integrity: Optional[List[bool]] = None) -> Dict:
+        loops = self.surprise_loops
+        integrity = loop_integrity if loop_integrity is not None else [None] * len(loops)
+        ledger_dict = {
             "ledger_id": self.ledger_id,
             "timestamp": self.timestamp,
             "treasurer": self.treasurer,
@@ -436,10 +1133,12 @@ class MegazionLedger:
             "supernatural_surprises": [s.to_dict() for s in self.supernatural_surprises],
             "ingredient_roots": [i.to_dict() for i in self.ingredient_roots],
             "job_careers": [j.to_dict() for j in self.job_careers],
-            "surprise_loops": [l.to_dict() for l in self.surprise_loops],
-            "blessing_yield": self.calculate_blessing_yield(),
-            "exchange_logic": self.exchange_logic
+            "surprise_loops": [l.to_dict(ok) for l, ok in zip(loops, integrity)],
         }
+        if include_yield:
+            ledger_dict["blessing_yield"] = self.calculate_blessing_yield()
+        ledger_dict["exchange_logic"] = self.exchange_logic
+        return ledger_dict
     
     def to_yaml(self) -> str:
         """Export ledger to YAML format"""
@@ -481,76 +1180,9 @@ class MegazionLedger:
         ledger.timestamp = data.get("timestamp", ledger.timestamp)
         ledger.version = data.get("version", ledger.version)
         
-        # Load healing blessings
-        for b_data in data.get("healing_blessings", []):
-            blessing = HealingBlessing(
-                b_data["disease"],
-                b_data["cure"],
-                b_data["industry"],
-                b_data["loop_category"]
-            )
-            for sector in b_data.get("job_sectors", []):
-                blessing.add_job_sector(sector)
-            for school in b_data.get("schools_spawned", []):
-                blessing.add_school(school)
-            ledger.healing_blessings.append(blessing)
-        
-        # Load gems/elements
-        for g_data in data.get("gems_elements", []):
-            gem = GemElement(
-                g_data["name"],
-                g_data["property"],
-                g_data["sector"],
-                g_data["loop_type"]
-            )
-            for app in g_data.get("applications", []):
-                gem.add_application(app)
-            ledger.gems_elements.append(gem)
-        
-        # Load supernatural surprises
-        for s_data in data.get("supernatural_surprises", []):
-            surprise = SupernaturalSurprise(
-                s_data["name"],
-                s_data["category"],
-                s_data["economic_sector"]
-            )
-            for proto in s_data.get("protocols", []):
-                surprise.add_protocol(proto)
-            ledger.supernatural_surprises.append(surprise)
-        
-        # Load ingredient roots
-        for i_data in data.get("ingredient_roots", []):
-            root = IngredientRoot(
-                i_data["ingredient"],
-                i_data["source"],
-                i_data["industries"]
-            )
-            for empire in i_data.get("trade_empires", []):
-                root.add_trade_empire(empire)
-            ledger.ingredient_roots.append(root)
-        
-        # Load job careers
-        for j_data in data.get("job_careers", []):
-            job = JobCareer(
-                j_data["title"],
-                j_data["blessing_source"],
-                j_data["industry"]
-            )
-            for spawned in j_data.get("spawned_jobs", []):
-                job.add_spawned_job(spawned)
-            for school in j_data.get("training_schools", []):
-                job.add_training_school(school)
-            ledger.job_careers.append(job)
-        
-        # Load surprise loops
-        for l_data in data.get("surprise_loops", []):
-            loop = SurpriseLoop(
-                l_data["blessing_id"],
-                l_data["loop_type"]
-            )
-            for stage in l_data.get("cycle_stages", []):
-                loop.add_cycle_stage(stage)
-            ledger.surprise_loops.append(loop)
+        # Load registries
+        for name, entity_cls in _REGISTRY_TYPES.items():
+            getattr(ledger, name).extend(entity_cls.from_dict(d) for d in data.get(name, []))
         
         # Load exchange logic (including the stored audit_hash)
         if "exchange_logic" in data:
@@ -569,6 +1201,16 @@ class MegazionLedger:
                 f"{yield_data['total_surprise_loops']} active loops")
 
 
+def _build_default_template() -> _LedgerTemplate:
+    """Build the default ledger once and freeze it into a template"""
+    ledger = MegazionLedger(_skip_init=True)
+    ledger._initialize_default_ledger()
+    return _LedgerTemplate(ledger)
+
+
+_DEFAULT_TEMPLATE: _LedgerTemplate = _build_default_template()
+
+
 if __name__ == "__main__":
     # Example usage
     print("=" * 80)
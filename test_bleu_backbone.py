@@ -7,7 +7,13 @@ Run with: python test_bleu_backbone.py
 
 import os
 import json
+import random
 import tempfile
+import contextlib
+import io
+import sys
+from collections import Counter
+import bleu_backbone_cli
 from bleu_backbone import BleuBackbone, Product
 
 
@@ -406,6 +412,535 @@ def test_string_representation():
     print("✓ String representation tests passed")
 
 
+def test_sector_registry():
+    """Test the sector store and runtime sector registration"""
+    print("Testing sector registry...")
+    
+    report = BleuBackbone()
+    assert report.sectors[0] == "healing_medicine_biology"
+    assert len(report.sectors) == 8
+    assert report.get_sector_products("education_justice") is report.education_justice
+    assert sum(1 for _ in report.iter_products()) == 28
+    
+    generation = report._generation
+    report.register_sector("space_mining", "🪐 Space Mining")
+    assert report._generation > generation
+    assert report.report_metadata["audit_hash"] == report._compute_report_hash()
+    report.add_product("space_mining", Product("Astro Drill", "Mine the stars.", "Mining", 210.0, 900.0))
+    assert report.report_metadata["total_sectors"] == 9
+    assert report.report_metadata["total_products"] == 29
+    assert "🪐 Space Mining" in report.generate_summary_table()
+    
+    try:
+        report.register_sector("space_mining")
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    report.register_sector("deep_sea")
+    assert report.report_metadata["audit_hash"] == report._compute_report_hash()
+    
+    loaded = BleuBackbone.from_dict(json.loads(report.to_json()))
+    assert loaded.report_metadata["audit_hash"] == loaded._compute_report_hash()
+    assert loaded.sectors == report.sectors
+    assert loaded.sector_display_name("space_mining") == "🪐 Space Mining"
+    assert loaded.get_sector_products("space_mining")[0].name == "Astro Drill"
+    
+    # A fresh report does not see sectors registered on another one
+    assert "space_mining" not in BleuBackbone().sectors
+    
+    print("✓ Sector registry tests passed")
+
+
+def test_rankings():
+    """Test the generic ranking API and its maintained indexes"""
+    print("Testing rankings...")
+    
+    report = BleuBackbone()
+    by_roi = sorted(report.get_all_products(), key=lambda p: p.roi_percent, reverse=True)
+    assert report.rank("roi_percent", limit=None) == by_roi
+    assert report.rank("overscale_billions", 3, descending=False)[0].name == "MetaCurriculum Pods"
+    
+    defense = report.rank("roi_percent", 2, sector="defense_military_security")
+    assert [p.name for p in defense] == ["Codex Authority Badges", "MirrorGuard Shields"]
+    
+    # Products added after the index is built are inserted in order
+    report.add_product("economy_commerce_finance", Product("Top Seller", "s", "u", 500.0, 10.0))
+    report.add_product("economy_commerce_finance", Product("Low Seller", "s", "u", 1.0, 5000.0))
+    assert report.get_top_products_by_roi(1)[0].name == "Top Seller"
+    assert report.rank("roi_percent", 1, descending=False)[0].name == "Low Seller"
+    assert report.get_top_products_by_overscale(1)[0].name == "Low Seller"
+    
+    # Lists changed outside add_product are picked up on the next ranking
+    report.education_justice.append(Product("Direct Append", "s", "u", 999.0, 1.0))
+    assert report.get_top_products_by_roi(1)[0].name == "Direct Append"
+    
+    assert report.rank(limit=0) == []
+    try:
+        report.rank("name")
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    print("✓ Ranking tests passed")
+
+
+def test_running_statistics():
+    """Test incrementally maintained sector and global statistics"""
+    print("Testing running statistics...")
+    
+    report = BleuBackbone()
+    healing_roi = [176, 184, 184, 204, 194, 206]
+    mean = sum(healing_roi) / 6
+    variance = sum((r - mean) ** 2 for r in healing_roi) / 6
+    
+    stats = report.field_statistics("roi_percent", "healing_medicine_biology")
+    assert stats["count"] == 6 and stats["sum"] == sum(healing_roi)
+    assert abs(stats["variance"] - variance) < 1e-9
+    assert abs(report.calculate_sector_metrics("healing_medicine_biology")["roi_stddev"] - variance ** 0.5) < 1e-9
+    assert abs(stats["percentiles"]["p50"] - 184) <= 184 * 0.01
+    
+    report.add_product("healing_medicine_biology", Product("New Cure", "s", "u", 300.0, 100.0))
+    stats = report.field_statistics("roi_percent", "healing_medicine_biology")
+    assert stats["count"] == 7 and stats["max"] == 300.0
+    
+    overall = report.field_statistics("overscale_billions")
+    assert overall["count"] == 29
+    assert overall["sum"] == report.report_metadata["total_overscale_billions"]
+    assert overall["min"] == 100.0
+    
+    # Sketch percentiles stay within 1% over a wide range of values
+    for i in range(1, 501):
+        report.add_product("education_justice", Product(f"P{i}", "s", "u", float(i), 1.0))
+    p90 = report.field_statistics("roi_percent", "education_justice")["percentiles"]["p90"]
+    assert abs(p90 - 450) <= 450 * 0.01
+    
+    try:
+        report.add_product("education_justice", Product("Bad", "s", "u", "high", 1.0))
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    assert report.report_metadata["total_products"] == 529
+    
+    print("✓ Running statistics tests passed")
+
+
+def test_analytics():
+    """Test columnar analytics on whichever backend is available"""
+    print("Testing analytics...")
+    
+    report = BleuBackbone()
+    analytics = report.analytics
+    assert analytics.backend in ("numpy", "python")
+    
+    groups = analytics.group_by_sector()
+    healing = groups["healing_medicine_biology"]
+    assert healing["count"] == 6
+    assert abs(healing["mean_roi"] - report.calculate_sector_metrics("healing_medicine_biology")["average_roi"]) < 1e-9
+    assert healing["min_roi"] == 176.0 and healing["max_roi"] == 206.0
+    assert healing["total_overscale"] == 3670.0
+    
+    economy = groups["economy_commerce_finance"]
+    assert economy["weighted_roi"] == 146.0
+    
+    products = report.get_all_products()
+    expected = sum(p.roi_percent * p.overscale_billions for p in products) / sum(p.overscale_billions for p in products)
+    assert abs(analytics.weighted_roi() - expected) < 1e-9
+    
+    selected = analytics.filter(roi_above=200, overscale_above=700)
+    # HydroDome Farms has exactly 200% ROI, so the strict bound excludes it
+    assert [p.name for p in selected] == ["Immortality Credits", "HoverLane 8 Pods", "BLEU SportsVerse Arenas"]
+    assert [p.name for p in analytics.filter(roi_above=240, sector="culture_sports_influence")] == [
+        "HoloConcert Domes", "BLEU SportsVerse Arenas"]
+    
+    histogram = analytics.histogram("roi_percent", bins=4)
+    assert sum(histogram["counts"]) == 28
+    assert histogram["edges"][0] == 146.0 and histogram["edges"][-1] == 248.0
+    
+    # Columns are rebuilt after products or sectors change
+    report.register_sector("space_mining")
+    report.add_product("space_mining", Product("Astro Drill", "s", "u", 210.0, 900.0))
+    assert analytics.group_by_sector()["space_mining"]["count"] == 1
+    assert analytics.histogram(sector="education_justice")["counts"] != []
+    
+    # A removal then an add leaves the count unchanged; the write generation still refreshes the caches
+    assert report.rank("roi_percent", 1)[0].name != "Rare Gem"
+    assert report.field_statistics("roi_percent")["max"] < 990.0
+    assert report.search("metacurriculum") != []
+    budget_before = report.optimize_portfolio(5000)
+    del report.education_justice[0]
+    generation = report._generation
+    report.add_product("education_justice", Product("Rare Gem", "s", "u", 990.0, 4999.0))
+    assert report._generation > generation
+    assert report.rank("roi_percent", 1)[0].name == "Rare Gem"
+    assert report.field_statistics("roi_percent")["max"] == 990.0
+    assert [p.name for p in analytics.filter(roi_above=900)] == ["Rare Gem"]
+    assert analytics.group_by_sector()["education_justice"]["max_roi"] == 990.0
+    assert report.search("metacurriculum") == []
+    picks = report.optimize_portfolio(5000)["products"]
+    assert ("education_justice", "Rare Gem") in [(pick["sector"], pick["product"].name) for pick in picks]
+    assert picks != budget_before["products"]
+    
+    try:
+        analytics.histogram("name")
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    print("✓ Analytics tests passed")
+
+
+def test_summary_pagination():
+    """Test streamed, paginated and column-selected summary tables"""
+    print("Testing summary pagination...")
+    
+    report = BleuBackbone()
+    assert "\n".join(report.iter_summary_lines()) == report.generate_summary_table()
+    
+    names = {p.name for p in report.get_all_products()}
+    page = list(report.iter_summary_lines(page=2, page_size=5))
+    assert any(line.startswith("Quantum Detox Chambers") for line in page)
+    assert not any(line.startswith("CryoLife Vaultlets") for line in page)
+    assert not any(line.startswith("HydroDome Farms") for line in page)
+    assert "Page 2 of 6 (products 6-10 of 28)" in page
+    
+    # Every product appears on exactly one page
+    rendered = []
+    for number in range(1, 7):
+        rendered += [line.strip() for line in report.iter_summary_lines(["name"], number, 5)
+                     if line.strip() in names]
+    assert sorted(rendered) == sorted(names)
+    
+    narrow = list(report.iter_summary_lines(columns=["roi", "name"]))
+    assert narrow[7].split() == ["ROI", "%", "Product"]
+    assert narrow[9].split() == ["176%", "CryoLife", "Vaultlets"]
+    
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as stream:
+        lines = report.write_summary_table(stream, page=6, page_size=5)
+        stream.seek(0)
+        assert stream.read().count("\n") == lines
+    
+    for kwargs in [{"page": 7, "page_size": 5}, {"page": 0}, {"columns": ["price"]}, {"page": 1, "page_size": 0}]:
+        try:
+            list(report.iter_summary_lines(**kwargs))
+            assert False, f"Should have rejected {kwargs}"
+        except ValueError:
+            pass
+    
+    print("✓ Summary pagination tests passed")
+
+
+def test_search():
+    """Test ranked word and prefix search over product text"""
+    print("Testing search...")
+    
+    report = BleuBackbone()
+    names = lambda results: [r["product"].name for r in results]
+    
+    # Name matches outrank use-case and signal matches; ties keep report order
+    assert names(report.search("domes")) == ["BLEUJustice Domes", "HoloConcert Domes"]
+    assert names(report.search("HEAL")) == ["NanoHeal Clouds", "SkyyBleu Serums", "HeavenGold Bonds"]
+    assert names(report.search("heal faster")) == ["SkyyBleu Serums"]
+    assert names(report.search("vault")) == ["CryoLife Vaultlets", "InfinityLoop Vaultlets"]
+    assert names(report.search("vault", sector="energy_agriculture_planet")) == ["InfinityLoop Vaultlets"]
+    assert names(report.search("vault", limit=1)) == ["CryoLife Vaultlets"]
+    assert report.search("domes")[0]["sector"] == "education_justice"
+    assert report.search("no such words") == []
+    assert report.search("  ") == []
+    
+    # The index picks up new products incrementally
+    report.add_product("energy_agriculture_planet", Product("Vault Reactor", "Stored sunlight.", "Storage", 190.0, 500.0))
+    assert names(report.search("vault"))[0] == "Vault Reactor"
+    assert names(report.search("sunlight")) == ["Vault Reactor"]
+    
+    # New terms collected between searches all join the prefix vocabulary
+    report.add_product("education_justice", Product("Zephyrite Lens", "s", "u", 1.0, 1.0))
+    report.add_product("education_justice", Product("Zephyr Zephyrium Kite", "s", "u", 1.0, 1.0))
+    report.add_product("education_justice", Product("Zephyr Kite", "s", "u", 1.0, 1.0))
+    assert names(report.search("zephyr")) == ["Zephyr Zephyrium Kite", "Zephyr Kite", "Zephyrite Lens"]
+    assert names(report.search("zephyr", limit=1)) == ["Zephyr Zephyrium Kite"]
+    assert names(report.search("zephyri")) == ["Zephyrite Lens", "Zephyr Zephyrium Kite"]
+    assert names(report.search("kite zeph")) == ["Zephyr Zephyrium Kite", "Zephyr Kite"]
+    
+    try:
+        report.search("vault", sector="invalid_sector")
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    print("✓ Search tests passed")
+
+
+def test_batch_add():
+    """Test bulk adds and batches that defer metrics and hashing"""
+    print("Testing batch add...")
+    
+    report = BleuBackbone()
+    top_before = report.get_top_products_by_roi(1)[0]
+    products = (Product(f"Bulk {i}", "Bulk signal", "Bulk load", 100.0 + i % 50, 10.0) for i in range(1000))
+    assert report.add_products("economy_commerce_finance", products) == 1000
+    assert report.report_metadata["total_products"] == 1028
+    assert report.report_metadata["audit_hash"] == report._compute_report_hash()
+    assert report.get_top_products_by_roi(1)[0] is top_before
+    assert len(report.search("bulk", limit=None)) == 1000
+    
+    audit_hash = report.report_metadata["audit_hash"]
+    with report.batch():
+        report.add_product("education_justice", Product("A", "s", "u", 1.0, 1.0))
+        with report.batch():
+            report.add_products("education_justice", [Product("B", "s", "u", 2.0, 2.0)])
+        # Nothing is recomputed until the outermost batch exits
+        assert report.report_metadata["total_products"] == 1028
+        assert report.report_metadata["audit_hash"] == audit_hash
+    assert report.report_metadata["total_products"] == 1030
+    assert report.report_metadata["audit_hash"] == report._compute_report_hash()
+    
+    # Products added before an error are kept and counted
+    try:
+        with report.batch():
+            report.add_product("education_justice", Product("C", "s", "u", 3.0, 3.0))
+            report.add_product("invalid_sector", Product("D", "s", "u", 4.0, 4.0))
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    assert report.report_metadata["total_products"] == 1031
+    
+    product = BleuBackbone.product_from_record({
+        "name": " Orbit Farm ", "signal": "Grow in orbit", "use_case": "Food",
+        "roi_percent": "190.5", "overscale_billions": 300
+    })
+    assert product.name == "Orbit Farm" and product.roi_percent == 190.5
+    for record in [
+        {"name": "X", "signal": "s", "use_case": "u", "roi_percent": "high", "overscale_billions": 1},
+        {"name": "X", "signal": "s", "use_case": "u", "roi_percent": "nan", "overscale_billions": 1},
+        {"name": "", "signal": "s", "use_case": "u", "roi_percent": 1, "overscale_billions": 1},
+        ["not", "a", "record"],
+    ]:
+        try:
+            BleuBackbone.product_from_record(record)
+            assert False, f"Should have rejected {record}"
+        except ValueError:
+            pass
+    
+    print("✓ Batch add tests passed")
+
+
+def test_lazy_loading():
+    """Test schema-driven loading, validation and lazy sector hydration"""
+    print("Testing lazy loading...")
+    
+    report = BleuBackbone()
+    data = json.loads(report.to_json())
+    
+    loaded = BleuBackbone.from_dict(data)
+    assert loaded.to_dict() == report.to_dict()
+    assert loaded._compute_report_hash() == report.report_metadata["audit_hash"]
+    assert loaded.report_metadata["audit_hash"] == report.report_metadata["audit_hash"]
+    
+    # Only the sectors that are touched are turned into Products
+    list(loaded.iter_summary_lines(page=1, page_size=3))
+    assert len(loaded.healing_medicine_biology) == 6
+    assert "economy_commerce_finance" in loaded._raw_sectors
+    assert loaded.get_sector_products("economy_commerce_finance")[0].name == "SmartAd Beacons"
+    assert "economy_commerce_finance" not in loaded._raw_sectors
+    assert len(loaded.get_all_products()) == 28
+    assert not loaded._raw_sectors
+    
+    eager = BleuBackbone.from_dict(data, lazy=False)
+    assert not eager._raw_sectors
+    assert eager.generate_summary_table() == report.generate_summary_table()
+    
+    # Products are slotted
+    try:
+        eager.education_justice[0].price = 1
+        assert False, "Should have raised AttributeError"
+    except AttributeError:
+        pass
+    
+    # Numeric strings from older report files are converted, as they were before
+    numeric_strings = json.loads(report.to_json())
+    numeric_strings["sectors"]["education_justice"][1]["roi_percent"] = "195"
+    numeric_strings["sectors"]["education_justice"][2]["overscale_billions"] = "1e3"
+    for lazy in (True, False):
+        coerced = BleuBackbone.from_dict(numeric_strings, lazy=lazy).education_justice
+        assert coerced[1].roi_percent == 195.0 and coerced[2].overscale_billions == 1000.0
+    
+    bad_number = json.loads(report.to_json())
+    bad_number["sectors"]["education_justice"][1]["roi_percent"] = "high"
+    missing_field = json.loads(report.to_json())
+    del missing_field["sectors"]["defense_military_security"][0]["signal"]
+    for bad in (bad_number, missing_field):
+        try:
+            BleuBackbone.from_dict(bad)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    
+    print("✓ Lazy loading tests passed")
+
+
+def test_diff_and_merge():
+    """Test report diffs and in-place merges"""
+    print("Testing diff and merge...")
+    
+    base = BleuBackbone()
+    other = BleuBackbone.from_dict(json.loads(base.to_json()))
+    assert base.diff(other)["summary"] == {"added": 0, "removed": 0, "changed": 0, "unchanged": 28}
+    assert other._raw_sectors  # Diffing a loaded report does not hydrate it
+    
+    other.education_justice[0].roi_percent = 240
+    other.add_product("healing_medicine_biology", Product("Cure Mist", "s", "u", 300.0, 10.0))
+    other.register_sector("space_mining", "🪐 Space Mining")
+    other.add_product("space_mining", Product("Astro Drill", "s", "u", 210.0, 900.0))
+    del other.economy_commerce_finance[0]
+    
+    changes = base.diff(other)
+    assert changes["sectors_added"] == ["space_mining"]
+    assert [p["name"] for p in changes["added"]["healing_medicine_biology"]] == ["Cure Mist"]
+    assert [p["name"] for p in changes["removed"]["economy_commerce_finance"]] == ["SmartAd Beacons"]
+    assert changes["changed"]["education_justice"] == [
+        {"name": "MetaCurriculum Pods", "fields": {"roi_percent": {"from": 231, "to": 240}}}
+    ]
+    assert changes["summary"] == {"added": 2, "removed": 1, "changed": 1, "unchanged": 26}
+    
+    try:
+        base.merge(other, strategy="error")
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "education_justice/MetaCurriculum Pods" in str(e)
+    assert base.report_metadata["total_products"] == 28
+    
+    ours = BleuBackbone.from_dict(base.to_dict())
+    assert ours.merge(other, strategy="ours") == {"added": 2, "changed": 0}
+    assert ours.education_justice[0].roi_percent == 231
+    
+    assert base.merge(other) == {"added": 2, "changed": 1}
+    assert base.education_justice[0].roi_percent == 240
+    assert base.sector_display_name("space_mining") == "🪐 Space Mining"
+    assert base.get_sector_products("economy_commerce_finance")[0].name == "SmartAd Beacons"
+    assert base.report_metadata["total_products"] == 30
+    assert base.report_metadata["audit_hash"] == base._compute_report_hash()
+    assert base.get_top_products_by_roi(1)[0].name == "Cure Mist"
+    
+    merged = base.diff(other)["summary"]
+    assert merged["removed"] == 1 and not merged["added"] and not merged["changed"]
+    
+    # A merge that only brings in an empty sector still refreshes the hash
+    sector_only = BleuBackbone()
+    sector_only.register_sector("deep_sea", "🌊 Deep Sea")
+    target = BleuBackbone()
+    assert target.merge(sector_only) == {"added": 0, "changed": 0}
+    assert "deep_sea" in target.sectors
+    assert target.report_metadata["sector_names"] == {"deep_sea": "🌊 Deep Sea"}
+    assert target.report_metadata["audit_hash"] == target._compute_report_hash()
+    reloaded = BleuBackbone.from_dict(target.to_dict())
+    assert reloaded.report_metadata["audit_hash"] == reloaded._compute_report_hash()
+    
+    print("✓ Diff and merge tests passed")
+
+
+def test_portfolio_optimizer():
+    """Test budgeted portfolio selection against brute force and its caches"""
+    print("Testing portfolio optimizer...")
+    
+    rnd = random.Random(3)
+    report = BleuBackbone(_skip_init=True)
+    rows = []
+    for i in range(12):
+        sector = report.sectors[i % 3]
+        product = Product(f"P{i}", "s", "u", rnd.uniform(100, 250), float(rnd.randrange(50, 500)))
+        report.add_product(sector, product)
+        rows.append((sector, product))
+    
+    def brute_force(budget, cap):
+        best = 0.0
+        for mask in range(1 << len(rows)):
+            chosen = [rows[i] for i in range(len(rows)) if mask >> i & 1]
+            counts = Counter(sector for sector, _ in chosen)
+            if sum(p.overscale_billions for _, p in chosen) <= budget and max(counts.values(), default=0) <= cap:
+                best = max(best, sum(p.overscale_billions * p.roi_percent / 100 for _, p in chosen))
+        return best
+    
+    for budget, cap in [(0, 4), (400, 4), (1000, 2), (1500, 1), (10000, 4)]:
+        exact = report.optimize_portfolio(budget, max_per_sector=cap, method="exact")
+        assert abs(exact["value"] - brute_force(budget, cap)) < 1e-6
+        assert exact["spent"] <= budget
+        greedy = report.optimize_portfolio(budget, max_per_sector=cap, method="greedy")
+        assert greedy["spent"] <= budget
+        assert greedy["value"] <= exact["value"] + 1e-6 <= greedy["upper_bound"] + 2e-6
+    
+    # Frontiers are memoized per set of caps and dropped when products change
+    cached = report._portfolio_cache[("frontier", report._portfolio_caps(2, None))]
+    report.optimize_portfolio(777, max_per_sector=2)
+    assert report._portfolio_cache[("frontier", report._portfolio_caps(2, None))] is cached
+    report.add_product(report.sectors[0], Product("Jackpot", "s", "u", 900.0, 10.0))
+    top = report.optimize_portfolio(10, max_per_sector=2)
+    assert [entry["product"].name for entry in top["products"]] == ["Jackpot"]
+    assert top["roi_percent"] == 900.0
+    
+    capped = report.optimize_portfolio(10, sector_caps={report.sectors[0]: 0})
+    assert capped["products"] == []
+    
+    default = BleuBackbone()
+    assert default.optimize_portfolio(1e9)["spent"] == default.report_metadata["total_overscale_billions"]
+    for kwargs in [{"budget": -1}, {"budget": 100, "method": "best"},
+                   {"budget": 100, "max_per_sector": -1}, {"budget": 100, "sector_caps": {"unknown": 1}}]:
+        try:
+            default.optimize_portfolio(**kwargs)
+            assert False, f"Should have rejected {kwargs}"
+        except ValueError:
+            pass
+    
+    print("✓ Portfolio optimizer tests passed")
+
+
+def _run_cli(*argv):
+    """Run the CLI in-process; returns (exit code, captured stdout)"""
+    output = io.StringIO()
+    saved_argv, sys.argv = sys.argv, ["bleu_backbone_cli.py", *argv]
+    try:
+        with contextlib.redirect_stdout(output):
+            code = bleu_backbone_cli.main()
+    finally:
+        sys.argv = saved_argv
+    return code, output.getvalue()
+
+
+def test_cli_import():
+    """Test that malformed CSV records are skipped one at a time"""
+    print("Testing CLI import...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "report.json")
+        assert _run_cli("create", "-o", path, "-f", "json")[0] == 0
+        source = os.path.join(tmpdir, "products.csv")
+        with open(source, 'w', encoding='utf-8') as f:
+            f.write("name,signal,use_case,roi_percent,overscale_billions\n"
+                    "Before,s,u,150,10\n"
+                    f"{'x' * 200000},s,u,150,10\n"
+                    "After,s,u,160,20\n"
+                    "Bad ROI,s,u,high,20\n"
+                    "Last,s,u,170,30\n")
+        
+        code, output = _run_cli("import", path, source, "-s", "education_justice")
+        assert code == 0 and "Imported 3 products" in output
+        assert "Skipped 2 invalid rows" in output and f"{source}:3: Malformed CSV row" in output
+        names = [p.name for p in BleuBackbone.load_from_file(path).education_justice]
+        assert names[-3:] == ["Before", "After", "Last"]
+        
+        code, output = _run_cli("import", path, source, "-s", "education_justice", "--strict")
+        assert code == 1 and f"{source}:3:" in output
+        
+        # A header the reader cannot parse aborts instead of importing nothing silently
+        with open(source, 'w', encoding='utf-8') as f:
+            f.write(f"{'x' * 200000}\nBefore,s,u,150,10\n")
+        code, output = _run_cli("import", path, source, "-s", "education_justice")
+        assert code == 1 and "Malformed CSV header" in output
+        assert len(BleuBackbone.load_from_file(path).education_justice) == len(names)
+    
+    print("✓ CLI import tests passed")
+
+
 def run_all_tests():
     """Run all tests"""
     print("=" * 100)
@@ -430,6 +965,17 @@ def run_all_tests():
         test_round_trip,
         test_summary_table,
         test_string_representation,
+        test_sector_registry,
+        test_rankings,
+        test_running_statistics,
+        test_analytics,
+        test_summary_pagination,
+        test_search,
+        test_batch_add,
+        test_lazy_loading,
+        test_diff_and_merge,
+        test_portfolio_optimizer,
+        test_cli_import,
     ]
     
     passed = 0
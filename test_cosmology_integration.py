@@ -4,14 +4,27 @@ Test suite for Biblical Cosmology and Investor Outreach Integration System.
 """
 
 import unittest
+import contextlib
+import hashlib
+import io
 import json
+import mmap
 import os
+import sys
+import tarfile
 import tempfile
+import zipfile
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest import mock
+import cosmology_cli
 from cosmology_integration import (
     BiblicalCosmologySystem,
     InvestorOutreachSystem,
-    IntegratedCodexSystem
+    IntegratedCodexSystem,
+    BUNDLE_MANIFEST,
+    DEPLOYMENT_MANIFEST,
+    _read_parse_cache
 )
 
 
@@ -91,6 +104,23 @@ class TestBiblicalCosmologySystem(unittest.TestCase):
         self.assertEqual(level["name"], "Yechidah")
         self.assertIn("ES0IL", level["device_mapping"])
     
+    def test_get_sefirah_lookups(self):
+        """Test sefirah lookup by key, name, translation, Hebrew and substring."""
+        for query in ["keter", "1_keter", "Keter (Crown)", "crown", "כתר", "KET"]:
+            self.assertEqual(self.system.get_sefirah(query)["name"], "Keter (Crown)")
+        self.assertEqual(self.system.get_sefirah("hod")["name"], "Hod (Splendor)")
+        self.assertEqual(self.system.get_sefirah("understand")["name"], "Binah (Understanding)")
+        self.assertIsNone(self.system.get_sefirah("unknown"))
+    
+    def test_get_soul_level_lookups(self):
+        """Test exact matches win over earlier substring matches."""
+        self.assertEqual(self.system.get_soul_level("neshamah")["name"], "Neshama")
+        self.assertEqual(self.system.get_soul_level("רוח")["name"], "Ruach")
+        self.assertEqual(self.system.get_soul_level("ach")["name"], "Ruach")
+        self.assertEqual(self.system.get_soul_level("")["name"], "Nefesh")
+        self.assertIsNone(self.system.get_soul_level("unknown"))
+        self.assertIsNone(BiblicalCosmologySystem("missing_codex.json").get_soul_level("nefesh"))
+    
     def test_get_device_mappings(self):
         """Test getting all device mappings."""
         mappings = self.system.get_device_mappings()
@@ -100,6 +130,24 @@ class TestBiblicalCosmologySystem(unittest.TestCase):
         self.assertIn("shamayim", mappings)
         self.assertIn("Nefesh", mappings)
     
+    def test_device_index(self):
+        """Test bidirectional device lookups, repeated names and section updates."""
+        self.assertEqual(self.system.devices_for("NEFESH"), ["SmartSuit + SmartWear"])
+        self.assertEqual(self.system.entities_for("smartdomes + smartcity substrate"), ["eretz"])
+        self.assertEqual(self.system.entities_for("EV0L Glass"), ["shamayim", "Vilon (Curtain)"])
+        self.assertEqual(self.system.devices_for("unknown"), [])
+        
+        system = BiblicalCosmologySystem("missing_codex.json")
+        system.update_section("three_realms", {"nefesh": {"device_mapping": "Realm Grid"}})
+        system.update_section("five_soul_levels", {"levels": {"1_nefesh": {"name": "Nefesh", "device_mapping": "SmartSuit"}}})
+        self.assertEqual(system.get_device_mappings(), {"nefesh": ["Realm Grid"], "Nefesh": ["SmartSuit"]})
+        self.assertEqual(system.devices_for("nefesh"), ["Realm Grid", "SmartSuit"])
+        self.assertEqual(system.get_system_status()["mapped_devices"], 2)
+        
+        system.update_section("three_realms", {})
+        self.assertEqual(system.entities_for("Realm Grid"), [])
+        self.assertEqual(system.get_system_status()["mapped_entities"], 1)
+    
     def test_get_health_stacks(self):
         """Test getting health stacks."""
         stacks = self.system.get_health_stacks()
@@ -141,6 +189,79 @@ class TestBiblicalCosmologySystem(unittest.TestCase):
         finally:
             if os.path.exists(temp_file):
                 os.remove(temp_file)
+    
+    def test_lazy_section_loading(self):
+        """Test that sections are parsed on first access and match a full parse."""
+        with open("biblical_cosmology_codex.json", 'r', encoding='utf-8') as f:
+            full = json.load(f)
+        # The first load parses the file in full and saves its parse cache
+        BiblicalCosmologySystem("biblical_cosmology_codex.json")
+        system = BiblicalCosmologySystem("biblical_cosmology_codex.json")
+        self.assertEqual(system.codex_data.parsed_sections, [])
+        self.assertEqual(list(system.codex_data), list(full))
+        
+        system.get_heaven_level(1)
+        self.assertEqual(system.codex_data.parsed_sections, ["seven_heavens"])
+        self.assertEqual(system._codex_dict(), full)
+        self.assertEqual(BiblicalCosmologySystem("biblical_cosmology_codex.json", lazy=False).codex_data, full)
+    
+    def test_parse_cache_invalidation(self):
+        """Test that parse caches are reused, re-stamped when touched and rebuilt when stale."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            codex_file = os.path.join(tmpdir, "codex.json")
+            cache_file = os.path.join(tmpdir, ".codex.json.cache")
+            with open(codex_file, 'w', encoding='utf-8') as f:
+                json.dump({"status": "OLD", "three_realms": {"eretz": {"name": "Earth [realm]"}}}, f)
+            self.assertEqual(BiblicalCosmologySystem(codex_file).get_realm("eretz")["name"], "Earth [realm]")
+            self.assertTrue(os.path.exists(cache_file))
+            
+            cached = BiblicalCosmologySystem(codex_file)
+            self.assertEqual(cached.codex_data.parsed_sections, [])
+            self.assertEqual(cached.get_realm("eretz")["name"], "Earth [realm]")
+            
+            # Touching the file keeps the cache, which is re-stamped with the new mtime
+            os.utime(codex_file, ns=(0, 0))
+            self.assertEqual(BiblicalCosmologySystem(codex_file).codex_data.parsed_sections, [])
+            
+            with open(codex_file, 'w', encoding='utf-8') as f:
+                json.dump({"three_realms": {}, "status": "NEW", "meta": {"note": "} {"}}, f)
+            system = BiblicalCosmologySystem(codex_file)
+            self.assertEqual(system.codex_data["status"], "NEW")
+            self.assertEqual(list(system.codex_data), ["three_realms", "status", "meta"])
+            
+            with open(cache_file, 'wb') as f:
+                f.write(b"corrupt")
+            self.assertEqual(BiblicalCosmologySystem(codex_file).codex_data["meta"], {"note": "} {"})
+            
+            with open(codex_file, 'w', encoding='utf-8') as f:
+                f.write("[1, 2]")
+            self.assertEqual(BiblicalCosmologySystem(codex_file).codex_data, [1, 2])
+    
+    def test_parse_cache_mapping_closed(self):
+        """Test that a mapped parse cache is closed once decoded and before it is re-stamped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            codex_file = os.path.join(tmpdir, "codex.json")
+            with open(codex_file, 'w', encoding='utf-8') as f:
+                json.dump({"status": "LIVE", "three_realms": {"eretz": {"name": "Earth"}}}, f)
+            BiblicalCosmologySystem(codex_file)
+            
+            mappings = []
+            real_mmap = mmap.mmap
+            def recording_mmap(*args, **kwargs):
+                mappings.append(real_mmap(*args, **kwargs))
+                return mappings[-1]
+            with mock.patch("mmap.mmap", recording_mmap):
+                lazy = BiblicalCosmologySystem(codex_file)
+                self.assertEqual(lazy.codex_data["status"], "LIVE")
+                self.assertFalse(mappings[-1].closed)
+                self.assertEqual(lazy.get_realm("eretz")["name"], "Earth")
+                self.assertTrue(mappings[-1].closed)
+                
+                os.utime(codex_file, ns=(0, 0))
+                touched = BiblicalCosmologySystem(codex_file)
+                self.assertTrue(mappings[-1].closed)
+                self.assertEqual(touched.get_realm("eretz")["name"], "Earth")
+            self.assertEqual(len(mappings), 2)
 
 
 # Constants for testing
@@ -156,6 +277,23 @@ class TestInvestorOutreachSystem(unittest.TestCase):
         """Set up test fixtures."""
         self.system = InvestorOutreachSystem("investor_outreach_system.json")
     
+    def test_parse_cache_follows_saves(self):
+        """Test that saving outreach data refreshes its parse cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            outreach_file = os.path.join(tmpdir, "outreach.json")
+            self.system.export_to_json(outreach_file)
+            system = InvestorOutreachSystem(outreach_file)
+            self.assertIsInstance(system.outreach_data, dict)
+            self.assertTrue(system.update_investor_stage("Sequoia", "TERM_SHEET"))
+            system.compact()
+            
+            cached = _read_parse_cache(outreach_file)
+            self.assertIsNotNone(cached)
+            order, load_section = cached
+            self.assertEqual({key: load_section(key) for key in order}, system.outreach_data)
+            reloaded = InvestorOutreachSystem(outreach_file)
+            self.assertEqual(reloaded.get_investor_by_name("Sequoia")["stage"], "TERM_SHEET")
+    
     def test_load_outreach(self):
         """Test that outreach data loads successfully."""
         self.assertIsNotNone(self.system.outreach_data)
@@ -183,6 +321,130 @@ class TestInvestorOutreachSystem(unittest.TestCase):
         self.assertIn("Sequoia", investor["name"])
         self.assertTrue(investor["qr_code_generated"])
     
+    def test_investor_name_index(self):
+        """Test exact, normalized, word and substring investor lookups."""
+        for query in ["Sequoia Capital", "sequoia", "SEQUOIA CAP"]:
+            self.assertEqual(self.system.get_investor_by_name(query)["name"], "Sequoia Capital")
+        for query in ["a16z", "andreessen horowitz a16z", "Horowitz (a1"]:
+            self.assertEqual(self.system.get_investor_by_name(query)["name"], "Andreessen Horowitz (a16z)")
+        self.assertEqual(self.system.get_investor_by_name("capital")["name"], "Sequoia Capital")
+        self.assertIsNone(self.system.get_investor_by_name("Unknown Fund"))
+        
+        # Investors added later are picked up by the index
+        self.system.outreach_data["target_investors"]["tier_1_mega_funds"].append({"name": "Bleu Ventures"})
+        try:
+            self.assertEqual(self.system.get_investor_by_name("bleu")["name"], "Bleu Ventures")
+        finally:
+            self.system.outreach_data["target_investors"]["tier_1_mega_funds"].pop()
+    
+    def test_investor_index_follows_replaced_tiers(self):
+        """Test that replacing target_investors with same-sized tiers rebuilds the name index."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            outreach_file = os.path.join(tmpdir, "outreach.json")
+            self.system.export_to_json(outreach_file)
+            system = InvestorOutreachSystem(outreach_file)
+            self.assertIsNotNone(system.get_investor_by_name("a16z"))
+            
+            def renamed(prefix):
+                return {tier: [{"name": f"{prefix} {i}"} for i in range(len(investors))]
+                        for tier, investors in system.outreach_data["target_investors"].items()}
+            
+            # A section assigned directly is noticed as well
+            system.outreach_data["target_investors"] = renamed("Fresh")
+            self.assertIsNone(system.get_investor_by_name("a16z"))
+            self.assertEqual(system.get_investor_by_name("Fresh 0")["name"], "Fresh 0")
+            
+            system.update_section("target_investors", renamed("Updated"))
+            self.assertIsNone(system.get_investor_by_name("Fresh 0"))
+            self.assertEqual(system.get_investor_by_name("Updated 0")["name"], "Updated 0")
+    
+    def test_bulk_update_stages(self):
+        """Test that bulk stage updates are logged together and compacted atomically."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            outreach_file = os.path.join(tmpdir, "outreach.json")
+            self.system.export_to_json(outreach_file)
+            os.chmod(outreach_file, 0o640)
+            system = InvestorOutreachSystem(outreach_file)
+            
+            saves = []
+            save = system._save_outreach
+            system._save_outreach = lambda: saves.append(save())
+            results = system.bulk_update_stages({"a16z": "TERM_SHEET", "Sequoia": "MEETING", "Nobody": "X"})
+            self.assertEqual(results, {"a16z": True, "Sequoia": True, "Nobody": False})
+            self.assertEqual(system.bulk_update_stages({"Nobody": "X"}), {"Nobody": False})
+            self.assertEqual(saves, [])
+            self.assertEqual(len(list(system.events.read())), 2)
+            
+            # Unsaved changes are replayed from the log, then folded into the snapshot
+            reloaded = InvestorOutreachSystem(outreach_file)
+            self.assertEqual(reloaded.get_investor_by_name("a16z")["stage"], "TERM_SHEET")
+            self.assertEqual(reloaded.get_investor_by_name("sequoia")["stage"], "MEETING")
+            system.compact()
+            self.assertEqual(len(saves), 1)
+            self.assertEqual(os.stat(outreach_file).st_mode & 0o777, 0o640)
+            self.assertEqual(sorted(os.listdir(tmpdir)), [
+                ".outreach.json.cache", "outreach.events.checkpoint", "outreach.events.jsonl", "outreach.json"])
+            
+            system.COMPACT_EVERY = 2
+            system.bulk_update_stages({"a16z": "CLOSED"})
+            self.assertEqual(len(saves), 1)
+            system.bulk_update_stages({"Sequoia": "CLOSED"})
+            self.assertEqual(len(saves), 2)
+            with open(os.path.join(tmpdir, "outreach.events.checkpoint"), encoding='utf-8') as f:
+                self.assertEqual(json.load(f), {"offset": system.events.size})
+            reloaded = InvestorOutreachSystem(outreach_file)
+            self.assertEqual(reloaded._pending_events, 0)
+            self.assertEqual(reloaded.get_investor_by_name("sequoia")["stage"], "CLOSED")
+            
+            # Log bookkeeping stays out of the snapshot and exports
+            with open(outreach_file, encoding='utf-8') as f:
+                self.assertEqual(set(json.load(f)), set(self.system.outreach_data))
+            exported = os.path.join(tmpdir, "export.json")
+            reloaded.export_to_json(exported)
+            with open(exported, encoding='utf-8') as f:
+                self.assertEqual(set(json.load(f)), set(self.system.outreach_data))
+    
+    def test_stage_change_queries(self):
+        """Test time-indexed stage change queries and replay past a torn log line."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            outreach_file = os.path.join(tmpdir, "outreach.json")
+            self.system.export_to_json(outreach_file)
+            system = InvestorOutreachSystem(outreach_file)
+            old_stage = system.get_investor_by_name("a16z")["stage"]
+            system.events.append([
+                {"investor": "Sequoia Capital", "old_stage": "INITIAL", "new_stage": "TERM_SHEET",
+                 "timestamp": "2020-01-01T00:00:00Z"},
+            ])
+            self.assertEqual(system.investors_moved_to("TERM_SHEET"), ["Sequoia Capital"])
+            
+            system.bulk_update_stages({"a16z": "TERM_SHEET"})
+            system.bulk_update_stages({"a16z": "MEETING"})
+            name = system.get_investor_by_name("a16z")["name"]
+            self.assertEqual(system.investors_moved_to("TERM_SHEET", since=timedelta(days=7)), [name])
+            self.assertEqual(system.investors_moved_to("TERM_SHEET"), ["Sequoia Capital", name])
+            self.assertEqual(system.investors_moved_to("CLOSED"), [])
+            changes = system.stage_changes(since=timedelta(days=7))
+            self.assertEqual([(c["old_stage"], c["new_stage"]) for c in changes],
+                             [(old_stage, "TERM_SHEET"), ("TERM_SHEET", "MEETING")])
+            self.assertEqual(len(system.stage_changes(until=datetime(2021, 1, 1))), 1)
+            
+            # Aware bounds are compared in UTC: 2020-01-01 01:00 at UTC+2 is 2019-12-31 23:00 UTC
+            plus_two = timezone(timedelta(hours=2))
+            self.assertEqual(len(system.stage_changes(until=datetime(2020, 1, 1, 1, tzinfo=plus_two))), 0)
+            self.assertEqual(len(system.stage_changes(since=datetime(2020, 1, 1, 1, tzinfo=plus_two))), 3)
+            self.assertEqual(len(system.stage_changes(since=datetime.now(timezone.utc) - timedelta(days=7))), 2)
+            
+            # Callers get copies, so editing a result leaves the index intact
+            system.stage_changes("TERM_SHEET")[0]["investor"] = "Edited"
+            self.assertEqual(system.investors_moved_to("TERM_SHEET"), ["Sequoia Capital", name])
+            
+            with open(system.events.log_file, 'a', encoding='utf-8') as f:
+                f.write('{"investor": "a16z", "new_st')
+            reloaded = InvestorOutreachSystem(outreach_file)
+            self.assertEqual(reloaded.get_investor_by_name("a16z")["stage"], "MEETING")
+            reloaded.bulk_update_stages({"a16z": "CLOSED"})
+            self.assertEqual(InvestorOutreachSystem(outreach_file).get_investor_by_name("a16z")["stage"], "CLOSED")
+    
     def test_get_pitch_deck_status(self):
         """Test getting pitch deck status."""
         pitch = self.system.get_pitch_deck_status()
@@ -305,6 +567,38 @@ class TestIntegratedCodexSystem(unittest.TestCase):
         self.assertIn("health_stacks", status["integration"])
         self.assertIn("cosmology_integration", status["integration"])
     
+    def test_status_cache(self):
+        """Test that the full status is rebuilt only after the underlying data changes."""
+        first = self.system.get_full_system_status()
+        first["outreach_system"]["status"] = "MUTATED"
+        second = self.system.get_full_system_status()
+        self.assertEqual(second["outreach_system"]["status"], self.system.outreach.outreach_data["status"])
+        self.assertEqual(second["cosmology_system"], first["cosmology_system"])
+        info = self.system.status_cache_info()
+        self.assertEqual((info["hits"], info["misses"]), (1, 1))
+        
+        self.system.outreach.update_section("checklist_status", "ON_HOLD")
+        self.assertEqual(self.system.get_full_system_status()["outreach_system"]["checklist_status"], "ON_HOLD")
+        self.system.cosmology.update_section("status", "MAINTENANCE")
+        self.assertEqual(self.system.get_full_system_status()["cosmology_system"]["status"], "MAINTENANCE")
+        self.system.get_full_system_status()
+        info = self.system.status_cache_info()
+        self.assertEqual((info["hits"], info["misses"]), (2, 3))
+        self.assertEqual(info["generations"], {"cosmology": self.system.cosmology.generation,
+                                               "outreach": self.system.outreach.generation})
+        
+        # Stage changes bump the outreach generation only when an investor matched
+        with tempfile.TemporaryDirectory() as temp_dir:
+            outreach_file = os.path.join(temp_dir, "outreach.json")
+            self.system.outreach.export_to_json(outreach_file)
+            system = IntegratedCodexSystem("biblical_cosmology_codex.json", outreach_file)
+            system.get_full_system_status()
+            system.outreach.bulk_update_stages({"Nobody": "X"})
+            system.get_full_system_status()
+            system.outreach.bulk_update_stages({"a16z": "TERM_SHEET"})
+            system.get_full_system_status()
+            self.assertEqual(system.status_cache_info()["misses"], 2)
+    
     def test_generate_aws_deployment_package(self):
         """Test AWS deployment package generation."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -334,6 +628,116 @@ class TestIntegratedCodexSystem(unittest.TestCase):
                 self.assertTrue(os.path.exists(filepath))
                 self.assertGreater(os.path.getsize(filepath), 0)
     
+    def test_deploy(self):
+        """Test that deploy serializes each dataset once and skips unchanged artifacts."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with self.assertRaises(ValueError):
+                self.system.deploy(["azure"], temp_dir)
+            reports = self.system.deploy(["aws", "github"], temp_dir)
+            self.assertEqual(len(reports), 7)
+            self.assertTrue(all(report["written"] for report in reports))
+            by_artifact = {(r["target"], r["artifact"]): r for r in reports}
+            cosmology = by_artifact["aws", "cosmology"]
+            self.assertEqual(by_artifact["github", "cosmology_json"]["sha256"], cosmology["sha256"])
+            self.assertEqual(by_artifact["github", "cosmology_json"]["serialize_ms"], 0.0)
+            
+            # Artifacts match the per-system exports byte for byte
+            exported = os.path.join(temp_dir, "export.yaml")
+            self.system.outreach.export_to_yaml(exported)
+            self.assertEqual(Path(exported).read_bytes(), Path(by_artifact["github", "outreach_yaml"]["path"]).read_bytes())
+            
+            again = self.system.deploy(["github"], temp_dir, max_workers=2)
+            self.assertFalse(any(report["written"] for report in again))
+            self.system.outreach.update_section("status", "PAUSED")
+            changed = {r["artifact"] for r in self.system.deploy(["github"], temp_dir) if r["written"]}
+            self.assertEqual(changed, {"outreach_yaml", "outreach_json"})
+    
+    def test_incremental_deploy(self):
+        """Test that the deployment manifest lets unchanged deploys skip serializing and writing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.system.deploy(["aws"], temp_dir)
+            self.system.deploy(["github"], temp_dir)
+            manifest_path = Path(temp_dir) / DEPLOYMENT_MANIFEST
+            with open(manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+            self.assertEqual(len(manifest["artifacts"]), 7)
+            status_entry = manifest["artifacts"]["aws_system_status.json"]
+            self.assertEqual(status_entry["sha256"], hashlib.sha256(
+                (Path(temp_dir) / "aws_system_status.json").read_bytes()).hexdigest())
+            
+            before = {name: os.stat(os.path.join(temp_dir, name)).st_mtime_ns for name in os.listdir(temp_dir)}
+            reports = self.system.deploy(["aws", "github"], temp_dir)
+            self.assertFalse(any(report["written"] or report["serialize_ms"] for report in reports))
+            after = {name: os.stat(os.path.join(temp_dir, name)).st_mtime_ns for name in os.listdir(temp_dir)}
+            self.assertEqual(before, after)
+            
+            # Edited artifacts and changed inputs are redeployed; --force re-renders everything
+            (Path(temp_dir) / "github_cosmology.json").write_text("{}")
+            self.system.cosmology.update_section("meta", {"version": "2"})
+            written = {r["artifact"] for r in self.system.deploy(["aws", "github"], temp_dir) if r["written"]}
+            self.assertEqual(written, {"cosmology", "cosmology_json", "cosmology_yaml"})
+            self.assertEqual(json.loads((Path(temp_dir) / "github_cosmology.json").read_text())["meta"], {"version": "2"})
+            
+            # The manifest can live outside the output directory, or be turned off
+            with tempfile.TemporaryDirectory() as other_dir:
+                outside = os.path.join(other_dir, "state.json")
+                out = os.path.join(other_dir, "out")
+                self.system.deploy(["aws"], out, manifest=outside)
+                self.assertTrue(os.path.exists(outside))
+                self.assertNotIn(DEPLOYMENT_MANIFEST, os.listdir(out))
+                self.assertFalse(any(r["written"] for r in self.system.deploy(["aws"], out, manifest=outside)))
+                untracked = os.path.join(other_dir, "untracked")
+                self.system.deploy(["github"], untracked, manifest=None)
+                self.assertEqual(len(os.listdir(untracked)), 4)
+            forced = self.system.deploy(["github"], temp_dir, force=True)
+            self.assertGreater(forced[0]["serialize_ms"], 0)
+            self.assertFalse(any(report["written"] for report in forced))
+    
+    def test_bundle(self):
+        """Test tar.gz and zip bundles match the loose artifacts and carry a checksummed manifest."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            loose = {Path(r["path"]).name: Path(r["path"]).read_bytes()
+                     for r in self.system.deploy(["aws", "github"], temp_dir)
+                     if r["artifact"] != "status"}
+            for name, level in [("bundle.tar.gz", 1), ("bundle.zip", 9)]:
+                path = os.path.join(temp_dir, name)
+                bundle = self.system.bundle(path, compression_level=level)
+                self.assertEqual(len(bundle["artifacts"]), 7)
+                if name.endswith(".zip"):
+                    with zipfile.ZipFile(path) as archive:
+                        members = {info.filename: archive.read(info) for info in archive.infolist()}
+                else:
+                    with tarfile.open(path) as archive:
+                        members = {info.name: archive.extractfile(info).read() for info in archive.getmembers()}
+                manifest = json.loads(members.pop(BUNDLE_MANIFEST))
+                self.assertNotIn(DEPLOYMENT_MANIFEST, members)
+                self.assertEqual(set(members), set(manifest["artifacts"]))
+                for member, content in members.items():
+                    self.assertEqual(manifest["artifacts"][member]["sha256"], hashlib.sha256(content).hexdigest())
+                    if member in loose:
+                        self.assertEqual(content, loose[member])
+            
+            for bad_path, level in [("bundle.rar", 6), ("bundle.zip", 10)]:
+                with self.assertRaises(ValueError):
+                    self.system.bundle(os.path.join(temp_dir, bad_path), compression_level=level)
+            self.assertNotIn("bundle.rar", os.listdir(temp_dir))
+            
+            # Members past the zip64 limit are written with zip64 headers
+            with mock.patch("zipfile.ZIP64_LIMIT", 1024):
+                path = os.path.join(temp_dir, "large.zip")
+                self.system.bundle(path)
+            with zipfile.ZipFile(path) as archive:
+                self.assertIsNone(archive.testzip())
+            
+            # The CLI rejects an unsupported suffix while parsing arguments
+            with mock.patch.object(sys, "argv", ["cosmology_cli.py", "integrated", "deploy", "--bundle", "out.rar"]), \
+                    mock.patch.object(cosmology_cli, "cmd_integrated_deploy") as deploy, \
+                    contextlib.redirect_stderr(io.StringIO()) as stderr:
+                with self.assertRaises(SystemExit):
+                    cosmology_cli.main()
+            deploy.assert_not_called()
+            self.assertIn("must end in .tar.gz, .tgz or .zip", stderr.getvalue())
+    
     def test_cosmology_access(self):
         """Test accessing cosmology through integrated system."""
         realm = self.system.cosmology.get_realm("shamayim")